@@ -0,0 +1,21 @@
+interface LoadMoreButtonProps {
+  hasMore: boolean;
+  loading: boolean;
+  onClick: () => void;
+}
+
+export default function LoadMoreButton({ hasMore, loading, onClick }: LoadMoreButtonProps) {
+  if (!hasMore) return null;
+
+  return (
+    <div className="text-center mt-6">
+      <button
+        onClick={onClick}
+        disabled={loading}
+        className="bg-secondary text-secondary-foreground px-4 py-2 rounded hover:opacity-90 disabled:opacity-50"
+      >
+        {loading ? 'Ładowanie...' : 'Załaduj więcej'}
+      </button>
+    </div>
+  );
+}
@@ -0,0 +1,46 @@
+import { useState, useEffect, useCallback } from 'react';
+import type { ApiResponse } from '@/types';
+
+type PageFetcher<T> = (cursor?: string) => Promise<ApiResponse<T[]>>;
+
+// Keyset-paginated listing: the first page on mount, the following ones on
+// demand through meta.next_cursor. reload() starts over from the first page.
+export function useCursorList<T>(fetchPage: PageFetcher<T>, errorMessage: string) {
+  const [items, setItems] = useState<T[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  const reload = useCallback(async () => {
+    try {
+      const response = await fetchPage();
+      setItems(response.data || []);
+      setNextCursor(response.meta?.next_cursor ?? null);
+    } catch (error) {
+      console.error(errorMessage, error);
+    } finally {
+      setLoading(false);
+    }
+  }, [fetchPage, errorMessage]);
+
+  const loadMore = useCallback(async () => {
+    if (!nextCursor) return;
+
+    setLoadingMore(true);
+    try {
+      const response = await fetchPage(nextCursor);
+      setItems(current => [...current, ...(response.data || [])]);
+      setNextCursor(response.meta?.next_cursor ?? null);
+    } catch (error) {
+      console.error(errorMessage, error);
+    } finally {
+      setLoadingMore(false);
+    }
+  }, [fetchPage, errorMessage, nextCursor]);
+
+  useEffect(() => {
+    reload();
+  }, [reload]);
+
+  return { items, loading, loadingMore, hasMore: nextCursor !== null, reload, loadMore };
+}
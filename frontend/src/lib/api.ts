@@ -8,9 +8,11 @@ import type {
   Court,
   CourtCreateData,
   CourtUpdateData,
+  CourtCalendar,
   Reservation,
   ReservationCreateData,
   ReservationUpdateData,
+  SystemStats,
 } from '@/types';
 
 // Auth API
@@ -43,8 +45,9 @@ export const authApi = {
 
 // Users API (Admin only)
 export const usersApi = {
-  getUsers: async (): Promise<ApiResponse<User[]>> => {
-    const response = await axiosInstance.get('/api/users/get/');
+  // One page, pass meta.next_cursor of the previous one for the next
+  getUsers: async (cursor?: string): Promise<ApiResponse<User[]>> => {
+    const response = await axiosInstance.get('/api/users/get/', { params: { cursor } });
     return response.data;
   },
 
@@ -71,8 +74,9 @@ export const usersApi = {
 
 // Courts API
 export const courtsApi = {
-  getCourts: async (): Promise<ApiResponse<Court[]>> => {
-    const response = await axiosInstance.get('/api/courts/get/');
+  // One page, pass meta.next_cursor of the previous one for the next
+  getCourts: async (cursor?: string): Promise<ApiResponse<Court[]>> => {
+    const response = await axiosInstance.get('/api/courts/get/', { params: { cursor } });
     return response.data;
   },
 
@@ -99,8 +103,9 @@ export const courtsApi = {
 
 // Reservations API
 export const reservationsApi = {
-  getReservations: async (): Promise<ApiResponse<Reservation[]>> => {
-    const response = await axiosInstance.get('/api/reservations/get/');
+  // One page, pass meta.next_cursor of the previous one for the next
+  getReservations: async (cursor?: string): Promise<ApiResponse<Reservation[]>> => {
+    const response = await axiosInstance.get('/api/reservations/get/', { params: { cursor } });
     return response.data;
   },
 
@@ -109,11 +114,23 @@ export const reservationsApi = {
     return response.data;
   },
 
-  getCourtReservations: async (courtId: string): Promise<ApiResponse<Reservation[]>> => {
-    const response = await axiosInstance.get(`/api/reservations/court/${courtId}/`);
+  getCourtReservations: async (
+    courtId: string,
+    dateFrom: string,
+    dateTo: string
+  ): Promise<ApiResponse<CourtCalendar>> => {
+    const response = await axiosInstance.get(`/api/reservations/court/${courtId}/`, {
+      params: { date_from: dateFrom, date_to: dateTo },
+    });
     return response.data;
   },
 
+  // Server-Sent Events stream, consumed with EventSource rather than axios
+  courtEventsUrl: (courtIds: string[]): string => {
+    const params = new URLSearchParams(courtIds.map(courtId => ['court_id', courtId]));
+    return `${import.meta.env.VITE_API_URL}/api/reservations/events/?${params}`;
+  },
+
   createReservation: async (data: ReservationCreateData): Promise<ApiResponse<Reservation>> => {
     const response = await axiosInstance.post('/api/reservations/create/', data);
     return response.data;
@@ -134,3 +151,11 @@ export const reservationsApi = {
     return response.data;
   },
 };
+
+// System API (Admin only)
+export const systemApi = {
+  getStats: async (): Promise<ApiResponse<SystemStats>> => {
+    const response = await axiosInstance.get('/api/system/stats/');
+    return response.data;
+  },
+};
@@ -10,6 +10,9 @@ const axiosInstance = axios.create({
   },
 });
 
+// Trades the refresh token cookie for a new access token cookie
+export const refreshSession = () => axios.post(`${API_URL}/auth/refresh/`, {}, { withCredentials: true });
+
 axiosInstance.interceptors.response.use(
   (response) => response,
   async (error) => {
@@ -17,7 +20,7 @@ axiosInstance.interceptors.response.use(
 
     if (error.response?.status === 401 && !originalRequest._retry) {
       originalRequest._retry = true;
-      const refreshResponse = await axios.post(`${API_URL}/auth/refresh/`, {}, { withCredentials: true });
+      const refreshResponse = await refreshSession();
       if (refreshResponse.status === 200) return axiosInstance(originalRequest);
     }
 
@@ -1,5 +1,5 @@
 import { useState, useEffect } from 'react';
-import { reservationsApi, courtsApi, usersApi } from '@/lib/api';
+import { systemApi } from '@/lib/api';
 
 export default function AdminDashboard() {
   const [stats, setStats] = useState({
@@ -16,26 +16,21 @@ export default function AdminDashboard() {
     loadStats();
   }, []);
 
+  // Counted by the database: the listings are paginated
   const loadStats = async () => {
     try {
-      const [reservationsRes, courtsRes, usersRes] = await Promise.all([
-        reservationsApi.getReservations(),
-        courtsApi.getCourts(),
-        usersApi.getUsers(),
-      ]);
-
-      const reservations = reservationsRes.data || [];
-      const courts = courtsRes.data || [];
-      const users = usersRes.data || [];
-
-      setStats({
-        totalReservations: reservations.length,
-        pendingReservations: reservations.filter(r => r.status === 'pending').length,
-        confirmedReservations: reservations.filter(r => r.status === 'confirmed').length,
-        totalCourts: courts.length,
-        activeCourts: courts.filter(c => c.is_active).length,
-        totalUsers: users.length,
-      });
+      const response = await systemApi.getStats();
+      const data = response.data;
+      if (data) {
+        setStats({
+          totalReservations: data.reservations.total,
+          pendingReservations: data.reservations.pending,
+          confirmedReservations: data.reservations.confirmed,
+          totalCourts: data.courts.total,
+          activeCourts: data.courts.active,
+          totalUsers: data.users.total,
+        });
+      }
     } catch (error) {
       console.error('Błąd ładowania statystyk:', error);
     } finally {
@@ -1,10 +1,18 @@
-import { useState, useEffect } from 'react';
+import { useState } from 'react';
 import { courtsApi } from '@/lib/api';
+import { useCursorList } from '@/hooks/useCursorList';
+import LoadMoreButton from '@/components/common/LoadMoreButton';
 import type { Court } from '@/types';
 
 export default function AdminCourtsPage() {
-  const [courts, setCourts] = useState<Court[]>([]);
-  const [loading, setLoading] = useState(true);
+  const {
+    items: courts,
+    loading,
+    loadingMore,
+    hasMore,
+    loadMore,
+    reload: loadCourts,
+  } = useCursorList(courtsApi.getCourts, 'Błąd ładowania kortów:');
   const [showForm, setShowForm] = useState(false);
   const [editingCourt, setEditingCourt] = useState<Court | null>(null);
 
@@ -20,23 +28,6 @@ export default function AdminCourtsPage() {
     price_per_hour: '0.00',
   });
 
-  useEffect(() => {
-    loadCourts();
-  }, []);
-
-  const loadCourts = async () => {
-    try {
-      const response = await courtsApi.getCourts();
-      if (response.data) {
-        setCourts(response.data);
-      }
-    } catch (error) {
-      console.error('Błąd ładowania kortów:', error);
-    } finally {
-      setLoading(false);
-    }
-  };
-
   const handleSubmit = async (e: React.FormEvent) => {
     e.preventDefault();
     
@@ -178,6 +169,8 @@ export default function AdminCourtsPage() {
           </div>
         ))}
       </div>
+
+      <LoadMoreButton hasMore={hasMore} loading={loadingMore} onClick={loadMore} />
     </div>
   );
 }
@@ -1,6 +1,7 @@
-import { useState, useEffect } from 'react';
+import { useState } from 'react';
 import { reservationsApi } from '@/lib/api';
-import type { Reservation } from '@/types';
+import { useCursorList } from '@/hooks/useCursorList';
+import LoadMoreButton from '@/components/common/LoadMoreButton';
 
 const STATUS_LABELS = {
   pending: 'Oczekująca',
@@ -9,27 +10,16 @@ const STATUS_LABELS = {
 };
 
 export default function AdminReservationsPage() {
-  const [reservations, setReservations] = useState<Reservation[]>([]);
-  const [loading, setLoading] = useState(true);
+  const {
+    items: reservations,
+    loading,
+    loadingMore,
+    hasMore,
+    loadMore,
+    reload: loadReservations,
+  } = useCursorList(reservationsApi.getReservations, 'Błąd ładowania rezerwacji:');
   const [filter, setFilter] = useState<'all' | 'pending' | 'confirmed' | 'canceled'>('all');
 
-  useEffect(() => {
-    loadReservations();
-  }, []);
-
-  const loadReservations = async () => {
-    try {
-      const response = await reservationsApi.getReservations();
-      if (response.data) {
-        setReservations(response.data);
-      }
-    } catch (error) {
-      console.error('Błąd ładowania rezerwacji:', error);
-    } finally {
-      setLoading(false);
-    }
-  };
-
   const handleConfirm = async (id: string) => {
     try {
       await reservationsApi.confirmReservation(id);
@@ -92,6 +82,8 @@ export default function AdminReservationsPage() {
           </div>
         ))}
       </div>
+
+      <LoadMoreButton hasMore={hasMore} loading={loadingMore} onClick={loadMore} />
     </div>
   );
 }
@@ -1,5 +1,7 @@
-import { useState, useEffect } from 'react';
+import { useState } from 'react';
 import { usersApi } from '@/lib/api';
+import { useCursorList } from '@/hooks/useCursorList';
+import LoadMoreButton from '@/components/common/LoadMoreButton';
 import type { User } from '@/types';
 
 interface UserFormData {
@@ -11,8 +13,14 @@ interface UserFormData {
 }
 
 export default function AdminUsersPage() {
-  const [users, setUsers] = useState<User[]>([]);
-  const [loading, setLoading] = useState(true);
+  const {
+    items: users,
+    loading,
+    loadingMore,
+    hasMore,
+    loadMore,
+    reload: loadUsers,
+  } = useCursorList(usersApi.getUsers, 'Błąd ładowania użytkowników:');
   const [showModal, setShowModal] = useState(false);
   const [editingUser, setEditingUser] = useState<User | null>(null);
   const [error, setError] = useState('');
@@ -24,23 +32,6 @@ export default function AdminUsersPage() {
     role: 'user',
   });
 
-  useEffect(() => {
-    loadUsers();
-  }, []);
-
-  const loadUsers = async () => {
-    try {
-      const response = await usersApi.getUsers();
-      if (response.data) {
-        setUsers(response.data);
-      }
-    } catch (error) {
-      console.error('Błąd ładowania użytkowników:', error);
-    } finally {
-      setLoading(false);
-    }
-  };
-
   const handleCreate = () => {
     setEditingUser(null);
     setFormData({
@@ -248,6 +239,8 @@ export default function AdminUsersPage() {
           </div>
         </div>
       )}
+
+      <LoadMoreButton hasMore={hasMore} loading={loadingMore} onClick={loadMore} />
     </div>
   );
 }
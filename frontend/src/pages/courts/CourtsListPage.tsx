@@ -1,7 +1,8 @@
-import { useState, useEffect } from 'react';
+import { useState } from 'react';
 import { Link } from 'react-router-dom';
 import { courtsApi } from '@/lib/api';
-import type { Court } from '@/types';
+import { useCursorList } from '@/hooks/useCursorList';
+import LoadMoreButton from '@/components/common/LoadMoreButton';
 
 const COURT_TYPE_LABELS = {
   indoor: 'Kryty',
@@ -15,28 +16,16 @@ const SURFACE_LABELS = {
 };
 
 export default function CourtsListPage() {
-  const [courts, setCourts] = useState<Court[]>([]);
-  const [loading, setLoading] = useState(true);
+  const {
+    items: allCourts,
+    loading,
+    loadingMore,
+    hasMore,
+    loadMore,
+  } = useCursorList(courtsApi.getCourts, 'Błąd ładowania kortów:');
+  const courts = allCourts.filter(c => c.is_active);
   const [filter, setFilter] = useState<'all' | 'indoor' | 'outdoor'>('all');
 
-  useEffect(() => {
-    loadCourts();
-  }, []);
-
-  const loadCourts = async () => {
-    try {
-      setLoading(true);
-      const response = await courtsApi.getCourts();
-      if (response.data) {
-        setCourts(response.data.filter(c => c.is_active));
-      }
-    } catch (error) {
-      console.error('Błąd ładowania kortów:', error);
-    } finally {
-      setLoading(false);
-    }
-  };
-
   const filteredCourts = filter === 'all' 
     ? courts 
     : courts.filter(c => c.court_type === filter);
@@ -108,6 +97,8 @@ export default function CourtsListPage() {
           ))}
         </div>
       )}
+
+      <LoadMoreButton hasMore={hasMore} loading={loadingMore} onClick={loadMore} />
     </div>
   );
 }
@@ -1,13 +1,29 @@
 import { useState, useEffect, type FormEvent } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import { courtsApi, reservationsApi } from '@/lib/api';
-import type { Court, Reservation } from '@/types';
+import { refreshSession } from '@/lib/axios';
+import type { Court, CourtCalendarEntry } from '@/types';
+
+const CALENDAR_EVENTS = [
+  'reservation.created',
+  'reservation.updated',
+  'reservation.confirmed',
+  'reservation.canceled',
+  'resync',
+];
+
+const MAX_STREAM_RECONNECTS = 3;
+
+const shiftDate = (date: string, days: number) => {
+  const [year, month, day] = date.split('-').map(Number);
+  return new Date(Date.UTC(year, month - 1, day + days)).toISOString().slice(0, 10);
+};
 
 export default function CreateReservationPage() {
   const { courtId } = useParams<{ courtId: string }>();
   const navigate = useNavigate();
   const [court, setCourt] = useState<Court | null>(null);
-  const [reservations, setReservations] = useState<Reservation[]>([]);
+  const [reservations, setReservations] = useState<CourtCalendarEntry[]>([]);
   const [loading, setLoading] = useState(true);
   const [submitting, setSubmitting] = useState(false);
   const [error, setError] = useState('');
@@ -22,6 +38,47 @@ export default function CreateReservationPage() {
     loadData();
   }, [courtId]);
 
+  useEffect(() => {
+    loadCalendar();
+  }, [courtId, selectedDate]);
+
+  // Refresh the calendar when a reservation on this court changes instead of polling
+  useEffect(() => {
+    if (!courtId || !selectedDate) return;
+
+    let source: EventSource;
+    let stopped = false;
+    let failures = 0;
+    const refresh = () => loadCalendar();
+
+    const connect = () => {
+      source = new EventSource(reservationsApi.courtEventsUrl([courtId]), { withCredentials: true });
+      source.onopen = () => { failures = 0; };
+      CALENDAR_EVENTS.forEach(type => source.addEventListener(type, refresh));
+
+      // The browser retries dropped connections itself but gives up on an error
+      // response, e.g. the 401 once the access token expires: refresh and reconnect
+      source.onerror = async () => {
+        if (source.readyState !== EventSource.CLOSED || ++failures > MAX_STREAM_RECONNECTS) return;
+        try {
+          await refreshSession();
+        } catch {
+          return;
+        }
+        if (stopped) return;
+        connect();
+        // Catch up on changes missed while disconnected
+        loadCalendar();
+      };
+    };
+
+    connect();
+    return () => {
+      stopped = true;
+      source.close();
+    };
+  }, [courtId, selectedDate]);
+
   const loadData = async () => {
     if (!courtId) {
       setError('Brak ID kortu');
@@ -42,12 +99,6 @@ export default function CreateReservationPage() {
         setLoading(false);
         return;
       }
-      
-      const reservationsResponse = await reservationsApi.getCourtReservations(courtId);
-      
-      if (reservationsResponse.data) {
-        setReservations(reservationsResponse.data);
-      }
     } catch (err: any) {
       setError(err.response?.data?.message || 'Nie udało się załadować danych');
     } finally {
@@ -55,6 +106,33 @@ export default function CreateReservationPage() {
     }
   };
 
+  const loadCalendar = async () => {
+    if (!courtId || !selectedDate) {
+      setReservations([]);
+      return;
+    }
+
+    try {
+      // Neighbouring days are included because the server groups by its own
+      // timezone; the page still filters by the local date below
+      const calendarResponse = await reservationsApi.getCourtReservations(
+        courtId,
+        shiftDate(selectedDate, -1),
+        shiftDate(selectedDate, 1)
+      );
+
+      if (calendarResponse.data) {
+        const entries = new Map<string, CourtCalendarEntry>();
+        Object.values(calendarResponse.data.days)
+          .flat()
+          .forEach(entry => entries.set(entry.id, entry));
+        setReservations(Array.from(entries.values()));
+      }
+    } catch (err: any) {
+      setError(err.response?.data?.message || 'Nie udało się załadować rezerwacji');
+    }
+  };
+
   const generateTimeSlots = () => {
     const slots = [];
     for (let hour = 6; hour < 23; hour++) {
@@ -1,6 +1,6 @@
-import { useState, useEffect } from 'react';
 import { reservationsApi } from '@/lib/api';
-import type { Reservation } from '@/types';
+import { useCursorList } from '@/hooks/useCursorList';
+import LoadMoreButton from '@/components/common/LoadMoreButton';
 
 const STATUS_LABELS = {
   pending: 'Oczekująca',
@@ -15,25 +15,14 @@ const STATUS_COLORS = {
 };
 
 export default function MyReservationsPage() {
-  const [reservations, setReservations] = useState<Reservation[]>([]);
-  const [loading, setLoading] = useState(true);
-
-  useEffect(() => {
-    loadReservations();
-  }, []);
-
-  const loadReservations = async () => {
-    try {
-      const response = await reservationsApi.getReservations();
-      if (response.data) {
-        setReservations(response.data);
-      }
-    } catch (error) {
-      console.error('Błąd ładowania rezerwacji:', error);
-    } finally {
-      setLoading(false);
-    }
-  };
+  const {
+    items: reservations,
+    loading,
+    loadingMore,
+    hasMore,
+    loadMore,
+    reload: loadReservations,
+  } = useCursorList(reservationsApi.getReservations, 'Błąd ładowania rezerwacji:');
 
   const handleCancel = async (id: string) => {
     if (!confirm('Czy na pewno chcesz anulować tę rezerwację?')) return;
@@ -93,6 +82,8 @@ export default function MyReservationsPage() {
           ))}
         </div>
       )}
+
+      <LoadMoreButton hasMore={hasMore} loading={loadingMore} onClick={loadMore} />
     </div>
   );
 }
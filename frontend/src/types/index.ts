@@ -93,6 +93,20 @@ export interface Reservation {
   updated_at: string;
 }
 
+export interface CourtCalendarEntry {
+  id: string;
+  status: 'pending' | 'confirmed';
+  start_at: string;
+  end_at: string;
+}
+
+export interface CourtCalendar {
+  court_id: string;
+  date_from: string;
+  date_to: string;
+  days: Record<string, CourtCalendarEntry[]>;
+}
+
 export interface ReservationCreateData {
   court_id: string;
   players_count: number;
@@ -109,8 +123,17 @@ export interface ReservationUpdateData {
 }
 
 // API Response Type
+export interface SystemStats {
+  reservations: { total: number; pending: number; confirmed: number };
+  courts: { total: number; active: number };
+  users: { total: number; active: number };
+}
+
 export interface ApiResponse<T = unknown> {
   success: boolean;
   message: string;
   data?: T;
+  meta?: {
+    next_cursor: string | null;
+  };
 }
@@ -1,6 +1,25 @@
+from functools import wraps
+from uuid import UUID
+
+from django.conf import settings
+from django.http import JsonResponse
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.auth_service.tokens import TOKEN_VERSION_CLAIM
+from apps.users.models import User
+from apps.users.services import UserService
 
 class CookieJWTAuth(JWTAuthentication):
+    """
+    JWT from the access_token cookie. The user comes from the process-local
+    user cache, reloaded when the token's version claim is newer than the
+    cached copy, or straight from the token claims with
+    AUTH_STATELESS_USERS, so authenticating costs no query once warm.
+    """
+
     def authenticate(self, request):
         raw_token = request.COOKIES.get("access_token")
 
@@ -9,4 +28,82 @@ class CookieJWTAuth(JWTAuthentication):
 
         validated_token = self.get_validated_token(raw_token)
         user = self.get_user(validated_token)
-        return user, validated_token
\ No newline at end of file
+        return user, validated_token
+
+    def get_user(self, validated_token):
+        user = self._user_from_claims(validated_token)
+        if user is None:
+            try:
+                user = UserService.get_cached_user(
+                    self._user_id(validated_token), validated_token.get(TOKEN_VERSION_CLAIM)
+                )
+            except User.DoesNotExist:
+                raise AuthenticationFailed("User not found", code="user_not_found")
+        return self._check_active(user)
+
+    async def aget_user(self, validated_token):
+        """get_user with the async ORM, validating the token needs no query"""
+        user = self._user_from_claims(validated_token)
+        if user is None:
+            try:
+                user = await UserService.aget_cached_user(
+                    self._user_id(validated_token), validated_token.get(TOKEN_VERSION_CLAIM)
+                )
+            except User.DoesNotExist:
+                raise AuthenticationFailed("User not found", code="user_not_found")
+        return self._check_active(user)
+
+    @staticmethod
+    def _user_id(validated_token) -> UUID:
+        try:
+            return UUID(str(validated_token[api_settings.USER_ID_CLAIM]))
+        except (KeyError, ValueError):
+            raise InvalidToken("Token contained no recognizable user identification")
+
+    def _user_from_claims(self, validated_token):
+        """Unsaved user built from the token in stateless mode, None otherwise"""
+        if not settings.AUTH_STATELESS_USERS or TOKEN_VERSION_CLAIM not in validated_token:
+            # Tokens issued before the claims existed still take the cache
+            return None
+        return User(
+            id=self._user_id(validated_token),
+            email=validated_token["email"],
+            role=validated_token["role"],
+            is_active=validated_token["is_active"],
+            token_version=validated_token[TOKEN_VERSION_CLAIM],
+        )
+
+    @staticmethod
+    def _check_active(user):
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        return user
+
+
+async def aauthenticate(request):
+    """
+    Cookie JWT authentication for plain Django async views, which DRF does not
+    serve. Returns the user or None.
+    """
+    raw_token = request.COOKIES.get("access_token")
+    if not raw_token:
+        return None
+
+    auth = CookieJWTAuth()
+    try:
+        return await auth.aget_user(auth.get_validated_token(raw_token))
+    except AuthenticationFailed:
+        return None
+
+
+def async_login_required(view):
+    """Answer 401 unless the cookie authenticates a user, who is set on request.user"""
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        user = await aauthenticate(request)
+        if user is None:
+            return JsonResponse({"message": "Authentication credentials were not provided."}, status=401)
+        request.user = user
+        return await view(request, *args, **kwargs)
+
+    return wrapper
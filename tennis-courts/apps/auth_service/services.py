@@ -1,6 +1,7 @@
 from django.contrib.auth import authenticate
 from rest_framework.exceptions import AuthenticationFailed
-from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.auth_service.tokens import UserRefreshToken
 
 
 def login_user(*, request, email: str, password: str):
@@ -12,7 +13,7 @@ def login_user(*, request, email: str, password: str):
     if not user.is_active:
         raise AuthenticationFailed('Account disabled.')
 
-    refresh = RefreshToken.for_user(user)
+    refresh = UserRefreshToken.for_user(user)
 
     return {
         "user": user,
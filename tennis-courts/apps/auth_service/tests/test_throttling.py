@@ -0,0 +1,45 @@
+from unittest import mock
+
+from django.conf import settings
+from django.test import TestCase, override_settings
+
+from apps.auth_service import throttling
+from apps.auth_service.throttling import LocalBuckets
+
+ATTEMPTS = 20
+BURST = 5
+
+
+# Attempts that get through hash a password, keep that cheap
+@override_settings(
+    AUTH_THROTTLE_IP_BURST=BURST,
+    AUTH_THROTTLE_IP_RATE=1,
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+)
+class LoginThrottleIdentTests(TestCase):
+    """The per-IP bucket is the only one credential stuffing with fresh emails runs into"""
+
+    def setUp(self):
+        patcher = mock.patch.object(throttling, "buckets", LocalBuckets(1000))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _login_attempts(self, **headers) -> list[int]:
+        return [
+            self.client.post(
+                "/auth/login/",
+                {"email": f"attacker{attempt}@example.com", "password": "wrong-password"},
+                content_type="application/json",
+                **{key: value.format(attempt=attempt) for key, value in headers.items()},
+            ).status_code
+            for attempt in range(ATTEMPTS)
+        ]
+
+    def test_spoofed_forwarded_for_is_still_throttled(self):
+        statuses = self._login_attempts(HTTP_X_FORWARDED_FOR="203.0.113.{attempt}")
+        self.assertEqual(statuses.count(429), ATTEMPTS - BURST)
+
+    @override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, "NUM_PROXIES": 1})
+    def test_forwarded_for_is_trusted_behind_a_configured_proxy(self):
+        statuses = self._login_attempts(HTTP_X_FORWARDED_FOR="203.0.113.{attempt}")
+        self.assertNotIn(429, statuses)
@@ -0,0 +1,135 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.throttling import BaseThrottle
+
+from apps.core.metrics import metrics
+
+
+class LocalBuckets:
+    """Token buckets in process memory, the least recently used dropped past ``maxsize``"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, rate: float, burst: int) -> float:
+        """Take a token, returning 0 or the seconds until one is available"""
+        now = time.time()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated_at) * rate)
+            wait = 0.0 if tokens >= 1 else (1 - tokens) / rate
+            self._buckets[key] = (tokens - 1 if not wait else tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+        return wait
+
+
+class CacheBuckets:
+    """
+    Token buckets in a Django cache shared by the workers. Read-modify-write
+    without a lock: concurrent attempts may both get the last token, which
+    is fine for shedding load.
+    """
+
+    def __init__(self, alias: str):
+        self.cache = caches[alias]
+
+    def take(self, key: str, rate: float, burst: int) -> float:
+        now = time.time()
+        tokens, updated_at = self.cache.get(f"throttle:{key}", (burst, now))
+        tokens = min(burst, tokens + (now - updated_at) * rate)
+        wait = 0.0 if tokens >= 1 else (1 - tokens) / rate
+        # Kept until the bucket would be full again
+        self.cache.set(f"throttle:{key}", (tokens - 1 if not wait else tokens, now), timeout=int(burst / rate) + 1)
+        return wait
+
+
+class ThrottleStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.allowed = {}
+        self.shed = {}
+
+        metrics.register("auth_throttle", self.stats)
+
+    def record(self, scope: str, shed_by: str = None) -> None:
+        with self._lock:
+            if shed_by is None:
+                self.allowed[scope] = self.allowed.get(scope, 0) + 1
+            else:
+                key = f"{scope}_by_{shed_by}"
+                self.shed[key] = self.shed.get(key, 0) + 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            allowed = sum(self.allowed.values())
+            shed = sum(self.shed.values())
+            return {
+                **{f"allowed_{scope}": count for scope, count in self.allowed.items()},
+                **{f"shed_{key}": count for key, count in self.shed.items()},
+                "shed_ratio": round(shed / (allowed + shed), 4) if allowed + shed else None,
+            }
+
+
+buckets = (
+    CacheBuckets(settings.AUTH_THROTTLE_CACHE)
+    if settings.AUTH_THROTTLE_CACHE
+    else LocalBuckets(settings.AUTH_THROTTLE_MAX_KEYS)
+)
+throttle_stats = ThrottleStats()
+
+
+class AuthThrottle(BaseThrottle):
+    """
+    Token buckets per client IP and, when ``by_email`` is set, per submitted
+    email. DRF checks throttles before the action runs, so a shed attempt
+    never reaches password hashing.
+    """
+
+    scope = None
+    by_email = False
+
+    def __init__(self):
+        self._wait = 0.0
+
+    def allow_request(self, request, view) -> bool:
+        keys = [("ip", self.get_ident(request), settings.AUTH_THROTTLE_IP_RATE, settings.AUTH_THROTTLE_IP_BURST)]
+        if self.by_email:
+            email = request.data.get("email") if hasattr(request.data, "get") else None
+            if isinstance(email, str) and email.strip():
+                keys.append(
+                    ("email", email.strip().lower(), settings.AUTH_THROTTLE_EMAIL_RATE, settings.AUTH_THROTTLE_EMAIL_BURST)
+                )
+
+        for kind, value, per_minute, burst in keys:
+            self._wait = buckets.take(f"{self.scope}:{kind}:{value}", per_minute / 60, burst)
+            if self._wait:
+                throttle_stats.record(self.scope, shed_by=kind)
+                return False
+
+        throttle_stats.record(self.scope)
+        return True
+
+    def wait(self) -> float:
+        return self._wait
+
+
+class LoginThrottle(AuthThrottle):
+    scope = "login"
+    by_email = True
+
+
+class RegisterThrottle(AuthThrottle):
+    scope = "register"
+    by_email = True
+
+
+class RefreshThrottle(AuthThrottle):
+    scope = "refresh"
@@ -0,0 +1,30 @@
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+TOKEN_VERSION_CLAIM = "ver"
+
+
+def user_claims(user) -> dict:
+    """Claims stateless authentication builds the user from"""
+    return {
+        TOKEN_VERSION_CLAIM: user.token_version,
+        "email": user.email,
+        "role": user.role,
+        "is_active": user.is_active,
+    }
+
+
+class UserRefreshToken(RefreshToken):
+    """Refresh token carrying the user claims, copied into its access tokens"""
+
+    @classmethod
+    def for_user(cls, user) -> "UserRefreshToken":
+        token = super().for_user(user)
+        token.payload.update(user_claims(user))
+        return token
+
+
+def refreshed_access_token(token: RefreshToken, user) -> AccessToken:
+    """Access token of ``token`` with the claims of the user as it is now"""
+    access = token.access_token
+    access.payload.update(user_claims(user))
+    return access
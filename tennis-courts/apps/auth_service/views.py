@@ -5,18 +5,33 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework.viewsets import ViewSet
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from .serializers import LoginSerializer
 from .services import login_user
+from .throttling import LoginThrottle, RefreshThrottle, RegisterThrottle
+from .tokens import refreshed_access_token
+from apps.core.conditional import conditional
 from apps.core.serializers import ApiResponseSerializer
 from ..core.responses import api_response
 from ..users.serializers import UserCreateSerializer, UserReadSerializer, UserUpdateSerializer
+from ..users.models import User
 from ..users.services import UserService
 
 
+def _profile(request):
+    # In stateless mode request.user only holds the token claims
+    return UserService.get_cached_user(request.user.id, request.user.token_version)
+
+
 class AuthView(ViewSet):
     permission_classes = []
+    action_throttles = {
+        "login": LoginThrottle,
+        "register": RegisterThrottle,
+        "refresh": RefreshThrottle,
+    }
 
     def get_permissions(self):
         if self.action in {"login", "register"}:
@@ -25,6 +40,10 @@ class AuthView(ViewSet):
             return [IsAuthenticated()]
         return [AllowAny()]
 
+    def get_throttles(self):
+        throttle = self.action_throttles.get(self.action)
+        return [throttle()] if throttle else []
+
     @extend_schema(
         request=UserCreateSerializer,
         responses={200: ApiResponseSerializer},
@@ -87,8 +106,9 @@ class AuthView(ViewSet):
         summary="Get my info",
     )
     @action(detail=False, methods=["get"], url_path="me")
+    @conditional(lambda request: tuple(UserReadSerializer(_profile(request)).data.values()))
     def me(self, request):
-        return api_response(data=UserReadSerializer(request.user).data, message="ok", status_code=status.HTTP_200_OK)
+        return api_response(data=UserReadSerializer(_profile(request)).data, message="ok", status_code=status.HTTP_200_OK)
 
     @extend_schema(
         request=UserUpdateSerializer,
@@ -140,7 +160,16 @@ class AuthView(ViewSet):
         except ExpiredSignatureError:
             return Response({"detail": "Token expired"}, status=status.HTTP_401_UNAUTHORIZED)
 
-        new_access_token = token.access_token
+        # The one place a token meets the database again: deactivated users
+        # stop here and the new access token carries the current claims
+        try:
+            user = UserService.get_user(user_id=token[api_settings.USER_ID_CLAIM])
+        except User.DoesNotExist:
+            return Response({"detail": "User not found"}, status=status.HTTP_401_UNAUTHORIZED)
+        if not user.is_active:
+            return Response({"detail": "Account disabled."}, status=status.HTTP_401_UNAUTHORIZED)
+
+        new_access_token = refreshed_access_token(token, user)
         new_refresh_token = token
 
         response = api_response(message="ok")
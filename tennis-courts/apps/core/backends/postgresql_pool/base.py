@@ -0,0 +1,55 @@
+import threading
+
+from django.db.backends.base.base import NO_DB_ALIAS
+from django.db.backends.postgresql import base as postgresql
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+
+from apps.core.backends.postgresql_pool.pool import ConnectionPool
+
+
+class DatabaseWrapper(postgresql.DatabaseWrapper):
+    """
+    psycopg2 backend borrowing its connections from a per-process pool.
+
+    Django still opens and closes the connection around every request
+    (keep ``CONN_MAX_AGE`` at 0); closing hands it back to the pool instead
+    of tearing it down. Pool options live under the ``POOL`` key of the
+    database settings: MIN_SIZE, MAX_SIZE, TIMEOUT, CHECK_INTERVAL, MAX_IDLE
+    and MAX_LIFETIME.
+    """
+
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+    def get_new_connection(self, conn_params):
+        if self.alias == NO_DB_ALIAS:
+            return super().get_new_connection(conn_params)
+
+        conn = self.connection_pool(conn_params).getconn(
+            lambda: super(DatabaseWrapper, self).get_new_connection(conn_params)
+        )
+        # Set by the parent class on connections it opens, reused ones need it too
+        self.isolation_level = IsolationLevel(
+            self.settings_dict["OPTIONS"].get("isolation_level", IsolationLevel.READ_COMMITTED)
+        )
+        return conn
+
+    def connection_pool(self, conn_params) -> ConnectionPool:
+        # Keyed by target too, tests switch the alias to the test database
+        key = (self.alias, conn_params.get("host"), conn_params.get("port"), conn_params.get("database"))
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                options = {name.lower(): value for name, value in self.settings_dict.get("POOL", {}).items()}
+                pool = self._pools[key] = ConnectionPool(self.alias, **options)
+        return pool
+
+    def _close(self):
+        if self.connection is None or self.alias == NO_DB_ALIAS:
+            return super()._close()
+
+        with self.wrap_database_errors:
+            params = self.get_connection_params()
+            self.connection_pool(params).putconn(self.connection)
+            # Borrowed by another thread from now on, even if closed inside an atomic block
+            self.connection = None
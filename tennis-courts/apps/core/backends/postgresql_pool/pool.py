@@ -0,0 +1,189 @@
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+import psycopg2
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+
+from apps.core.metrics import metrics
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of psycopg2 connections shared by the worker's threads.
+
+    Connections are opened on demand up to ``max_size``; a borrower finding
+    the pool exhausted waits at most ``timeout`` seconds before getting an
+    OperationalError. Returned connections are rolled back if needed and
+    kept idle, the most recently used one is handed out first. A connection
+    idle for more than ``check_interval`` seconds is probed with ``SELECT 1``
+    before reuse, idle ones beyond ``min_size`` are closed after ``max_idle``
+    seconds and every connection is replaced after ``max_lifetime``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        min_size: int = 2,
+        max_size: int = 10,
+        timeout: float = 5,
+        check_interval: float = 30,
+        max_idle: float = 300,
+        max_lifetime: float = 1800,
+    ):
+        self.name = name
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.check_interval = check_interval
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+
+        self._idle = deque()
+        self._queue = deque()
+        self._opened_at = {}
+        self._size = 0
+        self._cond = threading.Condition()
+
+        self.waiting = 0
+        self.borrowed = 0
+        self.opened = 0
+        self.discarded = 0
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+        metrics.register(f"db_pool.{name}", self.stats)
+
+    def getconn(self, connect: Callable[[], object]):
+        """Borrow a healthy connection, opening one with ``connect`` if there is room"""
+        while True:
+            idle = self._checkout()
+            if idle is None:
+                return self._open(connect)
+            conn, returned_at = idle
+            if self._usable(conn, returned_at):
+                return conn
+            self._discard(conn)
+
+    def putconn(self, conn) -> None:
+        """Give a connection back, discarding it if it is broken or too old"""
+        now = time.monotonic()
+        if conn.closed or now - self._opened_at.get(conn, now) > self.max_lifetime:
+            self._discard(conn)
+            return
+        if conn.info.transaction_status != TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+                if conn.info.transaction_status != TRANSACTION_STATUS_IDLE:
+                    # rollback() is a no-op in autocommit mode, a raw BEGIN still needs one
+                    with conn.cursor() as cursor:
+                        cursor.execute("ROLLBACK")
+            except psycopg2.Error:
+                self._discard(conn)
+                return
+
+        with self._cond:
+            self._idle.append((conn, now))
+            expired = []
+            while self._size - len(expired) > self.min_size and now - self._idle[0][1] > self.max_idle:
+                expired.append(self._idle.popleft()[0])
+            self._cond.notify_all()
+        for stale in expired:
+            self._discard(stale)
+
+    def close(self) -> None:
+        with self._cond:
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+        for conn in idle:
+            self._discard(conn)
+
+    def _checkout(self):
+        """An idle (connection, returned_at) pair, or None once a slot for a new one is reserved"""
+        started = time.monotonic()
+        deadline = started + self.timeout
+        turn = object()
+        with self._cond:
+            # First come, first served: a thread returning a connection and
+            # asking again right away must not starve the ones already waiting
+            self._queue.append(turn)
+            try:
+                while self._queue[0] is not turn or (not self._idle and self._size >= self.max_size):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.timeouts += 1
+                        raise psycopg2.OperationalError(
+                            f"Connection pool {self.name} exhausted: {self.max_size} connections "
+                            f"in use for {self.timeout}s"
+                        )
+                    self.waiting += 1
+                    self._cond.wait(remaining)
+                    self.waiting -= 1
+            finally:
+                self._queue.remove(turn)
+                self._cond.notify_all()
+
+            waited = time.monotonic() - started
+            self.borrowed += 1
+            self.wait_time_total += waited
+            self.wait_time_max = max(self.wait_time_max, waited)
+
+            if self._idle:
+                return self._idle.pop()
+            self._size += 1
+            return None
+
+    def _open(self, connect):
+        try:
+            conn = connect()
+        except BaseException:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify_all()
+            raise
+        with self._cond:
+            self._opened_at[conn] = time.monotonic()
+            self.opened += 1
+        return conn
+
+    def _usable(self, conn, returned_at: float) -> bool:
+        if conn.closed:
+            return False
+        if time.monotonic() - returned_at < self.check_interval:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        except psycopg2.Error:
+            return False
+        return True
+
+    def _discard(self, conn) -> None:
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
+        with self._cond:
+            self._opened_at.pop(conn, None)
+            self._size -= 1
+            self.discarded += 1
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "size": self._size,
+                "in_use": self._size - len(self._idle),
+                "idle": len(self._idle),
+                "waiting": self.waiting,
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "borrowed": self.borrowed,
+                "opened": self.opened,
+                "discarded": self.discarded,
+                "timeouts": self.timeouts,
+                "wait_ms_total": round(self.wait_time_total * 1e3, 3),
+                "wait_ms_max": round(self.wait_time_max * 1e3, 3),
+            }
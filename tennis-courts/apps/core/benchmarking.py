@@ -0,0 +1,143 @@
+import random
+import uuid
+from datetime import timedelta
+
+from django.utils import timezone
+
+from apps.core.sparse import sparse_rows
+from apps.courts.models import Court, CourtPrice
+from apps.courts.serializers import CourtReadSerializer, court_rows
+from apps.courts.services import CourtService
+from apps.reservations.models import Reservation
+from apps.reservations.serializers import MAX_SERIES_OCCURRENCES, ReservationReadSerializer, reservation_rows
+from apps.reservations.services import ReservationService
+from apps.reservations.views import calendar_data
+from apps.users.models import User
+from apps.users.serializers import UserReadSerializer
+from apps.users.services import UserService
+
+BATCH_SIZE = 10_000
+SLOT_STEP = timedelta(minutes=90)
+SLOT_LENGTH = timedelta(hours=1)
+QUERY_COUNT_SIZES = (1, 10, 100)
+
+
+def seed_benchmark(size: int, courts_count: int, users_count: int = 1, rng: random.Random = None,
+                   canceled_ratio: float = 0.1):
+    """
+    Bulk insert a synthetic dataset: ``size`` one-hour reservations spread
+    round-robin over ``courts_count`` courts, back to back every 90 minutes.
+    Meant to be called inside a transaction that is rolled back afterwards.
+    """
+    rng = rng or random.Random(42)
+    now = timezone.now()
+
+    users = [
+        User.objects.create(id=uuid.uuid4(), email=f"bench-{uuid.uuid4()}@example.com")
+        for _ in range(users_count)
+    ]
+    courts = []
+    for i in range(courts_count):
+        court = Court.objects.create(
+            name=f"Bench court {i}",
+            court_type=rng.choice(Court.CourtType.values),
+            surface=rng.choice(Court.CourtSurface.values),
+            max_players=4,
+            city="Bench",
+            street=f"Bench {i}",
+            postal_code="00-000",
+        )
+        CourtPrice.objects.create(court=court, price_per_hour=rng.choice([40, 60, 80, 100]))
+        courts.append(court)
+
+    active = {court.id: [] for court in courts}
+    batch = []
+    for i in range(size):
+        court = courts[i % courts_count]
+        start_at = now + SLOT_STEP * (i // courts_count)
+        status = (
+            Reservation.ReservationStatus.CANCELED
+            if rng.random() < canceled_ratio
+            else rng.choice([Reservation.ReservationStatus.PENDING, Reservation.ReservationStatus.CONFIRMED])
+        )
+        reservation = Reservation(
+            id=uuid.uuid4(),
+            court=court,
+            user=users[i % users_count],
+            players_count=2,
+            status=status,
+            total_amount=80,
+            start_at=start_at,
+            end_at=start_at + SLOT_LENGTH,
+        )
+        batch.append(reservation)
+        if status != Reservation.ReservationStatus.CANCELED:
+            active[court.id].append((reservation.id, reservation.start_at, reservation.end_at))
+
+        if len(batch) == BATCH_SIZE:
+            Reservation.objects.bulk_create(batch)
+            batch = []
+
+    if batch:
+        Reservation.objects.bulk_create(batch)
+
+    return users, courts, active
+
+
+def read_paths(size: int) -> dict:
+    """
+    Read paths over ``size`` freshly seeded rows, each with its own court
+    and user where it has any, for the query count checks: each must run
+    the same number of queries whatever ``size`` is.
+    """
+    seed_benchmark(size, size, users_count=size, rng=random.Random(42))
+    _, (court,), _ = seed_benchmark(size, 1, rng=random.Random(42), canceled_ratio=0)
+    users, (series_court,), _ = seed_benchmark(0, 1)
+    today = timezone.localdate()
+    start_at = timezone.now().replace(microsecond=0) + timedelta(days=1)
+    occurrences = min(size, MAX_SERIES_OCCURRENCES)
+
+    def reservation_page():
+        reservations, _ = ReservationService.get_reservations(limit=size)
+        return reservation_rows.serialize(reservations)
+
+    def sparse_reservation_page():
+        rows = sparse_rows(reservation_rows, {"fields": "id,start_at,court.prices", "expand": "user"})
+        reservations, _ = ReservationService.get_reservations(limit=size, rows=rows)
+        return rows.serialize(reservations)
+
+    def court_page():
+        courts, _ = CourtService.get_courts(limit=size)
+        return court_rows.serialize(courts)
+
+    def user_page():
+        users_page, _ = UserService.get_users(limit=size)
+        return UserReadSerializer(users_page, many=True).data
+
+    def series():
+        result = ReservationService.create_reservation_series(users[0].id, {
+            "court_id": series_court.id,
+            "players_count": 2,
+            "start_at": start_at,
+            "end_at": start_at + timedelta(hours=1),
+            "frequency": "weekly",
+            "until": (start_at + timedelta(weeks=occurrences - 1)).date(),
+            "skip_dates": [],
+        })
+        return ReservationReadSerializer(result["reservations"], many=True).data
+
+    return {
+        "reservation listing": reservation_page,
+        "sparse reservations": sparse_reservation_page,
+        "court listing": court_page,
+        "user listing": user_page,
+        "court reservations": lambda: ReservationReadSerializer(
+            ReservationService.get_court_reservations(court.id), many=True
+        ).data,
+        "court calendar": lambda: calendar_data(
+            court.id, today, today + timedelta(days=7),
+            ReservationService.get_court_calendar(court.id, today, today + timedelta(days=7)),
+        ),
+        "court detail": lambda: CourtReadSerializer(CourtService.get_court(court.id)).data,
+        "reservation series": series,
+    }
@@ -0,0 +1,56 @@
+import hashlib
+from functools import wraps
+from typing import Callable, Optional
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def make_etag(request, version) -> str:
+    # The full path keeps pages and windows of the same resource apart
+    digest = hashlib.sha1(f"{request.get_full_path()}|{version!r}".encode()).hexdigest()
+    return quote_etag(digest[:20])
+
+
+def conditional(validator: Callable[..., Optional[object]]):
+    """
+    Conditional GET for a ViewSet action.
+
+    ``validator(request, **kwargs)`` returns a cheap version of what the
+    action would render, usually one aggregate query over ``updated_at``
+    columns, or None to skip the check. When the request's If-None-Match
+    carries the matching ETag the action is not called at all and an empty
+    304 goes back; otherwise the 200 response gets the ETag.
+
+    Apply it under ``@action`` so the router still sees the action.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(view, request, *args, **kwargs):
+            try:
+                version = validator(request, **kwargs)
+            except (ValueError, DjangoValidationError):
+                # Malformed ids and parameters are reported by the action itself
+                version = None
+            if version is None:
+                return func(view, request, *args, **kwargs)
+
+            etag = make_etag(request, version)
+            if etag in parse_etags(request.headers.get("If-None-Match", "")):
+                response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            else:
+                response = func(view, request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+
+            response["ETag"] = etag
+            # Browsers keep the body but revalidate every time, which is
+            # what turns repeated reads into 304s
+            response["Cache-Control"] = "private, no-cache"
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,64 @@
+from typing import Sequence
+
+from django.db import connections
+from django.db.models import DecimalField, Func, Model, QuerySet
+from django.db.models.sql import UpdateQuery
+
+
+class Epoch(Func):
+    """Seconds in an interval, e.g. ``Epoch(F("end_at") - F("start_at"))``"""
+    template = 'EXTRACT(EPOCH FROM %(expressions)s)'
+    output_field = DecimalField()
+
+
+def update_returning(queryset: QuerySet, values: dict, returning: Sequence[str] = None) -> list[Model]:
+    """
+    Run ``queryset.update(**values)`` as a single ``UPDATE ... RETURNING``
+    statement and return the updated rows as model instances.
+
+    Only the ``returning`` fields are loaded on the instances, the others are
+    deferred; without ``returning`` every concrete field is loaded. ``values`` accepts the same expressions as ``QuerySet.update``,
+    and like ``update`` this bypasses ``save()``, so ``auto_now`` fields must
+    be passed explicitly.
+    """
+    model = queryset.model
+    connection = connections[queryset.db]
+    # from_db expects the loaded values in concrete field order
+    if returning is None:
+        fields = list(model._meta.concrete_fields)
+    else:
+        names = {model._meta.get_field(name).attname for name in returning}
+        fields = [field for field in model._meta.concrete_fields if field.attname in names]
+
+    query = queryset.query.chain(UpdateQuery)
+    query.add_update_values(values)
+    compiler = query.get_compiler(queryset.db)
+    # Rewrites filters across joins into a pk subquery, as execute_sql would
+    compiler.pre_sql_setup()
+    sql, params = compiler.as_sql()
+    if not sql:
+        return []
+
+    columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+    sql = f"{sql} RETURNING {columns}"
+
+    converters = []
+    for field in fields:
+        column = field.get_col(model._meta.db_table)
+        converters.append(
+            (column, connection.ops.get_db_converters(column) + column.get_db_converters(connection))
+        )
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    instances = []
+    for row in rows:
+        row = list(row)
+        for position, (column, field_converters) in enumerate(converters):
+            for converter in field_converters:
+                row[position] = converter(row[position], column, connection)
+        instances.append(model.from_db(queryset.db, [field.attname for field in fields], row))
+
+    return instances
@@ -0,0 +1,105 @@
+from functools import lru_cache
+from typing import Iterable
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, Prefetch, QuerySet, prefetch_related_objects
+from rest_framework import serializers
+
+
+class EagerPlan:
+    """
+    The select_related, prefetch_related and only() a serializer needs,
+    derived from its fields so a nested field added later is loaded with
+    the rows instead of one query per row.
+
+    Forward foreign keys and one-to-ones rendered by a nested serializer are
+    joined, reverse foreign keys and many-to-manys are prefetched with
+    querysets planned the same way. only() keeps the columns the fields
+    read; a level with a field the planner cannot trace (a method field, a
+    property, a dotted source) loads all its columns instead.
+    """
+
+    def __init__(self, serializer: serializers.BaseSerializer, model: type[Model]):
+        self.model = model
+        self.select = []
+        self.prefetch = []
+        self.only = []
+        self._restricted = self._walk(serializer, model, "")
+
+    def apply(self, queryset: QuerySet, *extra: str) -> QuerySet:
+        """``extra`` columns are loaded too, e.g. the ordering a keyset cursor is built from"""
+        if self.select:
+            queryset = queryset.select_related(*self.select)
+        if self.prefetch:
+            queryset = queryset.prefetch_related(*self.prefetch)
+        if self._restricted:
+            queryset = queryset.only(*self.only, *extra)
+        return queryset
+
+    def prefetch_into(self, instances: Iterable[Model]) -> None:
+        """Prefetch onto instances loaded elsewhere, their joined relations must already be set"""
+        prefetch_related_objects(list(instances), *self.prefetch)
+
+    def _walk(self, serializer: serializers.BaseSerializer, model: type[Model], prefix: str) -> bool:
+        """Plan the fields of one level, False when all its columns have to be loaded"""
+        restricted = True
+        for field in serializer.fields.values():
+            if field.write_only:
+                continue
+            model_field = self._model_field(field, model)
+            if model_field is None:
+                restricted = False
+                continue
+
+            path = prefix + model_field.name
+            if not model_field.is_relation or isinstance(field, serializers.PrimaryKeyRelatedField):
+                # A primary key related field reads the foreign key column only
+                self.only.append(path)
+            elif model_field.one_to_many or model_field.many_to_many:
+                self.prefetch.append(Prefetch(path, queryset=self._related_queryset(field, model_field)))
+            else:
+                self.select.append(path)
+                self.only.append(path)
+                nested = isinstance(field, serializers.BaseSerializer)
+                # A related field rendering the object itself, e.g. StringRelatedField, needs all its columns
+                if not nested or not self._walk(field, model_field.related_model, f"{path}__"):
+                    # Listing none of the relation's columns loads all of them
+                    self.only[:] = [name for name in self.only if not name.startswith(f"{path}__")]
+        return restricted
+
+    @staticmethod
+    def _model_field(field: serializers.Field, model: type[Model]):
+        if field.source == "*" or "." in field.source:
+            return None
+        try:
+            return model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            return None
+
+    @staticmethod
+    def _related_queryset(field: serializers.Field, model_field) -> QuerySet:
+        related_model = model_field.related_model
+        queryset = related_model._default_manager.all()
+        # The prefetch groups the rows by their foreign key back to the parent
+        back = [model_field.field.name] if model_field.one_to_many else []
+        if isinstance(field, serializers.ManyRelatedField):
+            if isinstance(field.child_relation, serializers.PrimaryKeyRelatedField):
+                return queryset.only(related_model._meta.pk.name, *back)
+            return queryset
+
+        child = field.child if isinstance(field, serializers.ListSerializer) else None
+        if not isinstance(child, serializers.BaseSerializer):
+            return queryset
+
+        return EagerPlan(child, related_model).apply(queryset, *back)
+
+
+# Bounded, sparse fieldsets derive serializer classes from query parameters
+@lru_cache(maxsize=1024)
+def eager_plan(serializer_class: type[serializers.ModelSerializer]) -> EagerPlan:
+    return EagerPlan(serializer_class(), serializer_class.Meta.model)
+
+
+def eager(queryset: QuerySet, serializer_class: type[serializers.ModelSerializer], *extra: str) -> QuerySet:
+    """``queryset`` loading everything ``serializer_class`` renders, see EagerPlan"""
+    return eager_plan(serializer_class).apply(queryset, *extra)
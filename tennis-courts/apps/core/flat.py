@@ -0,0 +1,288 @@
+import decimal
+from datetime import timezone as dt_timezone
+from typing import Iterable
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import QuerySet
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+
+class FlatSerializer:
+    """
+    Read-only twin of a ModelSerializer for list endpoints.
+
+    The serializer's fields are walked once and compiled into a row function
+    that builds the representation straight from ``values_list`` tuples,
+    without model instances or DRF field objects per row. Nested
+    serializers on a foreign key become joined columns, nested lists on a
+    reverse foreign key (or a list of its primary keys) one extra query per
+    page. Rows pointing at the same
+    related row share its rendered dict. The output is the same as the
+    serializer's, field types the compiler does not know raise
+    ImproperlyConfigured instead of rendering differently.
+    """
+
+    def __init__(self, serializer_class: type[serializers.ModelSerializer]):
+        self.serializer_class = serializer_class
+        self._plan = None
+
+    @property
+    def plan(self) -> "_Plan":
+        # Compiled on first use, the serializer's fields need the app registry
+        if self._plan is None:
+            self._plan = _Plan(self.serializer_class(), self.serializer_class.Meta.model)
+        return self._plan
+
+    def values(self, queryset: QuerySet, *extra: str) -> QuerySet:
+        """
+        ``queryset`` as named rows of the columns the serializer reads, plus
+        ``extra`` ones it may not, e.g. the ordering a keyset cursor is built from
+        """
+        paths = self.plan.paths
+        return queryset.values_list(*paths, *(path for path in extra if path not in paths), named=True)
+
+    def serialize(self, rows: Iterable) -> list[dict]:
+        return self.plan.serialize(list(rows), _current_timezone())
+
+    async def aserialize(self, rows: Iterable) -> list[dict]:
+        return await self.plan.aserialize(list(rows), _current_timezone())
+
+
+def _current_timezone():
+    # What DRF's DateTimeField converts to unless the field sets a timezone
+    return timezone.get_current_timezone() if settings.USE_TZ else None
+
+
+def _datetime(value, tz, output_format: str):
+    """DateTimeField.to_representation"""
+    if tz is not None:
+        value = value.astimezone(tz) if value.tzinfo is not None else timezone.make_aware(value, tz)
+    elif value.tzinfo is not None:
+        value = timezone.make_naive(value, dt_timezone.utc)
+
+    if output_format.lower() != ISO_8601:
+        return value.strftime(output_format)
+    value = value.isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
+
+
+def _decimal(field: serializers.DecimalField):
+    """DecimalField.to_representation with the quantize context built once"""
+    if field.localize:
+        raise ImproperlyConfigured(f"Localized DecimalField {field.field_name} cannot be precompiled")
+
+    coerce_to_string = getattr(field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+    normalize = field.normalize_output
+    exponent = decimal.Decimal(".1") ** field.decimal_places if field.decimal_places is not None else None
+    context = decimal.getcontext().copy()
+    if field.max_digits is not None:
+        context.prec = field.max_digits
+
+    def to_representation(value):
+        if not isinstance(value, decimal.Decimal):
+            value = decimal.Decimal(str(value).strip())
+        if exponent is not None:
+            value = value.quantize(exponent, rounding=field.rounding, context=context)
+        if normalize:
+            value = value.normalize()
+        return f"{value:f}" if coerce_to_string else value
+
+    return to_representation
+
+
+class _Plan:
+    """
+    Columns and compiled row function of one serializer. ``lead`` columns
+    come first in every row, a nested list uses its foreign key there to
+    group the rows by parent.
+    """
+
+    def __init__(self, serializer: serializers.BaseSerializer, model, lead: tuple = ()):
+        if type(serializer).to_representation is not serializers.Serializer.to_representation:
+            raise ImproperlyConfigured(f"{type(serializer).__name__} overrides to_representation")
+
+        self.paths = list(lead)
+        # (column of the parent key, related model, foreign key name, plan of the list items)
+        self.many = []
+        # Functions rendering a nested foreign key, memoized per page by its key
+        self.nested = []
+        self.namespace = {"_datetime": _datetime}
+
+        row = self._compile(serializer, model, "")
+        source = "".join(
+            f"def nested_{index}(r, tz, many, memo):\n    return {body}\n"
+            for index, body in enumerate(self.nested)
+        )
+        source += f"def row(r, tz, many, memo):\n    return {row}\n"
+        exec(compile(source, f"<flat {type(serializer).__name__}>", "exec"), self.namespace)
+        self.row = self.namespace["row"]
+
+    def serialize(self, rows: list, tz) -> list[dict]:
+        many = []
+        for key, related_model, foreign_key, child in self.many:
+            children = list(child.related(related_model, foreign_key, rows, key))
+            many.append(child.group(children, child.serialize(children, tz)))
+
+        row, memo = self.row, [{} for _ in self.nested]
+        return [row(r, tz, many, memo) for r in rows]
+
+    async def aserialize(self, rows: list, tz) -> list[dict]:
+        many = []
+        for key, related_model, foreign_key, child in self.many:
+            children = [r async for r in child.related(related_model, foreign_key, rows, key)]
+            many.append(child.group(children, await child.aserialize(children, tz)))
+
+        row, memo = self.row, [{} for _ in self.nested]
+        return [row(r, tz, many, memo) for r in rows]
+
+    def related(self, related_model, foreign_key: str, parents: list, key: int) -> QuerySet:
+        keys = {parent[key] for parent in parents} - {None}
+        return related_model._default_manager.filter(**{f"{foreign_key}__in": keys}).values_list(*self.paths)
+
+    @staticmethod
+    def group(rows: list, items: list[dict]) -> dict:
+        grouped = {}
+        for r, item in zip(rows, items):
+            grouped.setdefault(r[0], []).append(item)
+        return grouped
+
+    def _compile(self, serializer: serializers.BaseSerializer, model, prefix: str) -> str:
+        """Source of the dict literal ``serializer`` renders a row into"""
+        items = []
+        for name, field in serializer.fields.items():
+            if not field.write_only:
+                items.append(f"{name!r}: {self._field(field, model, prefix)}")
+        return "{" + ", ".join(items) + "}"
+
+    def _field(self, field: serializers.Field, model, prefix: str) -> str:
+        if field.source == "*" or "." in field.source:
+            raise ImproperlyConfigured(f"{field.field_name} has a source that cannot be precompiled")
+        model_field = model._meta.get_field(field.source)
+
+        if isinstance(field, serializers.ManyRelatedField):
+            child = field.child_relation
+            if (
+                not model_field.one_to_many
+                or type(child) is not serializers.PrimaryKeyRelatedField
+                or child.pk_field is not None
+            ):
+                raise ImproperlyConfigured(f"{type(child).__name__} {field.field_name} cannot be precompiled")
+            key = self._column(prefix + model._meta.pk.name)
+            self.many.append((key, model_field.related_model, model_field.field.name, _PrimaryKeys(model_field)))
+            return f"many[{len(self.many) - 1}].get(r[{key}], [])"
+
+        if isinstance(field, serializers.ListSerializer):
+            if not model_field.one_to_many:
+                raise ImproperlyConfigured(f"{field.field_name} is not a reverse foreign key")
+            key = self._column(prefix + model._meta.pk.name)
+            child = _Plan(field.child, model_field.related_model, lead=(model_field.field.attname,))
+            self.many.append((key, model_field.related_model, model_field.field.name, child))
+            return f"many[{len(self.many) - 1}].get(r[{key}], [])"
+
+        if isinstance(field, serializers.BaseSerializer):
+            if type(field).to_representation is not serializers.Serializer.to_representation:
+                raise ImproperlyConfigured(f"{type(field).__name__} overrides to_representation")
+            key = self._column(prefix + model_field.attname)
+            # Appended before compiling, a foreign key nested inside renders with its own function
+            index = len(self.nested)
+            self.nested.append(None)
+            self.nested[index] = self._compile(field, model_field.related_model, f"{prefix}{field.source}__")
+            nested = (
+                f"(memo[{index}][_k{index}] if (_k{index} := r[{key}]) in memo[{index}] "
+                f"else memo[{index}].setdefault(_k{index}, nested_{index}(r, tz, many, memo)))"
+            )
+            if model_field.null:
+                return f"(None if r[{key}] is None else {nested})"
+            return nested
+
+        if model_field.is_relation:
+            if not isinstance(field, serializers.PrimaryKeyRelatedField) or field.pk_field is not None:
+                raise ImproperlyConfigured(f"{type(field).__name__} {field.field_name} cannot be precompiled")
+            # The primary key as is, the renderer encodes it
+            return f"r[{self._column(prefix + model_field.attname)}]"
+
+        column = f"r[{self._column(prefix + field.source)}]"
+        expression = self._convert(field, column)
+        if model_field.null and expression != column:
+            # Serializer.to_representation renders None without asking the field
+            return f"(None if {column} is None else {expression})"
+        return expression
+
+    def _convert(self, field: serializers.Field, column: str) -> str:
+        """Source of ``field.to_representation`` applied to ``column``"""
+        base = next((cls for cls in _CONVERTIBLE if isinstance(field, cls)), None)
+        if base is None or getattr(type(field), "to_representation") is not base.to_representation:
+            raise ImproperlyConfigured(f"{type(field).__name__} {field.field_name} cannot be precompiled")
+
+        if base is serializers.ReadOnlyField:
+            return column
+        if base is serializers.CharField:
+            return f"str({column})"
+        if base is serializers.IntegerField:
+            return f"int({column})"
+        if base is serializers.FloatField:
+            return f"float({column})"
+        if base is serializers.BooleanField:
+            return f"bool({column})"
+        if base is serializers.ChoiceField:
+            return f"{self._bind(field.choice_strings_to_values)}.get(str({column}), {column})"
+        if base is serializers.UUIDField:
+            if field.uuid_format == "hex_verbose":
+                return f"str({column})"
+            return f"{column}.{field.uuid_format}"
+        if base is serializers.DecimalField:
+            return f"{self._bind(_decimal(field))}({column})"
+        if base is serializers.DateField:
+            output_format = getattr(field, "format", api_settings.DATE_FORMAT)
+            if output_format is None:
+                return column
+            if output_format.lower() == ISO_8601:
+                return f"{column}.isoformat()"
+            return f"{column}.strftime({output_format!r})"
+
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        if output_format is None:
+            return column
+        # A timezone given to the field wins over the active one
+        tz = self._bind(field.timezone) if hasattr(field, "timezone") else "tz"
+        return f"_datetime({column}, {tz}, {output_format!r})"
+
+    def _column(self, path: str) -> int:
+        if path not in self.paths:
+            self.paths.append(path)
+        return self.paths.index(path)
+
+    def _bind(self, value) -> str:
+        name = f"_{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+
+class _PrimaryKeys(_Plan):
+    """Plan of a reverse foreign key rendered as the list of its primary keys"""
+
+    def __init__(self, model_field):
+        self.paths = [model_field.field.attname, model_field.related_model._meta.pk.attname]
+        self.many = []
+        self.nested = []
+        self.row = lambda r, tz, many, memo: r[1]
+
+
+# Field classes with a known to_representation, subclasses first
+_CONVERTIBLE = (
+    serializers.ChoiceField,
+    serializers.BooleanField,
+    serializers.UUIDField,
+    serializers.DecimalField,
+    serializers.DateTimeField,
+    serializers.DateField,
+    serializers.IntegerField,
+    serializers.FloatField,
+    serializers.CharField,
+    serializers.ReadOnlyField,
+)
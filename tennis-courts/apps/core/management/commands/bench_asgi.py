@@ -0,0 +1,175 @@
+import asyncio
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand
+from django.core.wsgi import get_wsgi_application
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.courts.models import Court
+from apps.users.models import User
+
+# Sync ViewSet action and its async twin, formatted with court_id and day
+ENDPOINTS = {
+    "courts": ("/api/courts/get/", "/api/async/courts/get/", ""),
+    "court": ("/api/courts/{court_id}/get/", "/api/async/courts/{court_id}/get/", ""),
+    "reservations": ("/api/reservations/get/", "/api/async/reservations/get/", ""),
+    "calendar": (
+        "/api/reservations/court/{court_id}/",
+        "/api/async/reservations/court/{court_id}/",
+        "date_from={day}&span=week",
+    ),
+    "free-slots": (
+        "/api/reservations/free-slots/",
+        "/api/async/reservations/free-slots/",
+        "date_from={day}T00:00:00Z&date_to={next_day}T00:00:00Z&duration=60&count=10",
+    ),
+    "occupancy": (
+        "/api/reservations/occupancy/",
+        "/api/async/reservations/occupancy/",
+        "date_from={day}&span=week",
+    ),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Closed-loop load on a read endpoint: sync WSGI worker threads vs one ASGI event loop "
+        "serving the async twin, through the real Django handlers"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--endpoint", choices=ENDPOINTS, default="courts")
+        parser.add_argument("--clients", type=int, default=32, help="Concurrent clients")
+        parser.add_argument("--requests", type=int, default=1000, help="Requests per mode")
+        parser.add_argument("--wsgi-threads", type=int, default=8, help="Threads of the WSGI server")
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(role="admin").first()
+        court = Court.objects.filter(is_active=True).first()
+        if user is None or court is None:
+            self.stdout.write(self.style.ERROR("Needs an admin and an active court, run seed_data"))
+            return
+
+        cookie = f"access_token={RefreshToken.for_user(user).access_token}"
+        sync_path, async_path, query = ENDPOINTS[options["endpoint"]]
+        day = (court.created_at + timedelta(days=1)).date()
+        values = {"court_id": court.id, "day": day, "next_day": day + timedelta(days=1)}
+        sync_path, async_path, query = (part.format(**values) for part in (sync_path, async_path, query))
+
+        self.stdout.write(
+            f"{options['endpoint']}: {options['requests']} requests from {options['clients']} clients"
+        )
+        self.stdout.write(f"{'server':>24} {'req/s':>9} {'p50':>10} {'p99':>10} {'errors':>7}")
+        wsgi = asyncio.run(self._load(self._wsgi_client(sync_path, query, cookie, options), options))
+        self._report(f"WSGI, {options['wsgi_threads']} threads", wsgi)
+        asgi = asyncio.run(self._load(self._asgi_client(async_path, query, cookie), options))
+        self._report("ASGI, 1 event loop", asgi)
+
+    async def _load(self, request, options) -> dict:
+        remaining = options["requests"]
+        latencies = []
+        errors = 0
+
+        async def client():
+            nonlocal remaining, errors
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                status = await request()
+                latencies.append(time.perf_counter() - started)
+                errors += status >= 400
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(options["clients"])))
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        return {
+            "throughput": len(latencies) / elapsed,
+            "p50": latencies[len(latencies) // 2],
+            "p99": latencies[max(0, int(len(latencies) * 0.99) - 1)],
+            "errors": errors,
+        }
+
+    def _wsgi_client(self, path, query, cookie, options):
+        application = get_wsgi_application()
+        executor = ThreadPoolExecutor(max_workers=options["wsgi_threads"])
+
+        def call():
+            environ = {
+                "REQUEST_METHOD": "GET",
+                "PATH_INFO": path,
+                "QUERY_STRING": query,
+                "SERVER_NAME": "testserver",
+                "SERVER_PORT": "80",
+                "SERVER_PROTOCOL": "HTTP/1.1",
+                "HTTP_HOST": "testserver",
+                "HTTP_COOKIE": cookie,
+                "wsgi.input": io.BytesIO(),
+                "wsgi.errors": io.StringIO(),
+                "wsgi.url_scheme": "http",
+                "wsgi.version": (1, 0),
+                "wsgi.multithread": True,
+                "wsgi.multiprocess": False,
+                "wsgi.run_once": False,
+            }
+            status = []
+            response = application(environ, lambda line, headers: status.append(int(line[:3])))
+            try:
+                b"".join(response)
+            finally:
+                # Fires request_finished, which releases the database connection
+                response.close()
+            return status[0]
+
+        async def request():
+            # Clients queue for a free server thread like they would for a worker
+            return await asyncio.get_running_loop().run_in_executor(executor, call)
+
+        return request
+
+    def _asgi_client(self, path, query, cookie):
+        application = get_asgi_application()
+
+        async def request():
+            scope = {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": "1.1",
+                "method": "GET",
+                "scheme": "http",
+                "path": path,
+                "raw_path": path.encode(),
+                "query_string": query.encode(),
+                "root_path": "",
+                "headers": [(b"host", b"testserver"), (b"cookie", cookie.encode())],
+                "client": ("127.0.0.1", 0),
+                "server": ("testserver", 80),
+            }
+            messages = [{"type": "http.request", "body": b"", "more_body": False}]
+            status = []
+
+            async def receive():
+                if messages:
+                    return messages.pop()
+                # The client never disconnects, the handler cancels this wait
+                await asyncio.Event().wait()
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    status.append(message["status"])
+
+            await application(scope, receive, send)
+            return status[0]
+
+        return request
+
+    def _report(self, label, result) -> None:
+        self.stdout.write(
+            f"{label:>24} {result['throughput']:>9.1f} {result['p50'] * 1e3:>7.2f} ms "
+            f"{result['p99'] * 1e3:>7.2f} ms {result['errors']:>7}"
+        )
@@ -0,0 +1,82 @@
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from apps.core.benchmarking import SLOT_LENGTH, SLOT_STEP, seed_benchmark
+from apps.reservations.availability import CourtIntervals
+from apps.reservations.services import ReservationService
+
+
+class Command(BaseCommand):
+    help = "Benchmark check_availability: queryset path vs in-memory interval index"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", nargs="+", type=int, default=[10_000, 100_000, 1_000_000])
+        parser.add_argument("--courts", type=int, default=10)
+        parser.add_argument("--queries", type=int, default=1_000)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+
+        self.stdout.write(
+            f"{'rows':>10} {'queryset':>14} {'index':>14} {'index build':>14} {'speedup':>9}"
+        )
+
+        for size in options["sizes"]:
+            # Everything is rolled back, the benchmark never leaves rows behind
+            with transaction.atomic():
+                result = self._run(size, options["courts"], options["queries"], rng)
+                transaction.set_rollback(True)
+
+            self.stdout.write(
+                f"{size:>10} "
+                f"{result['queryset'] * 1e6:>11.1f} us "
+                f"{result['index'] * 1e6:>11.1f} us "
+                f"{result['build'] * 1e3:>11.1f} ms "
+                f"{result['queryset'] / result['index']:>8.0f}x"
+            )
+
+            if result["mismatches"]:
+                self.stdout.write(
+                    self.style.ERROR(f"  {result['mismatches']} answers differ between paths")
+                )
+
+    def _run(self, size: int, courts_count: int, queries: int, rng: random.Random) -> dict:
+        now = timezone.now()
+        _, courts, per_court = seed_benchmark(size, courts_count, rng=rng)
+
+        horizon = SLOT_STEP * (size // courts_count)
+        windows = []
+        for _ in range(queries):
+            start_at = now + timedelta(seconds=rng.uniform(0, horizon.total_seconds()))
+            windows.append((rng.choice(courts).id, start_at, start_at + SLOT_LENGTH))
+
+        started = time.perf_counter()
+        expected = [
+            ReservationService.check_availability(court_id, start_at, end_at)
+            for court_id, start_at, end_at in windows
+        ]
+        queryset_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        index = {court_id: CourtIntervals(rows) for court_id, rows in per_court.items()}
+        build_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        answers = [
+            index[court_id].is_available(start_at, end_at)
+            for court_id, start_at, end_at in windows
+        ]
+        index_time = time.perf_counter() - started
+
+        return {
+            "queryset": queryset_time / queries,
+            "index": index_time / queries,
+            "build": build_time,
+            "mismatches": sum(a != b for a, b in zip(expected, answers)),
+        }
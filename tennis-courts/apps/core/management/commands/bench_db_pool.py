@@ -0,0 +1,135 @@
+import statistics
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections
+from django.db.backends.signals import connection_created
+from django.test import Client
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.core.backends.postgresql_pool.base import DatabaseWrapper as PooledDatabaseWrapper
+from apps.users.models import User
+
+ENGINES = {
+    "direct": "django.db.backends.postgresql",
+    "pooled": "apps.core.backends.postgresql_pool",
+}
+
+
+class Command(BaseCommand):
+    help = "Compare request throughput with a new connection per request and with the connection pool"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default="/api/courts/get/")
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--requests", type=int, default=200, help="Requests per thread")
+        parser.add_argument("--pool-size", type=int, default=None, help="Defaults to --threads")
+
+    def handle(self, *args, **options):
+        user = User.objects.first()
+        if user is None:
+            self.stdout.write(self.style.ERROR("Needs at least one user, run seed_data"))
+            return
+        token = str(RefreshToken.for_user(user).access_token)
+
+        settings_dict = connections.settings[DEFAULT_DB_ALIAS]
+        original = {key: settings_dict.get(key) for key in ("ENGINE", "POOL", "CONN_MAX_AGE")}
+        settings_dict["CONN_MAX_AGE"] = 0
+        settings_dict["POOL"] = {
+            **(original["POOL"] or {}),
+            "MAX_SIZE": options["pool_size"] or options["threads"],
+        }
+
+        self.stdout.write(
+            f"GET {options['path']}, {options['threads']} threads x {options['requests']} requests"
+        )
+        self.stdout.write(
+            f"{'mode':>8} {'req/s':>9} {'p50':>10} {'p95':>10} {'connects':>9} {'errors':>7}"
+        )
+        try:
+            for label, engine in ENGINES.items():
+                settings_dict["ENGINE"] = engine
+                self._drop_connection()
+                self._report(label, self._run(token, options, pooled=label == "pooled"))
+            for pool in PooledDatabaseWrapper._pools.values():
+                self.stdout.write(f"pool {pool.name}: {pool.stats()}")
+        finally:
+            for key, value in original.items():
+                if value is None:
+                    settings_dict.pop(key, None)
+                else:
+                    settings_dict[key] = value
+            self._drop_connection()
+
+    def _run(self, token, options, pooled: bool) -> dict:
+        latencies = []
+        errors = []
+        connects = []
+        lock = threading.Lock()
+        start = threading.Barrier(options["threads"] + 1)
+
+        def count_connect(**kwargs):
+            with lock:
+                connects.append(1)
+
+        # Django "connects" on every request either way, the pool only opens
+        # a server connection when it has no idle one
+        if not pooled:
+            connection_created.connect(count_connect, weak=False)
+
+        def worker():
+            client = Client()
+            client.cookies["access_token"] = token
+            timings = []
+            failures = 0
+            start.wait()
+            for _ in range(options["requests"]):
+                started = time.perf_counter()
+                response = client.get(options["path"])
+                # What the request_finished signal does behind a real server
+                close_old_connections()
+                timings.append(time.perf_counter() - started)
+                failures += response.status_code >= 400
+            connections.close_all()
+            with lock:
+                latencies.extend(timings)
+                errors.append(failures)
+
+        threads = [threading.Thread(target=worker) for _ in range(options["threads"])]
+        for thread in threads:
+            thread.start()
+        start.wait()
+        started = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        connection_created.disconnect(count_connect)
+
+        latencies.sort()
+        return {
+            "throughput": len(latencies) / elapsed,
+            "p50": statistics.median(latencies),
+            "p95": latencies[int(len(latencies) * 0.95) - 1],
+            "connects": self._pool_opened() if pooled else len(connects),
+            "errors": sum(errors),
+        }
+
+    @staticmethod
+    def _drop_connection() -> None:
+        # The next access builds a wrapper and a pool from the current settings
+        connections[DEFAULT_DB_ALIAS].close()
+        del connections[DEFAULT_DB_ALIAS]
+        for pool in PooledDatabaseWrapper._pools.values():
+            pool.close()
+        PooledDatabaseWrapper._pools.clear()
+
+    @staticmethod
+    def _pool_opened() -> int:
+        return sum(pool.opened for pool in PooledDatabaseWrapper._pools.values())
+
+    def _report(self, label, result) -> None:
+        self.stdout.write(
+            f"{label:>8} {result['throughput']:>9.1f} {result['p50'] * 1e3:>7.2f} ms "
+            f"{result['p95'] * 1e3:>7.2f} ms {result['connects']:>9} {result['errors']:>7}"
+        )
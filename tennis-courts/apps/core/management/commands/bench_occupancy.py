@@ -0,0 +1,85 @@
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.benchmarking import seed_benchmark
+from apps.reservations.serializers import CourtCalendarEntrySerializer, ReservationReadSerializer
+from apps.reservations.services import ReservationService
+
+
+class Command(BaseCommand):
+    help = "Compare court calendar payloads: full reservation rows, per-day entries and slot bitmaps"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--size", type=int, default=10_000)
+        parser.add_argument("--courts", type=int, default=10)
+        parser.add_argument("--days", type=int, default=7)
+        parser.add_argument("--slot", type=int, choices=[15, 30], default=30)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        # Everything is rolled back, the benchmark never leaves rows behind
+        with transaction.atomic():
+            _, courts, _ = seed_benchmark(options["size"], options["courts"], rng=random.Random(42))
+            court = courts[0]
+            date_from = timezone.localdate()
+            date_to = date_from + timedelta(days=options["days"])
+
+            payloads = {
+                "legacy rows": lambda: ReservationReadSerializer(
+                    ReservationService.get_court_reservations(
+                        court.id,
+                        from_date=timezone.now().replace(hour=0, minute=0, second=0, microsecond=0),
+                    ),
+                    many=True,
+                ).data,
+                "per-day entries": lambda: {
+                    day.isoformat(): CourtCalendarEntrySerializer(reservations, many=True).data
+                    for day, reservations in ReservationService.get_court_calendar(
+                        court.id, date_from, date_to
+                    ).items()
+                },
+                "slot bitmaps": lambda: {
+                    day.isoformat(): bitmap.encode()
+                    for day, bitmap in ReservationService.get_occupancy(
+                        date_from, date_to, options["slot"], court_id=court.id
+                    )["courts"][court.id].items()
+                },
+            }
+
+            self.stdout.write(
+                f"one court, {options['days']} days, {options['size']} seeded reservations"
+            )
+            self.stdout.write(f"{'payload':>16} {'bytes':>10} {'per day':>10} {'time':>12}")
+            for label, build in payloads.items():
+                self._report(label, build, options["days"], options["repeat"])
+
+            started = time.perf_counter()
+            occupancy = ReservationService.get_occupancy(date_from, date_to, options["slot"])
+            elapsed = time.perf_counter() - started
+            court_days = sum(len(days) for days in occupancy["courts"].values())
+            size = len(JSONRenderer().render({
+                str(court_id): {day.isoformat(): bitmap.encode() for day, bitmap in days.items()}
+                for court_id, days in occupancy["courts"].items()
+            }))
+            self.stdout.write(
+                f"all courts: {court_days} court-days in {size} bytes "
+                f"({size / court_days:.1f} per court-day), built in {elapsed * 1e3:.1f} ms"
+            )
+
+            transaction.set_rollback(True)
+
+    def _report(self, label: str, build, days: int, repeat: int) -> None:
+        started = time.perf_counter()
+        for _ in range(repeat):
+            payload = JSONRenderer().render(build())
+        elapsed = (time.perf_counter() - started) / repeat
+
+        self.stdout.write(
+            f"{label:>16} {len(payload):>10} {len(payload) / days:>10.0f} {elapsed * 1e3:>9.2f} ms"
+        )
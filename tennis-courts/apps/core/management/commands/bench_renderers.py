@@ -0,0 +1,88 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import override_settings
+from rest_framework.renderers import JSONRenderer
+
+from apps.core import renderers
+from apps.core.benchmarking import seed_benchmark
+from apps.core.renderers import FastJSONRenderer, render_json
+from apps.core.responses import _envelope, _render_envelope
+from apps.reservations.models import Reservation
+from apps.reservations.serializers import ReservationReadSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Render reservation listings in the api_response envelope with DRF's JSONRenderer, "
+        "FastJSONRenderer on each encoder and pre-rendered RawJSON"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--size", type=int, default=10_000)
+        parser.add_argument("--repeat", type=int, default=10)
+
+    def handle(self, *args, **options):
+        if renderers.orjson is None:
+            self.stdout.write(self.style.WARNING("orjson is not installed, only the stdlib encoder is measured"))
+
+        # Everything is rolled back, the benchmark never leaves rows behind
+        with transaction.atomic():
+            seed_benchmark(options["size"], 10, rng=random.Random(42))
+            queryset = (
+                Reservation.objects.select_related("court", "user")
+                .prefetch_related("court__prices")
+                .order_by("start_at", "id")[: options["size"]]
+            )
+            payloads = {
+                # Serializer output: strings already, apart from nested dicts
+                "serialized": ReservationReadSerializer(queryset, many=True).data,
+                # .values() rows keep UUIDs, datetimes and Decimals for the encoder
+                "values rows": list(queryset.values(
+                    "id", "court_id", "user_id", "players_count", "additional_info", "status",
+                    "total_amount", "start_at", "end_at", "created_at", "updated_at",
+                )),
+            }
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"{options['size']} reservations, best of {options['repeat']}")
+        self.stdout.write(f"{'payload':>12} {'renderer':>18} {'bytes':>10} {'time':>12} {'speedup':>8}")
+        for label, data in payloads.items():
+            envelope = _envelope(data, "Reservations retrieved successfully", {"next_cursor": None})
+            baseline_content, baseline = self._time(lambda: JSONRenderer().render(envelope), options["repeat"])
+            self._report(label, "DRF JSONRenderer", baseline_content, baseline, baseline)
+
+            for encoder in ("stdlib", "orjson"):
+                if encoder == "orjson" and renderers.orjson is None:
+                    continue
+                with override_settings(API_JSON_ENCODER=encoder):
+                    content, elapsed = self._time(lambda: FastJSONRenderer().render(envelope), options["repeat"])
+                    raw = render_json(data)
+                self._report(label, f"fast, {encoder}", content, elapsed, baseline)
+                if content != baseline_content:
+                    self.stdout.write(self.style.ERROR(f"{encoder} output differs from JSONRenderer"))
+
+            # Data rendered once beforehand (e.g. from a cache), only the envelope is encoded
+            raw_envelope = _envelope(raw, "Reservations retrieved successfully", {"next_cursor": None})
+            content, elapsed = self._time(
+                lambda: FastJSONRenderer().render(_render_envelope(raw_envelope)), options["repeat"]
+            )
+            self._report(label, "pre-rendered", content, elapsed, baseline)
+            if content != baseline_content:
+                self.stdout.write(self.style.ERROR("pre-rendered output differs from JSONRenderer"))
+
+    @staticmethod
+    def _time(render, repeat: int) -> tuple[bytes, float]:
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            content = render()
+            best = min(best, time.perf_counter() - started)
+        return content, best
+
+    def _report(self, label: str, renderer: str, content: bytes, elapsed: float, baseline: float) -> None:
+        self.stdout.write(
+            f"{label:>12} {renderer:>18} {len(content):>10} {elapsed * 1e3:>9.2f} ms {baseline / elapsed:>7.1f}x"
+        )
@@ -0,0 +1,86 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.core.benchmarking import seed_benchmark
+from apps.core.renderers import dumps
+from apps.courts.models import Court
+from apps.courts.serializers import CourtReadSerializer, court_rows
+from apps.reservations.models import Reservation
+from apps.reservations.serializers import ReservationReadSerializer, reservation_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Render reservation and court listings with the DRF read serializers and their "
+        "precompiled flat twins, checking that both produce the same bytes"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+        parser.add_argument("--courts", type=int, default=10)
+
+    def handle(self, *args, **options):
+        failed = False
+
+        # Everything is rolled back, the benchmark never leaves rows behind
+        with transaction.atomic():
+            seed_benchmark(max(options["sizes"]), options["courts"], users_count=5, rng=random.Random(42))
+
+            self.stdout.write(f"{'listing':>14} {'rows':>8} {'serializer':>12} {'flat':>12} {'speedup':>8}  bytes")
+            courts = Court.objects.order_by("created_at", "id")
+            failed |= not self._compare(
+                "courts",
+                courts.count(),
+                lambda: CourtReadSerializer(courts.prefetch_related("prices"), many=True).data,
+                lambda: court_rows.serialize(court_rows.values(courts)),
+            )
+
+            for size in options["sizes"]:
+                reservations = Reservation.objects.order_by("start_at", "id")[:size]
+                failed |= not self._compare(
+                    "reservations",
+                    size,
+                    lambda: ReservationReadSerializer(
+                        reservations.select_related("court", "user").prefetch_related("court__prices"),
+                        many=True,
+                    ).data,
+                    lambda: reservation_rows.serialize(reservation_rows.values(reservations)),
+                )
+
+            transaction.set_rollback(True)
+
+        if failed:
+            self.stdout.write(self.style.ERROR("flat output differs from the serializers"))
+        else:
+            self.stdout.write(self.style.SUCCESS("flat output is byte for byte identical"))
+
+    def _compare(self, label: str, size: int, serializer, flat) -> bool:
+        """Time both paths, query included, and compare their JSON"""
+        started = time.perf_counter()
+        expected = serializer()
+        serializer_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        actual = flat()
+        flat_time = time.perf_counter() - started
+
+        expected_content, actual_content = dumps(expected), dumps(actual)
+        self.stdout.write(
+            f"{label:>14} {size:>8} {serializer_time * 1e3:>9.1f} ms {flat_time * 1e3:>9.1f} ms "
+            f"{serializer_time / flat_time:>7.1f}x  {len(actual_content)}"
+        )
+        if expected_content == actual_content:
+            return True
+
+        for index, (expected_row, actual_row) in enumerate(zip(expected, actual)):
+            if dumps(expected_row) != dumps(actual_row):
+                self.stdout.write(f"first difference at row {index}:")
+                self.stdout.write(f"  serializer {dumps(expected_row).decode()}")
+                self.stdout.write(f"  flat       {dumps(actual_row).decode()}")
+                break
+        else:
+            self.stdout.write(f"row counts differ: {len(expected)} vs {len(actual)}")
+        return False
@@ -0,0 +1,126 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.courts.models import Court
+from apps.emails.services import EmailService
+from apps.reservations.models import Reservation
+from apps.reservations.serializers import ReservationReadSerializer
+from apps.reservations.services import ReservationService
+from apps.users.models import User
+
+
+class Command(BaseCommand):
+    help = "Count queries per reservation status transition: lock + save + reload vs UPDATE ... RETURNING"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=50)
+
+    def handle(self, *args, **options):
+        court = Court.objects.filter(is_active=True).first()
+        user = User.objects.first()
+        if court is None or user is None:
+            self.stdout.write(self.style.ERROR("Needs at least one active court and one user, run seed_data"))
+            return
+
+        transitions = {
+            "confirm": (
+                lambda reservation: self._legacy_confirm(reservation.id),
+                lambda reservation: ReservationService.confirm_reservation(reservation.id),
+            ),
+            "cancel": (
+                lambda reservation: self._legacy_cancel(reservation.id),
+                lambda reservation: ReservationService.cancel_reservation(reservation.id),
+            ),
+            "update times": (
+                lambda reservation: self._legacy_update(reservation.id),
+                lambda reservation: ReservationService.update_reservation(
+                    reservation.id, {"end_at": reservation.start_at + timedelta(minutes=90)}
+                ),
+            ),
+        }
+
+        self.stdout.write(
+            f"{'transition':>14} {'before':>8} {'after':>8} {'before time':>13} {'after time':>13}"
+        )
+        # Everything is rolled back, the benchmark never leaves rows behind
+        with transaction.atomic():
+            start_at = timezone.now().replace(microsecond=0) + timedelta(days=3650)
+            for label, (legacy, current) in transitions.items():
+                span = timedelta(hours=2 * (options["repeat"] + 1))
+                before = self._measure(legacy, court, user, start_at, options["repeat"])
+                after = self._measure(current, court, user, start_at + span, options["repeat"])
+                start_at += 2 * span
+
+                self.stdout.write(
+                    f"{label:>14} {before[0]:>8} {after[0]:>8} "
+                    f"{before[1] * 1e3:>10.2f} ms {after[1] * 1e3:>10.2f} ms"
+                )
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            "Query counts include the outbox INSERT of the notice and the response "
+            "serialization, taken with warm court and user caches."
+        )
+
+    def _measure(self, transition, court, user, start_at, repeat) -> tuple[int, float]:
+        reservations = [
+            Reservation.objects.create(
+                court=court,
+                user=user,
+                players_count=1,
+                total_amount=0,
+                start_at=start_at + timedelta(hours=2 * i),
+                end_at=start_at + timedelta(hours=2 * i + 1),
+            )
+            for i in range(repeat + 1)
+        ]
+
+        # Warm up the process-local caches on the first reservation
+        ReservationReadSerializer(transition(reservations[0])).data
+
+        queries = 0
+        started = time.perf_counter()
+        for reservation in reservations[1:]:
+            with CaptureQueriesContext(connection) as captured:
+                ReservationReadSerializer(transition(reservation)).data
+            queries = max(queries, len(captured))
+        return queries, (time.perf_counter() - started) / repeat
+
+    # Transitions as they were implemented before UPDATE ... RETURNING
+
+    @staticmethod
+    @transaction.atomic
+    def _legacy_confirm(reservation_id):
+        reservation = Reservation.objects.select_for_update().get(id=reservation_id)
+        reservation.status = Reservation.ReservationStatus.CONFIRMED
+        reservation.save()
+        reservation = ReservationService.get_reservation(reservation_id)
+        EmailService.send_reservation_confirmation(reservation)
+        return reservation
+
+    @staticmethod
+    @transaction.atomic
+    def _legacy_cancel(reservation_id):
+        reservation = Reservation.objects.select_for_update().get(id=reservation_id)
+        reservation.status = Reservation.ReservationStatus.CANCELED
+        reservation.save()
+        reservation = ReservationService.get_reservation(reservation_id)
+        EmailService.send_reservation_cancellation(reservation)
+        return reservation
+
+    @staticmethod
+    @transaction.atomic
+    def _legacy_update(reservation_id):
+        reservation = Reservation.objects.select_for_update().get(id=reservation_id)
+        reservation.end_at = reservation.start_at + timedelta(minutes=90)
+        reservation.total_amount = ReservationService.calculate_total_amount(
+            reservation.court_id, reservation.start_at, reservation.end_at
+        )
+        with transaction.atomic():
+            reservation.save()
+        return ReservationService.get_reservation(reservation_id)
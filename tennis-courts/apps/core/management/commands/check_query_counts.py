@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from apps.core.benchmarking import QUERY_COUNT_SIZES, read_paths
+
+
+class Command(BaseCommand):
+    help = (
+        "Count the queries of each read path, service call and serialization, at several row "
+        "counts and fail unless the count stays the same"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=list(QUERY_COUNT_SIZES))
+
+    def handle(self, *args, **options):
+        counts = {}
+        for size in options["sizes"]:
+            # Everything is rolled back, the check never leaves rows behind
+            with transaction.atomic():
+                for label, read in read_paths(size).items():
+                    with CaptureQueriesContext(connection) as queries:
+                        read()
+                    counts.setdefault(label, {})[size] = len(queries)
+                transaction.set_rollback(True)
+
+        self.stdout.write(f"{'read path':>22} " + " ".join(f"{size:>6}" for size in options["sizes"]))
+        failed = []
+        for label, per_size in counts.items():
+            self.stdout.write(f"{label:>22} " + " ".join(f"{count:>6}" for count in per_size.values()))
+            if len(set(per_size.values())) > 1:
+                failed.append(label)
+
+        if failed:
+            raise CommandError(f"Query count grows with the rows: {', '.join(failed)}")
+        self.stdout.write(self.style.SUCCESS("Query counts are constant"))
@@ -0,0 +1,50 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.reservations.expiry import ExpiryScheduler
+from apps.reservations.services import ReservationService
+
+
+class Command(BaseCommand):
+    help = "Cancel pending reservations that were not confirmed within the hold TTL"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Sweep the expired holds once and exit")
+        parser.add_argument("--batch-size", type=int, default=settings.RESERVATION_EXPIRY_BATCH_SIZE)
+        parser.add_argument(
+            "--max-sleep",
+            type=float,
+            default=60,
+            help="Upper bound in seconds between sweeps, also catches holds skipped while locked",
+        )
+
+    def handle(self, *args, **options):
+        if options["once"]:
+            self._sweep(options["batch_size"])
+            return
+
+        scheduler = ExpiryScheduler(timedelta(minutes=settings.RESERVATION_HOLD_TTL))
+        while True:
+            self._sweep(options["batch_size"])
+            scheduler.pop_due(timezone.now())
+
+            deadline = scheduler.next_deadline()
+            sleep = options["max_sleep"]
+            if deadline is not None:
+                sleep = min(sleep, max((deadline - timezone.now()).total_seconds(), 0))
+            time.sleep(sleep)
+
+    def _sweep(self, batch_size: int) -> None:
+        total = 0
+        while True:
+            expired = ReservationService.expire_pending_holds(batch_size=batch_size)
+            total += len(expired)
+            if len(expired) < batch_size:
+                break
+
+        if total:
+            self.stdout.write(f"Expired {total} pending reservations")
@@ -0,0 +1,81 @@
+import random
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.core.benchmarking import seed_benchmark
+from apps.reservations.models import Reservation
+from apps.reservations.services import ReservationService
+
+
+class Command(BaseCommand):
+    help = "Run EXPLAIN ANALYZE on the SQL issued by the reservation service queries"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=100_000,
+            help="Synthetic reservations inserted (and rolled back) before explaining, 0 uses current data",
+        )
+        parser.add_argument("--courts", type=int, default=20)
+        parser.add_argument("--users", type=int, default=200)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options["seed"]:
+                users, courts, _ = seed_benchmark(
+                    options["seed"], options["courts"], options["users"], rng=random.Random(42)
+                )
+                user, court = users[0], courts[0]
+                with connection.cursor() as cursor:
+                    cursor.execute(f"ANALYZE {Reservation._meta.db_table}")
+            else:
+                reservation = Reservation.objects.order_by("-start_at").first()
+                if reservation is None:
+                    self.stdout.write(self.style.ERROR("No reservations to explain, use --seed"))
+                    return
+                user, court = reservation.user, reservation.court
+
+            now = timezone.now()
+            queries = {
+                "check_availability": lambda: ReservationService.check_availability(
+                    court.id, now + timedelta(days=3), now + timedelta(days=3, hours=1)
+                ),
+                "get_court_reservations": lambda: ReservationService.get_court_reservations(
+                    court.id, from_date=now
+                ),
+                "get_reservations(user_id)": lambda: ReservationService.get_reservations(
+                    user_id=user.id
+                ),
+            }
+
+            for label, query in queries.items():
+                for sql, params in self._capture(query):
+                    self._explain(label, sql, params)
+
+            transaction.set_rollback(True)
+
+    def _capture(self, query) -> list[tuple[str, tuple]]:
+        statements = []
+
+        def wrapper(execute, sql, params, many, context):
+            if sql.lstrip().upper().startswith("SELECT"):
+                statements.append((sql, params))
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(wrapper):
+            query()
+
+        return statements
+
+    def _explain(self, label: str, sql: str, params: tuple) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {sql}", params)
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"== {label}"))
+        self.stdout.write(plan)
+        self.stdout.write("")
@@ -0,0 +1,46 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.emails.outbox import OutboxSender
+
+
+class Command(BaseCommand):
+    help = "Deliver queued outbox emails in batches over one reused mail connection"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Drain the due emails once and exit")
+        parser.add_argument("--batch-size", type=int, default=settings.EMAIL_OUTBOX_BATCH_SIZE)
+        parser.add_argument("--max-attempts", type=int, default=settings.EMAIL_OUTBOX_MAX_ATTEMPTS)
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.EMAIL_OUTBOX_POLL_INTERVAL,
+            help="Seconds to wait between polls once the outbox is drained",
+        )
+
+    def handle(self, *args, **options):
+        sender = OutboxSender(
+            batch_size=options["batch_size"],
+            max_attempts=options["max_attempts"],
+        )
+
+        try:
+            while True:
+                try:
+                    sent, failed = sender.drain()
+                except Exception as exc:
+                    sender.close()
+                    self.stderr.write(self.style.ERROR(f"Outbox batch failed: {exc}"))
+                    if options["once"]:
+                        raise
+                else:
+                    if sent or failed:
+                        self.stdout.write(f"Sent {sent} emails, {failed} failed attempts")
+                    if options["once"]:
+                        return
+
+                time.sleep(options["interval"])
+        finally:
+            sender.close()
@@ -0,0 +1,114 @@
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import timedelta
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from apps.courts.models import Court, CourtPrice
+from apps.reservations.models import Reservation
+from apps.reservations.services import ReservationService
+from apps.users.models import User
+
+
+class Command(BaseCommand):
+    help = "Race N threads for overlapping slots of one court and verify no double booking"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=16)
+        parser.add_argument("--rounds", type=int, default=5)
+        parser.add_argument(
+            "--disjoint",
+            action="store_true",
+            help="Give every thread its own slot, all bookings are expected to succeed",
+        )
+
+    def handle(self, *args, **options):
+        threads_count = options["threads"]
+        user = User.objects.create(id=uuid.uuid4(), email=f"stress-{uuid.uuid4()}@example.com")
+        court = Court.objects.create(
+            name="Stress court",
+            court_type=Court.CourtType.INDOOR,
+            surface=Court.CourtSurface.HARD,
+            max_players=4,
+            city="Stress",
+            street="Stress 1",
+            postal_code="00-000",
+        )
+        CourtPrice.objects.create(court=court, price_per_hour=50)
+
+        try:
+            for round_number in range(options["rounds"]):
+                base = timezone.now() + timedelta(days=round_number + 1)
+                self._round(court, user, base, threads_count, options["disjoint"])
+
+            overlapping = self._overlapping_pairs(court)
+        finally:
+            Reservation.objects.filter(court=court).delete()
+            CourtPrice.objects.filter(court=court).delete()
+            court.delete()
+            user.delete()
+
+        if overlapping:
+            raise CommandError(f"Double booking detected: {overlapping} overlapping pairs")
+
+        self.stdout.write(self.style.SUCCESS("No overlapping active reservations"))
+
+    def _round(self, court, user, base, threads_count, disjoint):
+        barrier = threading.Barrier(threads_count)
+        outcomes = Counter()
+        lock = threading.Lock()
+
+        def book(i):
+            # Overlapping mode: windows shifted by 30 minutes, each one
+            # overlaps its neighbours
+            offset = timedelta(hours=2 * i) if disjoint else timedelta(minutes=30 * (i % 4))
+            start_at = base + offset
+            try:
+                barrier.wait()
+                ReservationService.create_reservation(
+                    user.id,
+                    {
+                        "court_id": court.id,
+                        "players_count": 2,
+                        "start_at": start_at,
+                        "end_at": start_at + timedelta(hours=1),
+                    },
+                )
+                outcome = "booked"
+            except ValidationError:
+                outcome = "rejected"
+            except Exception as exc:
+                outcome = type(exc).__name__
+            finally:
+                connection.close()
+
+            with lock:
+                outcomes[outcome] += 1
+
+        started = time.perf_counter()
+        threads = [threading.Thread(target=book, args=(i,)) for i in range(threads_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        summary = ", ".join(f"{name}: {count}" for name, count in sorted(outcomes.items()))
+        self.stdout.write(f"{threads_count} threads in {elapsed * 1e3:.0f} ms -> {summary}")
+
+    def _overlapping_pairs(self, court) -> int:
+        rows = list(
+            Reservation.objects.filter(court=court, status__in=["pending", "confirmed"])
+            .order_by("start_at")
+            .values_list("start_at", "end_at")
+        )
+        return sum(
+            1
+            for (_, previous_end), (next_start, _) in zip(rows, rows[1:])
+            if next_start < previous_end
+        )
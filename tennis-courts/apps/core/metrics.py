@@ -0,0 +1,28 @@
+import threading
+from typing import Callable
+
+
+class MetricsRegistry:
+    """
+    Process-local registry of named stat sources.
+
+    Components register a callable returning a flat dict of numbers and the
+    system metrics endpoint snapshots all of them on request. Values are per
+    worker process, they are not aggregated across processes.
+    """
+
+    def __init__(self):
+        self._sources = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, source: Callable[[], dict]) -> None:
+        with self._lock:
+            self._sources[name] = source
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            sources = dict(self._sources)
+        return {name: source() for name, source in sorted(sources.items())}
+
+
+metrics = MetricsRegistry()
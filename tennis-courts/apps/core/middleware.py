@@ -0,0 +1,85 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.urls import Resolver404, resolve
+
+from apps.core.routers import _use_replica
+
+PRIMARY_PIN_COOKIE = "db_primary_pin"
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def read_only_view(view):
+    """Mark a plain (non ViewSet) view as safe to serve from a replica"""
+    view.read_only = True
+    return view
+
+
+def is_read_action(request) -> bool:
+    """Whether the request hits a read-only view or ViewSet action: ``get_*`` or ``me``"""
+    if request.method not in SAFE_METHODS:
+        return False
+    try:
+        match = resolve(request.path_info)
+    except Resolver404:
+        return False
+
+    if getattr(match.func, "read_only", False):
+        return True
+    actions = getattr(match.func, "actions", None)
+    if not actions:
+        return False
+    action = actions.get(request.method.lower())
+    return action is not None and (action == "me" or action.startswith("get_"))
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Lets read-only ViewSet actions read from the replicas.
+
+    A client that just wrote gets a short-lived cookie pinning its reads to
+    the primary for ``DATABASE_PRIMARY_PIN_SECONDS``, so a booking shows up
+    in the next listing even while the replicas lag behind.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = bool(settings.DATABASE_REPLICAS)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        token = _use_replica.set(self._reads_from_replica(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            _use_replica.reset(token)
+        return self._pin(request, response)
+
+    async def __acall__(self, request):
+        token = _use_replica.set(self._reads_from_replica(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            _use_replica.reset(token)
+        return self._pin(request, response)
+
+    def _reads_from_replica(self, request) -> bool:
+        return self.enabled and PRIMARY_PIN_COOKIE not in request.COOKIES and is_read_action(request)
+
+    def _pin(self, request, response):
+        if self.enabled and request.method not in SAFE_METHODS and response.status_code < 400:
+            response.set_cookie(
+                PRIMARY_PIN_COOKIE,
+                "1",
+                httponly=True,
+                secure=False,
+                samesite="Lax",
+                max_age=settings.DATABASE_PRIMARY_PIN_SECONDS,
+            )
+        return response
@@ -0,0 +1,76 @@
+import decimal
+import logging
+
+from django.conf import settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    if settings.API_JSON_ENCODER == "orjson":
+        logger.warning("API_JSON_ENCODER is orjson but orjson is not installed, rendering with the stdlib encoder")
+
+# The stdlib path is DRF's own encoding, kept for hosts without orjson
+_encoder = encoders.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_drf_default = _encoder.default
+
+
+class RawJSON(bytes):
+    """JSON rendered ahead of the response, written out as is by FastJSONRenderer"""
+
+
+def _orjson_default(obj):
+    # orjson handles UUIDs, datetimes, dates and times itself, the rest is
+    # encoded the way DRF's encoder does
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    return _drf_default(obj)
+
+
+def _escape_separators(content: bytes) -> bytes:
+    # U+2028/U+2029 are valid JSON but end a line in JavaScript, DRF escapes them too
+    if b"\xe2\x80" in content:
+        content = content.replace("\u2028".encode(), b"\\u2028").replace("\u2029".encode(), b"\\u2029")
+    return content
+
+
+def dumps(data) -> bytes:
+    """Compact JSON of ``data``, byte for byte what DRF's JSONRenderer writes"""
+    if isinstance(data, RawJSON):
+        return bytes(data)
+    if orjson is not None and settings.API_JSON_ENCODER == "orjson":
+        content = orjson.dumps(
+            data,
+            default=_orjson_default,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        )
+    else:
+        content = _encoder.encode(data).encode()
+    return _escape_separators(content)
+
+
+def render_json(data) -> RawJSON:
+    """Render ``data`` once, e.g. before caching it, and hand it to api_response as is"""
+    return RawJSON(dumps(data))
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer encoding with orjson when it is installed and API_JSON_ENCODER
+    allows it, which writes UUIDs and datetimes natively instead of calling
+    back into Python for each one. RawJSON is written without re-encoding.
+    Indented output for the browsable API stays with DRF's encoder.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if isinstance(data, RawJSON):
+            return bytes(data)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
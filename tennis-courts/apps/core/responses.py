@@ -1,7 +1,39 @@
-from typing import Optional
+from typing import Optional, Union
+
+from django.http import HttpResponse
 from rest_framework.response import Response
 
-def api_response(data: Optional[dict] = None, message: Optional[str] = None, status_code: int = 200) -> Response:
+from apps.core.renderers import RawJSON, dumps
+
+def api_response(
+    data: Optional[Union[dict, RawJSON]] = None,
+    message: Optional[str] = None,
+    status_code: int = 200,
+    meta: Optional[dict] = None,
+) -> Response:
+    """``data`` may be RawJSON rendered beforehand, it is spliced into the envelope as is"""
+    envelope = _envelope(data, message, meta)
+    return Response(
+        _render_envelope(envelope) if isinstance(data, RawJSON) else envelope,
+        status=status_code,
+    )
+
+
+def async_api_response(
+    data: Optional[Union[dict, RawJSON]] = None,
+    message: Optional[str] = None,
+    status_code: int = 200,
+    meta: Optional[dict] = None,
+) -> HttpResponse:
+    """The api_response envelope for plain Django async views, which DRF does not serve"""
+    return HttpResponse(
+        _render_envelope(_envelope(data, message, meta)),
+        status=status_code,
+        content_type="application/json",
+    )
+
+
+def _envelope(data: Optional[dict], message: Optional[str], meta: Optional[dict]) -> dict:
     response = {}
 
     if data is not None:
@@ -10,7 +42,13 @@ def api_response(data: Optional[dict] = None, message: Optional[str] = None, sta
     if message is not None:
         response["message"] = message
 
-    return Response(
-        response,
-        status=status_code,
-    )
\ No newline at end of file
+    if meta is not None:
+        response["meta"] = meta
+
+    return response
+
+
+def _render_envelope(envelope: dict) -> RawJSON:
+    return RawJSON(
+        b"{" + b",".join(dumps(key) + b":" + dumps(value) for key, value in envelope.items()) + b"}"
+    )
@@ -0,0 +1,49 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# Set for the duration of a read-only request by ReplicaRoutingMiddleware
+_use_replica = ContextVar("use_replica", default=False)
+
+
+@contextmanager
+def replica_reads(enabled: bool = True):
+    """Route the ORM reads of the block to a replica (or force them to the primary)"""
+    token = _use_replica.set(enabled)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+class ReplicaRouter:
+    """
+    Sends reads to ``settings.DATABASE_REPLICAS`` when the current request
+    asked for it, everything else to the primary.
+
+    Reads inside a transaction on the primary stay there, so service methods
+    under ``transaction.atomic`` see their own writes and can lock rows.
+    Replicas carry the same schema, only the primary is migrated.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not _use_replica.get() or not settings.DATABASE_REPLICAS:
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
@@ -3,3 +3,9 @@ from rest_framework import serializers
 class ApiResponseSerializer(serializers.Serializer):
     message = serializers.CharField(required=False)
     data = serializers.JSONField(required=False)
+    meta = serializers.JSONField(required=False)
+
+
+class PageQuerySerializer(serializers.Serializer):
+    cursor = serializers.CharField(required=False, help_text="Opaque cursor from meta.next_cursor")
+    limit = serializers.IntegerField(required=False, min_value=1)
@@ -0,0 +1,131 @@
+import copy
+from functools import lru_cache
+from typing import Optional
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from apps.core.flat import FlatSerializer
+
+SPARSE_PARAMETERS = [
+    OpenApiParameter(
+        "fields",
+        OpenApiTypes.STR,
+        description="Comma separated fields to render, dotted for nested ones, e.g. id,start_at,court.name",
+    ),
+    OpenApiParameter(
+        "expand",
+        OpenApiTypes.STR,
+        description=(
+            "Comma separated relations to render as objects, e.g. court,court.prices. With fields or "
+            "expand given, relations that are not expanded render as their ids"
+        ),
+    ),
+]
+
+
+def sparse_serializer(
+    serializer_class: type[serializers.ModelSerializer], query_params
+) -> type[serializers.ModelSerializer]:
+    """
+    ``serializer_class`` trimmed to the ``fields`` and ``expand`` query
+    parameters, or ``serializer_class`` itself when neither is given.
+
+    The trimmed class only declares the requested fields, so eager() and
+    FlatSerializer derive their only() and column lists from it and the
+    SQL narrows with the payload. Unknown names are a ValidationError.
+    """
+    fields = query_params.get("fields")
+    expand = query_params.get("expand")
+    if fields is None and expand is None:
+        return serializer_class
+
+    fields_tree = _freeze(_tree(fields, "fields")) if fields is not None else None
+    return _sparse(serializer_class, fields_tree, _freeze(_tree(expand or "", "expand")), "")
+
+
+def sparse_rows(rows: FlatSerializer, query_params) -> FlatSerializer:
+    """The flat twin of sparse_serializer(rows.serializer_class, query_params)"""
+    serializer_class = sparse_serializer(rows.serializer_class, query_params)
+    return rows if serializer_class is rows.serializer_class else _flat(serializer_class)
+
+
+def fieldset_key(query_params) -> tuple:
+    """The fieldset parameters, for cache keys of responses rendered with them"""
+    return query_params.get("fields"), query_params.get("expand")
+
+
+def _tree(value: str, param: str) -> dict:
+    """``a,b.c`` as ``{"a": None, "b": {"c": None}}``, None standing for all fields"""
+    tree = {}
+    for path in value.split(","):
+        names = [name.strip() for name in path.split(".")]
+        if not all(names):
+            if path.strip():
+                raise ValidationError({param: [f"Invalid field path: {path.strip()}"]})
+            continue
+        level = tree
+        for name in names[:-1]:
+            if level.get(name, {}) is None:
+                # The whole relation was asked for already
+                break
+            level = level.setdefault(name, {})
+        else:
+            level[names[-1]] = None
+
+    if not tree and param == "fields":
+        raise ValidationError({param: ["Name at least one field"]})
+    return tree
+
+
+def _freeze(tree: Optional[dict]) -> Optional[tuple]:
+    if tree is None:
+        return None
+    return tuple(sorted((name, _freeze(subtree)) for name, subtree in tree.items()))
+
+
+@lru_cache(maxsize=512)
+def _sparse(
+    serializer_class: type[serializers.ModelSerializer], fields: Optional[tuple], expand: tuple, path: str
+) -> type[serializers.ModelSerializer]:
+    available = serializer_class().fields
+    fields_tree = dict(fields) if fields is not None else None
+    expand_tree = dict(expand)
+
+    for param, names in (("fields", fields_tree or {}), ("expand", expand_tree)):
+        unknown = [name for name in names if name not in available or available[name].write_only]
+        if unknown:
+            raise ValidationError({param: [f"Unknown field: {path}{name}" for name in unknown]})
+
+    declared = {}
+    for name, field in available.items():
+        if field.write_only or (fields_tree is not None and name not in fields_tree):
+            continue
+
+        many = isinstance(field, serializers.ListSerializer)
+        nested = field.child if many else field
+        subfields = fields_tree.get(name) if fields_tree is not None else None
+        kwargs = {} if field.source == name else {"source": field.source}
+
+        if not isinstance(nested, serializers.BaseSerializer):
+            if subfields is not None or name in expand_tree:
+                param = "fields" if subfields is not None else "expand"
+                raise ValidationError({param: [f"{path}{name} has no nested fields"]})
+            declared[name] = copy.deepcopy(field)
+        elif name in expand_tree or subfields is not None:
+            # Naming nested fields expands the relation too
+            declared[name] = _sparse(type(nested), subfields, expand_tree.get(name) or (), f"{path}{name}.")(
+                many=many, read_only=True, **kwargs
+            )
+        else:
+            declared[name] = serializers.PrimaryKeyRelatedField(many=many, read_only=True, **kwargs)
+
+    meta = type("Meta", (), {"model": serializer_class.Meta.model, "fields": list(declared)})
+    return type(serializer_class.__name__, (serializers.ModelSerializer,), {**declared, "Meta": meta})
+
+
+@lru_cache(maxsize=512)
+def _flat(serializer_class: type[serializers.ModelSerializer]) -> FlatSerializer:
+    return FlatSerializer(serializer_class)
@@ -0,0 +1,24 @@
+from django.db import connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.core.benchmarking import QUERY_COUNT_SIZES, read_paths
+
+
+class ReadPathQueryCountTests(TestCase):
+    """The read paths of check_query_counts, run at each of QUERY_COUNT_SIZES"""
+
+    def test_query_counts_do_not_grow_with_rows(self):
+        counts = {}
+        for size in QUERY_COUNT_SIZES:
+            # Each size sees only its own rows
+            with transaction.atomic():
+                for label, read in read_paths(size).items():
+                    with CaptureQueriesContext(connection) as queries:
+                        read()
+                    counts.setdefault(label, {})[size] = len(queries)
+                transaction.set_rollback(True)
+
+        for label, per_size in counts.items():
+            with self.subTest(label):
+                self.assertEqual(len(set(per_size.values())), 1, f"{label} queries per row count: {per_size}")
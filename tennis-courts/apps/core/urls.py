@@ -0,0 +1,7 @@
+from rest_framework.routers import DefaultRouter
+from apps.core.views import SystemView
+
+router = DefaultRouter()
+router.register("system", SystemView, basename="system")
+
+urlpatterns = router.urls
\ No newline at end of file
@@ -0,0 +1,51 @@
+from rest_framework.viewsets import ViewSet
+from rest_framework.decorators import action
+from rest_framework import status
+
+from drf_spectacular.utils import extend_schema
+
+from apps.core.metrics import metrics
+from apps.core.permissions import IsAdmin
+from apps.core.responses import api_response
+from apps.core.serializers import ApiResponseSerializer
+from apps.courts.services import CourtService
+from apps.reservations.services import ReservationService
+from apps.users.services import UserService
+
+
+class SystemView(ViewSet):
+    permission_classes = [IsAdmin]
+
+    @extend_schema(
+        request=None,
+        responses={200: ApiResponseSerializer},
+        summary="Get process metrics",
+        description="Counters of the worker process that serves the request",
+        tags=["system"],
+    )
+    @action(detail=False, methods=["get"], url_path="metrics")
+    def get_metrics(self, request):
+        return api_response(
+            data=metrics.snapshot(),
+            message="Metrics retrieved successfully",
+            status_code=status.HTTP_200_OK,
+        )
+
+    @extend_schema(
+        request=None,
+        responses={200: ApiResponseSerializer},
+        summary="Get dashboard counts",
+        description="Reservations, courts and users counted in the database, not from a listing page",
+        tags=["system"],
+    )
+    @action(detail=False, methods=["get"], url_path="stats")
+    def get_stats(self, request):
+        return api_response(
+            data={
+                "reservations": ReservationService.get_counts(),
+                "courts": CourtService.get_counts(),
+                "users": UserService.get_counts(),
+            },
+            message="Stats retrieved successfully",
+            status_code=status.HTTP_200_OK,
+        )
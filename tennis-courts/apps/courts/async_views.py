@@ -0,0 +1,74 @@
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+from rest_framework.exceptions import ValidationError
+
+from apps.auth_service.auth import async_login_required
+from apps.core.middleware import read_only_view
+from apps.core.renderers import render_json
+from apps.core.sparse import fieldset_key, sparse_rows, sparse_serializer
+from apps.core.responses import async_api_response
+from apps.core.serializers import PageQuerySerializer
+from apps.courts.catalog import court_catalog
+from apps.courts.models import Court
+from apps.courts.serializers import CourtReadSerializer, court_rows
+from apps.courts.services import CourtService
+
+# ASGI-native twins of CourtView's read actions: same envelope and payloads,
+# but the queries go through the async ORM so one event loop can overlap
+# many requests waiting on the database.
+
+
+@read_only_view
+@require_GET
+@async_login_required
+async def get_court(request, pk):
+    try:
+        serializer_class = sparse_serializer(CourtReadSerializer, request.GET)
+    except ValidationError as exc:
+        return JsonResponse(exc.detail, status=400)
+
+    async def load():
+        return render_json(serializer_class(await CourtService.aget_court(pk, serializer_class)).data)
+
+    try:
+        data = await court_catalog.aget_or_load(("court", str(pk), *fieldset_key(request.GET)), load)
+    except Court.DoesNotExist:
+        return JsonResponse({"message": "Court not found"}, status=404)
+
+    return async_api_response(
+        data=data,
+        message="Court retrieved successfully",
+    )
+
+
+@read_only_view
+@require_GET
+@async_login_required
+async def get_courts(request):
+    page = PageQuerySerializer(data=request.GET)
+    if not page.is_valid():
+        return JsonResponse(page.errors, status=400)
+
+    async def load():
+        courts, next_cursor = await CourtService.aget_courts(rows=rows, **page.validated_data)
+        return render_json(await rows.aserialize(courts)), next_cursor
+
+    try:
+        rows = sparse_rows(court_rows, request.GET)
+        data, next_cursor = await court_catalog.aget_or_load(
+            (
+                "page",
+                page.validated_data.get("cursor"),
+                page.validated_data.get("limit"),
+                *fieldset_key(request.GET),
+            ),
+            load,
+        )
+    except ValidationError as exc:
+        return JsonResponse(exc.detail, status=400)
+
+    return async_api_response(
+        data=data,
+        message="Court retrieved successfully",
+        meta={"next_cursor": next_cursor},
+    )
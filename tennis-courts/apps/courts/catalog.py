@@ -0,0 +1,124 @@
+import hashlib
+import threading
+import uuid
+from typing import Any, Awaitable, Callable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from apps.core.metrics import metrics
+from apps.core.routers import replica_reads
+
+VERSION_KEY = "courts:catalog:version"
+
+
+class CatalogCache:
+    """
+    Serialized court catalog responses in a Django cache, namespaced by a
+    catalog version.
+
+    Court writes replace the version instead of deleting keys, which makes
+    every cached page unreachable at once; the old entries simply expire.
+    Versions are random tokens rather than counters, so workers on
+    separate process-local caches never mistake each other's versions (and
+    ETags) for the same catalog. The version itself expires with the TTL:
+    with the default locmem backend a worker that missed a write moves to a
+    new version, and so a new ETag, within the TTL instead of reloading
+    fresh rows under its old one and answering 304 to stale copies forever.
+    A shared backend makes a write visible everywhere at once.
+
+    Entries are loaded from the primary even on replica-routed requests: a
+    replica behind a bump() would store the old catalog under the new
+    version, and serve it as 304s since the ETag is the version.
+    """
+
+    def __init__(self, alias: str, ttl: int):
+        self.alias = alias
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bumps = 0
+
+        metrics.register("court_catalog", self.stats)
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def version(self) -> str:
+        version = self.cache.get(VERSION_KEY)
+        if version is None:
+            self.cache.add(VERSION_KEY, uuid.uuid4().hex, timeout=self.ttl)
+            version = self.cache.get(VERSION_KEY)
+        return version
+
+    async def aversion(self) -> str:
+        version = await self.cache.aget(VERSION_KEY)
+        if version is None:
+            await self.cache.aadd(VERSION_KEY, uuid.uuid4().hex, timeout=self.ttl)
+            version = await self.cache.aget(VERSION_KEY)
+        return version
+
+    def get_or_load(self, key: tuple, loader: Callable[[], Any]) -> Any:
+        cache_key = self._key(self.version(), key)
+        value = self.cache.get(cache_key)
+        self._count(value is not None)
+        if value is None:
+            # A lagging replica would cache the pre-write catalog under the new version
+            with replica_reads(False):
+                value = loader()
+            self.cache.set(cache_key, value, timeout=self.ttl)
+        return value
+
+    async def aget_or_load(self, key: tuple, loader: Callable[[], Awaitable[Any]]) -> Any:
+        cache_key = self._key(await self.aversion(), key)
+        value = await self.cache.aget(cache_key)
+        self._count(value is not None)
+        if value is None:
+            with replica_reads(False):
+                value = await loader()
+            await self.cache.aset(cache_key, value, timeout=self.ttl)
+        return value
+
+    def bump(self) -> None:
+        """
+        New catalog version now and again once the current transaction
+        commits, so a page loaded from the pre-commit rows is not kept
+        """
+        self._bump()
+        transaction.on_commit(self._bump)
+
+    def _bump(self) -> None:
+        self.cache.set(VERSION_KEY, uuid.uuid4().hex, timeout=self.ttl)
+        with self._lock:
+            self.bumps += 1
+
+    @staticmethod
+    def _key(version: str, key: tuple) -> str:
+        # Cursors are arbitrary client input, keep keys short and safe for memcached
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return f"courts:catalog:{version}:{digest}"
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": self.alias,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "bumps": self.bumps,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+court_catalog = CatalogCache(settings.COURT_CATALOG_CACHE, settings.COURT_CATALOG_CACHE_TTL)
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-18 08:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courts', '0002_remove_courtprice_currency_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='court',
+            index=models.Index(fields=['created_at', 'id'], name='court_created_id_idx'),
+        ),
+    ]
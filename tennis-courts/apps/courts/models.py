@@ -30,6 +30,12 @@ class Court(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Keyset pagination order of the court listing
+            models.Index(fields=['created_at', 'id'], name='court_created_id_idx'),
+        ]
+
 class CourtPrice(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     court = models.ForeignKey(Court, on_delete=models.PROTECT, related_name='prices')
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from apps.core.flat import FlatSerializer
 from apps.courts.models import CourtPrice, Court
 
 class CourtPriceReadSerializer(serializers.ModelSerializer):
@@ -36,6 +37,9 @@ class CourtReadSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields
 
+# CourtReadSerializer for listings, rendered from values_list rows
+court_rows = FlatSerializer(CourtReadSerializer)
+
 class CourtPriceCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = CourtPrice
@@ -1,18 +1,85 @@
+from decimal import Decimal
+from typing import Optional
 from uuid import UUID
 
+from django.conf import settings
 from django.db import transaction
-
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from apps.core.cache import TTLCache
+from apps.core.eager import eager
+from apps.core.flat import FlatSerializer
+from apps.core.pagination import apaginate_keyset, paginate_keyset
+from apps.courts.catalog import court_catalog
 from apps.courts.models import Court, CourtPrice
+from apps.courts.serializers import CourtReadSerializer, court_rows
+
+price_cache = TTLCache(
+    "court_prices",
+    maxsize=settings.COURT_PRICE_CACHE_SIZE,
+    ttl=settings.COURT_PRICE_CACHE_TTL,
+)
+court_cache = TTLCache(
+    "courts",
+    maxsize=settings.MODEL_CACHE_SIZE,
+    ttl=settings.COURT_CACHE_TTL,
+)
+
+
+def _cache_key(court_id) -> UUID:
+    """Views pass the URL pk as a str, the services a UUID: both must hit the same entry"""
+    return court_id if isinstance(court_id, UUID) else UUID(str(court_id))
 
 
 class CourtService:
     @staticmethod
-    def get_court(court_id: UUID) -> Court:
-        return Court.objects.prefetch_related("prices").get(id=court_id)
+    def get_court(court_id: UUID, serializer_class=CourtReadSerializer) -> Court:
+        return eager(Court.objects, serializer_class).get(id=court_id)
+
+    @staticmethod
+    def get_courts(
+        cursor: str = None, limit: int = None, rows: FlatSerializer = court_rows
+    ) -> tuple[list[tuple], Optional[str]]:
+        """One page of court rows, rendered by ``rows``"""
+        queryset = rows.values(Court.objects.all(), "created_at", "id")
+        return paginate_keyset(queryset, ("created_at", "id"), cursor, limit)
+
+    @staticmethod
+    async def aget_court(court_id: UUID, serializer_class=CourtReadSerializer) -> Court:
+        return await eager(Court.objects, serializer_class).aget(id=court_id)
+
+    @staticmethod
+    async def aget_courts(
+        cursor: str = None, limit: int = None, rows: FlatSerializer = court_rows
+    ) -> tuple[list[tuple], Optional[str]]:
+        queryset = rows.values(Court.objects.all(), "created_at", "id")
+        return await apaginate_keyset(queryset, ("created_at", "id"), cursor, limit)
 
     @staticmethod
-    def get_courts() -> list[Court]:
-        return list(Court.objects.prefetch_related("prices").all())
+    def get_counts() -> dict:
+        return Court.objects.aggregate(total=Count("id"), active=Count("id", filter=Q(is_active=True)))
+
+    @staticmethod
+    def get_price_per_hour(court_id: UUID) -> Optional[Decimal]:
+        """Active hourly price of a court, served from the process-local cache"""
+        return price_cache.get_or_load(
+            _cache_key(court_id),
+            lambda: CourtPrice.objects.filter(court_id=court_id, is_active=True)
+            .values_list("price_per_hour", flat=True)
+            .first(),
+        )
+
+    @staticmethod
+    def get_cached_court(court_id: UUID) -> Court:
+        """Court with its prices prefetched, shared between requests: do not mutate"""
+        return court_cache.get_or_load(_cache_key(court_id), lambda: CourtService.get_court(court_id))
+
+    @staticmethod
+    def _invalidate(court_id: UUID) -> None:
+        price_cache.invalidate(_cache_key(court_id))
+        court_cache.invalidate(_cache_key(court_id))
+        court_catalog.bump()
 
     @staticmethod
     @transaction.atomic
@@ -25,8 +92,9 @@ class CourtService:
                 court=court,
                 **prices_data
             )
+        court_catalog.bump()
 
-        return Court.objects.prefetch_related("prices").get(id=court.id)
+        return eager(Court.objects, CourtReadSerializer).get(id=court.id)
 
     @staticmethod
     @transaction.atomic
@@ -37,9 +105,11 @@ class CourtService:
         if is_active is not None:
             Court.objects.filter(id=court_id).update(
                 is_active=is_active,
+                updated_at=timezone.now(),
             )
             CourtPrice.objects.filter(court_id=court_id).update(
                 is_active=is_active,
+                updated_at=timezone.now(),
             )
 
         court = CourtService.get_court(court_id)
@@ -56,6 +126,8 @@ class CourtService:
                 defaults=prices_data,
             )
 
+        CourtService._invalidate(court_id)
+
         return CourtService.get_court(court_id)
 
 
@@ -68,11 +140,14 @@ class CourtService:
 
         Court.objects.filter(id=court_id).update(
             is_active=new_state,
+            updated_at=timezone.now(),
         )
 
         CourtPrice.objects.filter(court_id=court_id).update(
             is_active=new_state,
+            updated_at=timezone.now(),
         )
+        CourtService._invalidate(court_id)
 
         return CourtService.get_court(court_id)
 
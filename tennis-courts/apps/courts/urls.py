@@ -1,7 +1,12 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
+from apps.courts import async_views
 from apps.courts.views import CourtView
 
 router = DefaultRouter()
 router.register("courts", CourtView, basename="courts")
 
-urlpatterns = router.urls
\ No newline at end of file
+urlpatterns = [
+    path("async/courts/get/", async_views.get_courts, name="async-courts-list"),
+    path("async/courts/<uuid:pk>/get/", async_views.get_court, name="async-courts-detail"),
+] + router.urls
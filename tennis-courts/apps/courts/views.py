@@ -5,10 +5,15 @@ from rest_framework.permissions import IsAuthenticated
 
 from drf_spectacular.utils import extend_schema
 
+from apps.core.conditional import conditional
+from apps.core.flat import FlatSerializer
 from apps.core.permissions import IsAdmin
+from apps.core.renderers import RawJSON, render_json
 from apps.core.responses import api_response
-from apps.core.serializers import ApiResponseSerializer
-from apps.courts.serializers import CourtCreateSerializer, CourtReadSerializer, CourtUpdateSerializer
+from apps.core.serializers import ApiResponseSerializer, PageQuerySerializer
+from apps.core.sparse import SPARSE_PARAMETERS, fieldset_key, sparse_rows, sparse_serializer
+from apps.courts.catalog import court_catalog
+from apps.courts.serializers import CourtCreateSerializer, CourtReadSerializer, CourtUpdateSerializer, court_rows
 from apps.courts.services import CourtService
 
 
@@ -29,37 +34,61 @@ class CourtView(ViewSet):
 
     @extend_schema(
         request=None,
+        parameters=SPARSE_PARAMETERS,
         responses={200: ApiResponseSerializer},
         summary="Get court",
         tags=["courts"],
     )
     @action(detail=True, methods=["get"], url_path="get")
+    @conditional(lambda request, pk=None: court_catalog.version())
     def get_court(self, request, pk=None):
-        court = self.service.get_court(pk)
+        serializer_class = sparse_serializer(CourtReadSerializer, request.query_params)
+        data = court_catalog.get_or_load(
+            ("court", pk, *fieldset_key(request.query_params)),
+            lambda: render_json(serializer_class(self.service.get_court(pk, serializer_class)).data),
+        )
 
         return api_response(
-            data=CourtReadSerializer(court).data,
+            data=data,
             message="Court retrieved successfully",
             status_code=status.HTTP_200_OK,
         )
 
     @extend_schema(
         request=None,
+        parameters=[PageQuerySerializer, *SPARSE_PARAMETERS],
         responses={200: ApiResponseSerializer},
         summary="Get courts",
         tags=["courts"],
     )
     @action(detail=False, methods=["get"], url_path="get")
+    @conditional(lambda request: court_catalog.version())
     def get_courts(self, request):
-        courts = self.service.get_courts()
-        serializer = CourtReadSerializer(courts, many=True)
+        page = PageQuerySerializer(data=request.query_params)
+        page.is_valid(raise_exception=True)
+
+        rows = sparse_rows(court_rows, request.query_params)
+        data, next_cursor = court_catalog.get_or_load(
+            (
+                "page",
+                page.validated_data.get("cursor"),
+                page.validated_data.get("limit"),
+                *fieldset_key(request.query_params),
+            ),
+            lambda: self._courts_page(rows=rows, **page.validated_data),
+        )
 
         return api_response(
-            data=serializer.data,
+            data=data,
             message="Court retrieved successfully",
             status_code=status.HTTP_200_OK,
+            meta={"next_cursor": next_cursor},
         )
 
+    def _courts_page(self, rows: FlatSerializer, cursor: str = None, limit: int = None) -> tuple[RawJSON, str]:
+        courts, next_cursor = self.service.get_courts(cursor=cursor, limit=limit, rows=rows)
+        return render_json(rows.serialize(courts)), next_cursor
+
     @extend_schema(
         request=CourtCreateSerializer,
         responses={200: ApiResponseSerializer},
@@ -0,0 +1,117 @@
+import logging
+import random
+import smtplib
+from datetime import timedelta
+
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from apps.emails.models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+# Errors after which the SMTP connection is not worth reusing
+CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+
+class OutboxSender:
+    """
+    Drains the email outbox in batches over a single reused mail connection.
+
+    Due pending rows are claimed with ``SELECT ... FOR UPDATE SKIP LOCKED``,
+    so several senders can run side by side without sending twice. A failed
+    message is retried with exponential backoff and jitter until
+    ``max_attempts`` is reached, then it is marked as failed.
+    """
+
+    def __init__(self, batch_size: int = 100, max_attempts: int = 5,
+                 backoff_base: float = 30, backoff_max: float = 3600, connection=None):
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.connection = connection or get_connection()
+        self._open = False
+
+    def close(self) -> None:
+        if self._open:
+            try:
+                self.connection.close()
+            finally:
+                self._open = False
+
+    def backoff(self, attempts: int) -> timedelta:
+        delay = min(self.backoff_base * 2 ** (attempts - 1), self.backoff_max)
+        return timedelta(seconds=delay * random.uniform(0.5, 1))
+
+    def drain(self) -> tuple[int, int]:
+        """Send every due email, returns the number of sent and failed attempts"""
+        sent = failed = 0
+        while True:
+            batch_sent, batch_failed = self.send_batch()
+            sent += batch_sent
+            failed += batch_failed
+            if batch_sent + batch_failed < self.batch_size:
+                return sent, failed
+
+    @transaction.atomic
+    def send_batch(self) -> tuple[int, int]:
+        emails = list(
+            OutboxEmail.objects.select_for_update(skip_locked=True)
+            .filter(status=OutboxEmail.OutboxStatus.PENDING, next_attempt_at__lte=timezone.now())
+            .order_by("next_attempt_at")[: self.batch_size]
+        )
+        if not emails:
+            return 0, 0
+
+        # An unreachable server fails the whole batch before any attempt is
+        # counted, the rows are released and retried on the next poll
+        self._ensure_open()
+
+        sent = failed = 0
+        for email in emails:
+            email.attempts += 1
+            try:
+                self._send(email)
+            except Exception as exc:
+                failed += 1
+                self._record_failure(email, exc)
+                if isinstance(exc, CONNECTION_ERRORS):
+                    self.close()
+            else:
+                sent += 1
+                email.status = OutboxEmail.OutboxStatus.SENT
+                email.sent_at = timezone.now()
+                email.last_error = None
+
+        OutboxEmail.objects.bulk_update(
+            emails, ["status", "attempts", "next_attempt_at", "last_error", "sent_at"]
+        )
+        return sent, failed
+
+    def _ensure_open(self) -> None:
+        if not self._open:
+            self.connection.open()
+            self._open = True
+
+    def _send(self, email: OutboxEmail) -> None:
+        self._ensure_open()
+        message = EmailMessage(
+            email.subject,
+            email.body,
+            email.from_email,
+            email.recipients,
+            connection=self.connection,
+        )
+        if not self.connection.send_messages([message]):
+            raise smtplib.SMTPException("Message was not accepted")
+
+    def _record_failure(self, email: OutboxEmail, exc: Exception) -> None:
+        email.last_error = f"{type(exc).__name__}: {exc}"
+        if email.attempts >= self.max_attempts:
+            email.status = OutboxEmail.OutboxStatus.FAILED
+            logger.error("Giving up on outbox email %s: %s", email.id, email.last_error)
+        else:
+            email.next_attempt_at = timezone.now() + self.backoff(email.attempts)
+            logger.warning("Outbox email %s failed, retrying: %s", email.id, email.last_error)
@@ -1,8 +1,38 @@
-from django.core.mail import send_mail
 from django.conf import settings
 
+from apps.emails.models import OutboxEmail
+
 
 class EmailService:
+    @staticmethod
+    def enqueue(subject: str, message: str, recipients: list[str]) -> OutboxEmail:
+        """
+        Store the email in the outbox, in the caller's transaction.
+
+        Nothing talks to SMTP on the request path: the send_outbox_emails
+        worker delivers committed rows, so a rolled back booking never sends
+        mail and a slow mail server never holds row locks.
+        """
+        return OutboxEmail.objects.create(
+            subject=subject,
+            body=message,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            recipients=recipients,
+        )
+
+    @staticmethod
+    def enqueue_many(emails) -> list[OutboxEmail]:
+        """Store ``(subject, message, recipients)`` triples in the outbox with one INSERT"""
+        return OutboxEmail.objects.bulk_create(
+            OutboxEmail(
+                subject=subject,
+                body=message,
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                recipients=recipients,
+            )
+            for subject, message, recipients in emails
+        )
+
     @staticmethod
     def send_welcome_email(user):
         subject = 'Welcome to Tennis Courts Reservation System'
@@ -19,16 +49,14 @@ You can now log in and start making reservations for our tennis courts.
 
 Thank you for joining us!
 """
-        send_mail(
-            subject,
-            message,
-            settings.DEFAULT_FROM_EMAIL,
-            [user.email],
-            fail_silently=False,
-        )
+        EmailService.enqueue(subject, message, [user.email])
 
     @staticmethod
     def send_reservation_confirmation(reservation):
+        EmailService.enqueue(*EmailService._reservation_confirmation(reservation), [reservation.user.email])
+
+    @staticmethod
+    def _reservation_confirmation(reservation):
         subject = f'Reservation Confirmation - {reservation.court.name}'
         message = f"""
 Hello {reservation.user.first_name or reservation.user.email},
@@ -48,21 +76,64 @@ Status: {reservation.status.upper()}
 
 Thank you for choosing our tennis courts!
 """
-        send_mail(
-            subject,
-            message,
-            settings.DEFAULT_FROM_EMAIL,
-            [reservation.user.email],
-            fail_silently=False,
+        return subject, message
+
+    @staticmethod
+    def send_reservation_series_confirmation(user, court, reservations):
+        subject = f'Reservation Series Confirmation - {court.name}'
+        dates = "\n".join(
+            f"- {reservation.start_at.strftime('%Y-%m-%d')} "
+            f"{reservation.start_at.strftime('%H:%M')} - {reservation.end_at.strftime('%H:%M')}"
+            for reservation in reservations
         )
+        total_amount = sum(reservation.total_amount for reservation in reservations)
+        message = f"""
+Hello {user.first_name or user.email},
+
+Your reservation series has been created!
+
+Court: {court.name}
+Address: {court.street}, {court.city} {court.postal_code}
+Reservations ({len(reservations)}):
+{dates}
+Total Amount: ${total_amount}
+
+Thank you for choosing our tennis courts!
+"""
+        EmailService.enqueue(subject, message, [user.email])
 
     @staticmethod
     def send_reservation_cancellation(reservation):
+        EmailService.enqueue(*EmailService._reservation_cancellation(reservation), [reservation.user.email])
+
+    @staticmethod
+    def send_reservation_notices(reservations, status):
+        """Queue the confirmation or cancellation notices of many reservations with a single INSERT"""
+        if status == 'confirmed':
+            render = EmailService._reservation_confirmation
+        else:
+            render = EmailService._reservation_cancellation
+
+        EmailService.enqueue_many(
+            (*render(reservation), [reservation.user.email]) for reservation in reservations
+        )
+
+    @staticmethod
+    def send_reservation_expiry_notices(reservations):
+        """Queue the cancellation notices of expired holds with a single INSERT"""
+        reason = "It was not confirmed in time and the court has been released."
+        EmailService.enqueue_many(
+            (*EmailService._reservation_cancellation(reservation, reason), [reservation.user.email])
+            for reservation in reservations
+        )
+
+    @staticmethod
+    def _reservation_cancellation(reservation, reason=''):
         subject = f'Reservation Canceled - {reservation.court.name}'
         message = f"""
 Hello {reservation.user.first_name or reservation.user.email},
 
-Your reservation has been canceled.
+Your reservation has been canceled.{f' {reason}' if reason else ''}
 
 Court: {reservation.court.name}
 Date: {reservation.start_at.strftime('%Y-%m-%d')}
@@ -70,10 +141,4 @@ Time: {reservation.start_at.strftime('%H:%M')} - {reservation.end_at.strftime('%
 
 If you have any questions, please contact us.
 """
-        send_mail(
-            subject,
-            message,
-            settings.DEFAULT_FROM_EMAIL,
-            [reservation.user.email],
-            fail_silently=False,
-        )
+        return subject, message
@@ -0,0 +1,116 @@
+from datetime import timedelta
+
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+from rest_framework.exceptions import ValidationError
+
+from apps.auth_service.auth import async_login_required
+from apps.core.middleware import read_only_view
+from apps.core.responses import async_api_response
+from apps.core.serializers import PageQuerySerializer
+from apps.core.sparse import sparse_rows
+from apps.reservations.serializers import (
+    CourtCalendarQuerySerializer,
+    FreeSlotSearchSerializer,
+    FreeSlotSerializer,
+    OccupancyQuerySerializer,
+    reservation_rows,
+)
+from apps.reservations.services import ReservationService
+from apps.reservations.views import calendar_data, occupancy_data
+
+# ASGI-native twins of ReservationView's read actions: same envelope and
+# payloads, but the queries go through the async ORM so one event loop can
+# overlap many requests waiting on the database.
+
+
+@read_only_view
+@require_GET
+@async_login_required
+async def get_reservations(request):
+    page = PageQuerySerializer(data=request.GET)
+    if not page.is_valid():
+        return JsonResponse(page.errors, status=400)
+
+    user_id = request.user.id if request.user.role == "user" else None
+    try:
+        rows = sparse_rows(reservation_rows, request.GET)
+        reservations, next_cursor = await ReservationService.aget_reservations(
+            user_id=user_id, rows=rows, **page.validated_data
+        )
+    except ValidationError as exc:
+        return JsonResponse(exc.detail, status=400)
+
+    return async_api_response(
+        data=await rows.aserialize(reservations),
+        message="Reservations retrieved successfully",
+        meta={"next_cursor": next_cursor},
+    )
+
+
+@read_only_view
+@require_GET
+@async_login_required
+async def get_court_reservations(request, court_id):
+    serializer = CourtCalendarQuerySerializer(data=request.GET)
+    if not serializer.is_valid():
+        return JsonResponse(serializer.errors, status=400)
+
+    date_from = serializer.validated_data["date_from"]
+    date_to = serializer.validated_data["date_to"]
+    days = await ReservationService.aget_court_calendar(court_id, date_from, date_to)
+
+    return async_api_response(
+        data=calendar_data(court_id, date_from, date_to, days),
+        message="Court reservations retrieved successfully",
+    )
+
+
+@read_only_view
+@require_GET
+@async_login_required
+async def find_free_slots(request):
+    serializer = FreeSlotSearchSerializer(data=request.GET)
+    if not serializer.is_valid():
+        return JsonResponse(serializer.errors, status=400)
+
+    params = serializer.validated_data
+    slots = await ReservationService.afind_free_slots(
+        date_from=params["date_from"],
+        date_to=params["date_to"],
+        duration=timedelta(minutes=params["duration"]),
+        count=params["count"],
+        city=params.get("city"),
+        surface=params.get("surface"),
+        court_type=params.get("court_type"),
+    )
+
+    return async_api_response(
+        data=FreeSlotSerializer(slots, many=True).data,
+        message="Free slots retrieved successfully",
+    )
+
+
+@read_only_view
+@require_GET
+@async_login_required
+async def get_occupancy(request):
+    serializer = OccupancyQuerySerializer(data=request.GET)
+    if not serializer.is_valid():
+        return JsonResponse(serializer.errors, status=400)
+
+    params = serializer.validated_data
+    occupancy = await ReservationService.aget_occupancy(
+        date_from=params["date_from"],
+        date_to=params["date_to"],
+        slot_minutes=params["slot"],
+        court_id=params.get("court_id"),
+        city=params.get("city"),
+        surface=params.get("surface"),
+        court_type=params.get("court_type"),
+    )
+
+    return async_api_response(
+        data=occupancy_data(params, occupancy),
+        message="Occupancy retrieved successfully",
+    )
@@ -0,0 +1,140 @@
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from uuid import UUID
+
+from django.conf import settings
+from django.utils import timezone
+
+from apps.reservations.models import ACTIVE_STATUSES, Reservation
+
+
+class CourtIntervals:
+    """Sorted start/end arrays of the active reservations of a single court"""
+
+    def __init__(self, intervals=()):
+        self.spans = {}
+        for reservation_id, start_at, end_at in intervals:
+            self.spans[reservation_id] = (start_at, end_at)
+
+        self.starts = sorted(start_at for start_at, _ in self.spans.values())
+        self.ends = sorted(end_at for _, end_at in self.spans.values())
+        self.loaded_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def add(self, reservation_id: UUID, start_at: datetime, end_at: datetime) -> None:
+        self.discard(reservation_id)
+        self.spans[reservation_id] = (start_at, end_at)
+        insort(self.starts, start_at)
+        insort(self.ends, end_at)
+
+    def discard(self, reservation_id: UUID) -> None:
+        span = self.spans.pop(reservation_id, None)
+        if span is None:
+            return
+
+        start_at, end_at = span
+        del self.starts[bisect_left(self.starts, start_at)]
+        del self.ends[bisect_left(self.ends, end_at)]
+
+    def count_overlapping(self, start_at: datetime, end_at: datetime) -> int:
+        # Every interval starting before end_at overlaps the window unless it
+        # has already ended by start_at, and those are counted by the second
+        # bisect. Works for overlapping intervals too.
+        return bisect_left(self.starts, end_at) - bisect_right(self.ends, start_at)
+
+    def is_available(
+        self,
+        start_at: datetime,
+        end_at: datetime,
+        exclude_reservation_id: UUID = None,
+    ) -> bool:
+        overlapping = self.count_overlapping(start_at, end_at)
+
+        if exclude_reservation_id is not None:
+            span = self.spans.get(exclude_reservation_id)
+            if span and span[0] < end_at and span[1] > start_at:
+                overlapping -= 1
+
+        return overlapping == 0
+
+
+class AvailabilityIndex:
+    """
+    Process-local availability engine.
+
+    Courts are loaded lazily from the database on first use and reloaded
+    after ``ttl`` seconds, so writes made by other processes are picked up
+    eventually. Writes made through ``ReservationService`` in this process
+    are applied right after commit. The index is only a fast path: the
+    exclusion constraint on the reservations table stays the final authority.
+    """
+
+    def __init__(self, enabled: bool, ttl: int):
+        self.enabled = enabled
+        self.ttl = ttl
+        self._courts: dict[UUID, CourtIntervals] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, court_id: UUID) -> CourtIntervals:
+        rows = Reservation.objects.filter(
+            court_id=court_id,
+            status__in=ACTIVE_STATUSES,
+            end_at__gt=timezone.now(),
+        ).values_list("id", "start_at", "end_at")
+        return CourtIntervals(rows)
+
+    def court(self, court_id: UUID) -> CourtIntervals:
+        court_id = UUID(str(court_id))
+
+        with self._lock:
+            intervals = self._courts.get(court_id)
+
+        if intervals is None or time.monotonic() - intervals.loaded_at > self.ttl:
+            intervals = self._load(court_id)
+            with self._lock:
+                self._courts[court_id] = intervals
+
+        return intervals
+
+    def is_available(
+        self,
+        court_id: UUID,
+        start_at: datetime,
+        end_at: datetime,
+        exclude_reservation_id: UUID = None,
+    ) -> bool:
+        if exclude_reservation_id is not None:
+            exclude_reservation_id = UUID(str(exclude_reservation_id))
+
+        intervals = self.court(court_id)
+        with self._lock:
+            return intervals.is_available(start_at, end_at, exclude_reservation_id)
+
+    def record(self, reservation: Reservation) -> None:
+        """Apply a committed reservation write to an already loaded court"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            intervals = self._courts.get(UUID(str(reservation.court_id)))
+            if intervals is None:
+                return
+
+            if reservation.status in ACTIVE_STATUSES:
+                intervals.add(reservation.id, reservation.start_at, reservation.end_at)
+            else:
+                intervals.discard(reservation.id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._courts.clear()
+
+
+availability_index = AvailabilityIndex(
+    enabled=settings.RESERVATION_AVAILABILITY_INDEX,
+    ttl=settings.RESERVATION_AVAILABILITY_INDEX_TTL,
+)
@@ -0,0 +1,153 @@
+import asyncio
+import itertools
+import json
+import threading
+from collections import deque
+from typing import Iterable
+from uuid import UUID
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from apps.core.metrics import metrics
+
+CREATED = "reservation.created"
+UPDATED = "reservation.updated"
+CONFIRMED = "reservation.confirmed"
+CANCELED = "reservation.canceled"
+
+
+class Subscription:
+    """
+    One streaming client: a bounded buffer of ready-made SSE frames owned by
+    the event loop that serves it.
+
+    Kept deliberately small since thousands sit idle per process: a deque and
+    a future that only exists while the stream waits. A client that falls
+    ``maxsize`` frames behind loses its buffer and is told to resync, so a
+    stalled connection never holds an unbounded backlog.
+    """
+
+    __slots__ = ("court_ids", "loop", "maxsize", "frames", "lagged", "_waiter")
+
+    def __init__(self, court_ids: set[UUID], maxsize: int):
+        self.court_ids = court_ids
+        self.loop = asyncio.get_running_loop()
+        self.maxsize = maxsize
+        self.frames = deque()
+        self.lagged = False
+        self._waiter = None
+
+    def deliver(self, frame: str) -> None:
+        # Runs on self.loop, handed over by the publishing thread
+        if self.lagged:
+            return
+        if len(self.frames) >= self.maxsize:
+            self.lagged = True
+            self.frames.clear()
+        else:
+            self.frames.append(frame)
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def next_frame(self) -> str:
+        while not self.frames and not self.lagged:
+            self._waiter = self.loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+        if self.lagged:
+            self.lagged = False
+            return "event: resync\ndata: {}\n\n"
+        return self.frames.popleft()
+
+
+def _deliver_all(subscriptions: list[Subscription], frame: str) -> None:
+    for subscription in subscriptions:
+        subscription.deliver(frame)
+
+
+class CalendarBroker:
+    """
+    In-process fan-out of committed reservation changes to SSE subscribers.
+
+    Publishing happens in ``transaction.on_commit`` hooks on whatever thread
+    served the write; each frame is rendered once and handed to the
+    subscribers' event loops with ``call_soon_threadsafe``. Idle subscribers
+    are just parked coroutines, no thread per connection. Only clients
+    connected to this process see its events: with several workers, put a
+    shared broker behind the same publish call.
+    """
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.published = 0
+
+        metrics.register("calendar_events", self.stats)
+
+    def subscribe(self, court_ids: Iterable[UUID]) -> Subscription:
+        subscription = Subscription(set(court_ids), self.queue_size)
+        with self._lock:
+            for court_id in subscription.court_ids:
+                self._subscribers.setdefault(court_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            for court_id in subscription.court_ids:
+                subscribers = self._subscribers.get(court_id)
+                if subscribers is None:
+                    continue
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[court_id]
+
+    def publish(self, event: str, reservation) -> None:
+        court_id = UUID(str(reservation.court_id))
+        with self._lock:
+            subscribers = list(self._subscribers.get(court_id, ()))
+            self.published += 1
+        if not subscribers:
+            return
+
+        data = json.dumps(
+            {
+                "court_id": court_id,
+                "reservation": {
+                    "id": reservation.id,
+                    "start_at": reservation.start_at,
+                    "end_at": reservation.end_at,
+                    "status": reservation.status,
+                },
+            },
+            cls=DjangoJSONEncoder,
+        )
+        frame = f"id: {next(self._ids)}\nevent: {event}\ndata: {data}\n\n"
+
+        # One wake-up per event loop rather than per subscriber
+        by_loop = {}
+        for subscription in subscribers:
+            by_loop.setdefault(subscription.loop, []).append(subscription)
+        for loop, subscriptions in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_deliver_all, subscriptions, frame)
+            except RuntimeError:
+                # The loop is gone, its stream cleanup will unsubscribe
+                pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            subscriptions = {id(s) for subscribers in self._subscribers.values() for s in subscribers}
+            return {
+                "subscribers": len(subscriptions),
+                "courts": len(self._subscribers),
+                "published": self.published,
+            }
+
+
+calendar_broker = CalendarBroker(queue_size=settings.RESERVATION_EVENTS_QUEUE_SIZE)
@@ -0,0 +1,52 @@
+import heapq
+from datetime import datetime, timedelta
+
+from apps.reservations.models import Reservation
+
+
+class ExpiryScheduler:
+    """
+    Min-heap of upcoming hold deadlines, so the sweeper sleeps until the next
+    hold actually expires instead of polling the table.
+
+    Deadlines are loaded ``lookahead`` at a time from the pending hold index.
+    With a constant TTL every new hold expires after the ones already known,
+    so the heap only needs refilling once it runs empty. Deadlines are hints:
+    the sweep query decides what is expired, and a hold that was confirmed in
+    the meantime just costs an empty sweep.
+    """
+
+    def __init__(self, ttl: timedelta, lookahead: int = 1000):
+        self.ttl = ttl
+        self.lookahead = lookahead
+        self._deadlines = []
+        self._horizon = None
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def refill(self) -> None:
+        pending = Reservation.objects.filter(status=Reservation.ReservationStatus.PENDING)
+        if self._horizon is not None:
+            pending = pending.filter(created_at__gt=self._horizon)
+
+        created = list(
+            pending.order_by("created_at").values_list("created_at", flat=True)[: self.lookahead]
+        )
+        for created_at in created:
+            heapq.heappush(self._deadlines, created_at + self.ttl)
+        if created:
+            self._horizon = created[-1]
+
+    def next_deadline(self) -> datetime | None:
+        if not self._deadlines:
+            self.refill()
+        return self._deadlines[0] if self._deadlines else None
+
+    def pop_due(self, now: datetime) -> int:
+        """Drop every deadline that has passed, returns how many there were"""
+        due = 0
+        while self._deadlines and self._deadlines[0] <= now:
+            heapq.heappop(self._deadlines)
+            due += 1
+        return due
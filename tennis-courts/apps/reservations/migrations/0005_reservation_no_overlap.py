@@ -0,0 +1,70 @@
+# Generated by Django 6.0 on 2026-10-18 08:34
+
+import apps.reservations.models
+import django.contrib.postgres.constraints
+import django.contrib.postgres.operations
+import django.contrib.postgres.fields.ranges
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Case, Exists, OuterRef, Value, When
+from django.utils import timezone
+
+ACTIVE = ['pending', 'confirmed']
+
+
+def resolve_overlaps(apps, schema_editor):
+    """
+    Clear existing double bookings so the constraint can be added: per court,
+    confirmed reservations first and then the oldest pending ones are kept,
+    pending ones overlapping a kept reservation are canceled. Overlapping
+    confirmed reservations are not chosen between: the migration stops and
+    lists them.
+    """
+    Reservation = apps.get_model('reservations', 'Reservation')
+    active = Reservation.objects.filter(status__in=ACTIVE)
+    overlapping = active.filter(
+        court=OuterRef('court'), start_at__lt=OuterRef('end_at'), end_at__gt=OuterRef('start_at')
+    ).exclude(pk=OuterRef('pk'))
+    conflicting = (
+        active.filter(Exists(overlapping))
+        .annotate(rank=Case(When(status='confirmed', then=Value(0)), default=Value(1)))
+        .order_by('court_id', 'rank', 'created_at', 'id')
+        .values_list('id', 'court_id', 'status', 'start_at', 'end_at')
+    )
+
+    kept, canceled, unresolved = {}, [], []
+    for id, court_id, status, start_at, end_at in conflicting:
+        court_kept = kept.setdefault(court_id, [])
+        clash = next((other for other in court_kept if other[1] < end_at and start_at < other[2]), None)
+        if clash is None:
+            court_kept.append((id, start_at, end_at))
+        elif status == 'pending':
+            canceled.append(id)
+        else:
+            unresolved.append((clash[0], id))
+
+    if unresolved:
+        pairs = '\n'.join(f'  {first} overlaps {second}' for first, second in unresolved)
+        raise RuntimeError(
+            f'Cannot add reservation_no_overlap, confirmed reservations overlap on the same court '
+            f'({len(unresolved)} pairs). Cancel or move one of each pair, then migrate again:\n{pairs}'
+        )
+    Reservation.objects.filter(id__in=canceled).update(status='canceled', updated_at=timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courts', '0002_remove_courtprice_currency_and_more'),
+        ('reservations', '0004_alter_reservation_additional_info'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.BtreeGistExtension(),
+        migrations.RunPython(resolve_overlaps, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='reservation',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(condition=models.Q(('status__in', ['pending', 'confirmed'])), expressions=[(apps.reservations.models.TsTzRange('start_at', 'end_at', django.contrib.postgres.fields.ranges.RangeBoundary()), '&&'), ('court', '=')], name='reservation_no_overlap'),
+        ),
+    ]
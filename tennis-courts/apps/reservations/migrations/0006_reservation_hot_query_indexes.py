@@ -0,0 +1,24 @@
+# Generated by Django 6.0 on 2026-10-18 08:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courts', '0002_remove_courtprice_currency_and_more'),
+        ('reservations', '0005_reservation_no_overlap'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(condition=models.Q(('status__in', ['pending', 'confirmed'])), fields=['court', 'start_at', 'end_at'], name='reservation_court_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['user', 'start_at'], name='reservation_user_start_idx'),
+        ),
+    ]
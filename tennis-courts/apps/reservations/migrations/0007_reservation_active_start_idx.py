@@ -0,0 +1,20 @@
+# Generated by Django 6.0 on 2026-10-18 08:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courts', '0002_remove_courtprice_currency_and_more'),
+        ('reservations', '0006_reservation_hot_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(condition=models.Q(('status__in', ['pending', 'confirmed'])), fields=['start_at'], name='reservation_active_start_idx'),
+        ),
+    ]
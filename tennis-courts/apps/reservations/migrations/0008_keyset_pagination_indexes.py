@@ -0,0 +1,20 @@
+# Generated by Django 6.0 on 2026-10-18 08:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courts', '0003_keyset_pagination_indexes'),
+        ('reservations', '0007_reservation_active_start_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['start_at', 'id'], name='reservation_start_id_idx'),
+        ),
+    ]
@@ -1,11 +1,26 @@
 import uuid
 
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import DateTimeRangeField, RangeBoundary, RangeOperators
 from django.db import models
 from django.core.validators import MinValueValidator
 
 from apps.courts.models import Court
 from apps.users.models import User
 
+NO_OVERLAP_CONSTRAINT = 'reservation_no_overlap'
+ACTIVE_STATUSES = ('pending', 'confirmed')
+# Target status -> statuses it can be reached from
+STATUS_TRANSITIONS = {
+    'confirmed': ('pending',),
+    'canceled': ('pending', 'confirmed'),
+}
+
+
+class TsTzRange(models.Func):
+    function = 'TSTZRANGE'
+    output_field = DateTimeRangeField()
+
 
 class Reservation(models.Model):
     class ReservationStatus(models.TextChoices):
@@ -25,3 +40,39 @@ class Reservation(models.Model):
     end_at = models.DateTimeField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            ExclusionConstraint(
+                name=NO_OVERLAP_CONSTRAINT,
+                expressions=[
+                    (TsTzRange('start_at', 'end_at', RangeBoundary()), RangeOperators.OVERLAPS),
+                    ('court', RangeOperators.EQUAL),
+                ],
+                condition=models.Q(status__in=['pending', 'confirmed']),
+            ),
+        ]
+        indexes = [
+            # Availability checks and court calendars only look at active rows
+            models.Index(
+                fields=['court', 'start_at', 'end_at'],
+                name='reservation_court_active_idx',
+                condition=models.Q(status__in=['pending', 'confirmed']),
+            ),
+            models.Index(fields=['user', 'start_at'], name='reservation_user_start_idx'),
+            # Keyset pagination order of the reservation listing
+            models.Index(fields=['start_at', 'id'], name='reservation_start_id_idx'),
+            # Lets the free-slot sweep stream active rows of many courts in
+            # start order without sorting the whole window first
+            models.Index(
+                fields=['start_at'],
+                name='reservation_active_start_idx',
+                condition=models.Q(status__in=['pending', 'confirmed']),
+            ),
+            # Oldest pending holds first for the expiry sweeper
+            models.Index(
+                fields=['created_at'],
+                name='reservation_pending_hold_idx',
+                condition=models.Q(status='pending'),
+            ),
+        ]
@@ -0,0 +1,105 @@
+import base64
+from datetime import date, datetime, time, timedelta
+from functools import reduce
+from typing import Iterable
+from uuid import UUID
+
+from django.utils import timezone
+
+SLOT_MINUTES = (15, 30)
+
+
+class SlotBitmap:
+    """
+    Occupancy of one court-day, one bit per slot: slot ``i`` is bit ``i % 8``
+    of byte ``i // 8``. Set bits are taken slots.
+
+    Combining bitmaps goes through Python ints, so AND/OR over a whole day is
+    a single big-int operation instead of a loop over slots.
+    """
+
+    __slots__ = ("slots", "data")
+
+    def __init__(self, slots: int, data: bytes = None):
+        self.slots = slots
+        self.data = bytearray(data) if data is not None else bytearray((slots + 7) // 8)
+
+    @classmethod
+    def from_int(cls, slots: int, value: int) -> "SlotBitmap":
+        value &= (1 << slots) - 1
+        return cls(slots, value.to_bytes((slots + 7) // 8, "little"))
+
+    def as_int(self) -> int:
+        return int.from_bytes(self.data, "little")
+
+    def fill(self, first: int, last: int) -> None:
+        """Mark slots ``first`` (inclusive) to ``last`` (exclusive) as taken"""
+        if first >= last:
+            return
+        value = self.as_int() | (((1 << (last - first)) - 1) << first)
+        self.data[:] = value.to_bytes(len(self.data), "little")
+
+    def __getitem__(self, slot: int) -> bool:
+        return bool(self.data[slot // 8] >> (slot % 8) & 1)
+
+    def __and__(self, other: "SlotBitmap") -> "SlotBitmap":
+        return SlotBitmap.from_int(self.slots, self.as_int() & other.as_int())
+
+    def __or__(self, other: "SlotBitmap") -> "SlotBitmap":
+        return SlotBitmap.from_int(self.slots, self.as_int() | other.as_int())
+
+    def __invert__(self) -> "SlotBitmap":
+        return SlotBitmap.from_int(self.slots, ~self.as_int())
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, SlotBitmap) and (self.slots, self.data) == (other.slots, other.data)
+
+    def encode(self) -> str:
+        return base64.b64encode(self.data).decode()
+
+
+def all_of(bitmaps: Iterable[SlotBitmap], slots: int) -> SlotBitmap:
+    """Slots set in every bitmap, e.g. taken on every court"""
+    return SlotBitmap.from_int(slots, reduce(lambda acc, bitmap: acc & bitmap.as_int(), bitmaps, -1))
+
+
+def any_of(bitmaps: Iterable[SlotBitmap], slots: int) -> SlotBitmap:
+    """Slots set in at least one bitmap"""
+    return SlotBitmap.from_int(slots, reduce(lambda acc, bitmap: acc | bitmap.as_int(), bitmaps, 0))
+
+
+def build_occupancy(
+    rows: Iterable[tuple[UUID, datetime, datetime]],
+    court_ids: Iterable[UUID],
+    date_from: date,
+    date_to: date,
+    slot_minutes: int,
+) -> dict[UUID, dict[date, SlotBitmap]]:
+    """
+    Per-court, per-day bitmaps from ``(court_id, start_at, end_at)`` rows,
+    ``date_to`` exclusive.
+
+    Slots follow local wall-clock time, the same grid the calendar shows, and
+    a slot is taken as soon as any part of it is booked.
+    """
+    slot = timedelta(minutes=slot_minutes)
+    slots = (24 * 60) // slot_minutes
+    days = [date_from + timedelta(days=offset) for offset in range((date_to - date_from).days)]
+    occupancy = {court_id: {day: SlotBitmap(slots) for day in days} for court_id in court_ids}
+
+    for court_id, start_at, end_at in rows:
+        start_at = timezone.localtime(start_at).replace(tzinfo=None)
+        end_at = timezone.localtime(end_at).replace(tzinfo=None)
+
+        day = max(start_at.date(), date_from)
+        while day < date_to:
+            midnight = datetime.combine(day, time.min)
+            if end_at <= midnight:
+                break
+
+            first = max(0, (start_at - midnight) // slot)
+            last = min(slots, -((midnight - end_at) // slot))
+            occupancy[court_id][day].fill(first, last)
+            day += timedelta(days=1)
+
+    return occupancy
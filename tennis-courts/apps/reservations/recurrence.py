@@ -0,0 +1,40 @@
+from datetime import date, datetime, timedelta
+
+from django.utils import timezone
+
+ALL_OR_NOTHING = "all_or_nothing"
+BEST_EFFORT = "best_effort"
+SERIES_MODES = (ALL_OR_NOTHING, BEST_EFFORT)
+
+FREQUENCIES = {
+    "weekly": timedelta(weeks=1),
+    "biweekly": timedelta(weeks=2),
+}
+
+
+def expand_occurrences(
+    start_at: datetime,
+    end_at: datetime,
+    frequency: str,
+    until: date,
+    skip_dates: list[date] = (),
+) -> list[tuple[datetime, datetime]]:
+    """
+    Expand a recurrence rule into ``(start_at, end_at)`` pairs.
+
+    Steps are taken in local time, so a weekly 18:00 booking stays at 18:00
+    across DST changes.
+    """
+    step = FREQUENCIES[frequency]
+    skip_dates = set(skip_dates)
+    start_at = timezone.localtime(start_at)
+    end_at = timezone.localtime(end_at)
+
+    occurrences = []
+    while start_at.date() <= until:
+        if start_at.date() not in skip_dates:
+            occurrences.append((start_at, end_at))
+        start_at += step
+        end_at += step
+
+    return occurrences
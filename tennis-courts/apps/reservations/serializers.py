@@ -1,8 +1,24 @@
+import calendar
+from datetime import timedelta
+
+from django.utils import timezone
 from rest_framework import serializers
-from apps.reservations.models import Reservation
+from apps.core.flat import FlatSerializer
+from apps.reservations.models import STATUS_TRANSITIONS, Reservation
+from apps.reservations.occupancy import SLOT_MINUTES
+from apps.courts.models import Court
 from apps.courts.serializers import CourtReadSerializer
+from apps.reservations.recurrence import (
+    ALL_OR_NOTHING,
+    FREQUENCIES,
+    SERIES_MODES,
+    expand_occurrences,
+)
 from apps.users.serializers import UserReadSerializer
 
+MAX_SERIES_OCCURRENCES = 52
+MAX_CALENDAR_DAYS = 42
+
 
 class ReservationCreateSerializer(serializers.Serializer):
     court_id = serializers.UUIDField()
@@ -17,6 +33,34 @@ class ReservationCreateSerializer(serializers.Serializer):
         return data
 
 
+class ReservationSeriesCreateSerializer(ReservationCreateSerializer):
+    frequency = serializers.ChoiceField(choices=list(FREQUENCIES))
+    until = serializers.DateField()
+    skip_dates = serializers.ListField(child=serializers.DateField(), required=False, default=list)
+    mode = serializers.ChoiceField(choices=SERIES_MODES, default=ALL_OR_NOTHING)
+
+    def validate(self, data):
+        data = super().validate(data)
+        if data['until'] < data['start_at'].date():
+            raise serializers.ValidationError("until must not be before start_at")
+
+        occurrences = expand_occurrences(
+            data['start_at'], data['end_at'], data['frequency'], data['until'], data['skip_dates']
+        )
+        if not occurrences:
+            raise serializers.ValidationError("The series has no occurrences")
+        if len(occurrences) > MAX_SERIES_OCCURRENCES:
+            raise serializers.ValidationError(
+                f"A series cannot have more than {MAX_SERIES_OCCURRENCES} occurrences"
+            )
+        return data
+
+
+class ReservationOccurrenceSerializer(serializers.Serializer):
+    start_at = serializers.DateTimeField()
+    end_at = serializers.DateTimeField()
+
+
 class ReservationUpdateSerializer(serializers.Serializer):
     players_count = serializers.IntegerField(min_value=1, required=False)
     additional_info = serializers.CharField(required=False, allow_blank=True)
@@ -31,3 +75,97 @@ class ReservationReadSerializer(serializers.ModelSerializer):
     class Meta:
         model = Reservation
         fields = '__all__'
+
+
+# ReservationReadSerializer for listings, rendered from values_list rows
+reservation_rows = FlatSerializer(ReservationReadSerializer)
+
+
+class FreeSlotSearchSerializer(serializers.Serializer):
+    city = serializers.CharField(required=False)
+    surface = serializers.ChoiceField(choices=Court.CourtSurface.choices, required=False)
+    court_type = serializers.ChoiceField(choices=Court.CourtType.choices, required=False)
+    date_from = serializers.DateTimeField()
+    date_to = serializers.DateTimeField()
+    duration = serializers.IntegerField(min_value=15, max_value=8 * 60, help_text="Minutes")
+    count = serializers.IntegerField(min_value=1, max_value=100, default=10)
+
+    def validate(self, data):
+        if data['date_from'] >= data['date_to']:
+            raise serializers.ValidationError("date_to must be after date_from")
+        if (data['date_to'] - data['date_from']).days > 62:
+            raise serializers.ValidationError("Search window cannot exceed 62 days")
+        return data
+
+
+class FreeSlotSerializer(serializers.Serializer):
+    court_id = serializers.UUIDField()
+    court_name = serializers.CharField()
+    start_at = serializers.DateTimeField()
+    end_at = serializers.DateTimeField()
+
+
+class CourtCalendarQuerySerializer(serializers.Serializer):
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False, help_text="Inclusive, overrides span")
+    span = serializers.ChoiceField(choices=['day', 'week', 'month'], default='week')
+
+    def validate(self, data):
+        date_from = data.get('date_from') or timezone.localdate()
+
+        if data.get('date_to'):
+            date_to = data['date_to'] + timedelta(days=1)
+        elif data['span'] == 'day':
+            date_to = date_from + timedelta(days=1)
+        elif data['span'] == 'week':
+            date_to = date_from + timedelta(weeks=1)
+        else:
+            date_to = date_from + timedelta(days=calendar.monthrange(date_from.year, date_from.month)[1])
+
+        if date_to <= date_from:
+            raise serializers.ValidationError("date_to must not be before date_from")
+        if (date_to - date_from).days > MAX_CALENDAR_DAYS:
+            raise serializers.ValidationError(f"Calendar window cannot exceed {MAX_CALENDAR_DAYS} days")
+
+        return {**data, 'date_from': date_from, 'date_to': date_to}
+
+
+class CourtCalendarEntrySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Reservation
+        fields = ['id', 'start_at', 'end_at', 'status']
+
+
+class OccupancyQuerySerializer(CourtCalendarQuerySerializer):
+    slot = serializers.ChoiceField(choices=SLOT_MINUTES, default=30, help_text="Minutes")
+    court_id = serializers.UUIDField(required=False)
+    city = serializers.CharField(required=False)
+    surface = serializers.ChoiceField(choices=Court.CourtSurface.choices, required=False)
+    court_type = serializers.ChoiceField(choices=Court.CourtType.choices, required=False)
+
+
+class ReservationBulkFilterSerializer(serializers.Serializer):
+    court_id = serializers.UUIDField(required=False)
+    user_id = serializers.UUIDField(required=False)
+    status = serializers.ChoiceField(choices=Reservation.ReservationStatus.choices, required=False)
+    start_from = serializers.DateTimeField(required=False)
+    start_to = serializers.DateTimeField(required=False)
+
+
+class ReservationBulkStatusSerializer(serializers.Serializer):
+    status = serializers.ChoiceField(choices=list(STATUS_TRANSITIONS))
+    reservation_ids = serializers.ListField(
+        child=serializers.UUIDField(), required=False, allow_empty=False, max_length=1000
+    )
+    filters = ReservationBulkFilterSerializer(required=False)
+
+    def validate(self, data):
+        if 'reservation_ids' not in data and not data.get('filters'):
+            raise serializers.ValidationError("Provide reservation_ids or at least one filter")
+        return data
+
+
+class ReservationBulkResultSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    outcome = serializers.ChoiceField(choices=['updated', 'unchanged', 'invalid_transition', 'not_matched', 'not_found'])
+    status = serializers.CharField(allow_null=True)
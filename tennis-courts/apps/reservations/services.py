@@ -1,37 +1,150 @@
+import operator
+from contextlib import contextmanager
+from functools import reduce
+from typing import Optional
 from uuid import UUID
 from decimal import Decimal
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
 
-from django.db import transaction
+from django.db import IntegrityError, OperationalError, transaction
+from django.conf import settings
+from django.db.models import Count, DateTimeField, F, Max, OuterRef, Q, QuerySet, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.core.exceptions import ValidationError
+from django.utils import timezone
 
+from apps.core.db import Epoch, update_returning
+from apps.core.eager import eager, eager_plan
+from apps.core.flat import FlatSerializer
+from apps.core.pagination import apaginate_keyset, paginate_keyset
 from apps.emails.services import EmailService
-from apps.reservations.models import Reservation
-from apps.courts.models import Court
+from apps.reservations import events
+from apps.reservations.availability import availability_index
+from apps.reservations.events import calendar_broker
+from apps.reservations.models import (
+    ACTIVE_STATUSES,
+    NO_OVERLAP_CONSTRAINT,
+    STATUS_TRANSITIONS,
+    Reservation,
+)
+from apps.reservations.occupancy import SlotBitmap, all_of, build_occupancy
+from apps.reservations.recurrence import ALL_OR_NOTHING, expand_occurrences
+from apps.reservations.serializers import (
+    CourtCalendarEntrySerializer,
+    ReservationReadSerializer,
+    reservation_rows,
+)
+from apps.reservations.slots import OpeningSweep, align_up
+from apps.courts.models import Court, CourtPrice
+from apps.courts.services import CourtService
 from apps.users.models import User
+from apps.users.services import UserService
+
+
+DEADLOCK_DETECTED = "40P01"
+MAX_BULK_TRANSITION = 1000
+STATUS_EVENTS = {
+    Reservation.ReservationStatus.CONFIRMED: events.CONFIRMED,
+    Reservation.ReservationStatus.CANCELED: events.CANCELED,
+}
+SLOT_ALIGNMENT = timedelta(minutes=15)
+
+
+@contextmanager
+def court_slot_guard(savepoint: bool = True):
+    """Translate the overlap exclusion constraint into a ValidationError"""
+    try:
+        with transaction.atomic(savepoint=savepoint):
+            yield
+    except (IntegrityError, OperationalError) as exc:
+        diag = getattr(exc.__cause__, "diag", None)
+        # Concurrent inserts of overlapping ranges wait on each other while
+        # checking the constraint, Postgres resolves such cycles by aborting
+        # one of them. The victim overlaps the winner, so it is a conflict too.
+        if (
+            getattr(diag, "constraint_name", None) != NO_OVERLAP_CONSTRAINT
+            and getattr(diag, "sqlstate", None) != DEADLOCK_DETECTED
+        ):
+            raise
+        raise ValidationError("Court is not available for the selected time") from exc
 
 
 class ReservationService:
     @staticmethod
-    def get_reservation(reservation_id: UUID) -> Reservation:
-        return Reservation.objects.select_related("court", "user").get(
-            id=reservation_id
+    def get_reservation(reservation_id: UUID, serializer_class=ReservationReadSerializer) -> Reservation:
+        return eager(Reservation.objects, serializer_class).get(id=reservation_id)
+
+    @staticmethod
+    def get_reservation_version(reservation_id: UUID) -> Optional[tuple]:
+        """Cheap validator of get_reservation's response: the row, its court and its user"""
+        return (
+            Reservation.objects.filter(id=reservation_id)
+            .annotate(prices_updated_at=Max("court__prices__updated_at"))
+            .values_list(
+                "updated_at", "court__updated_at", "prices_updated_at",
+                "user__email", "user__first_name", "user__last_name", "user__role",
+            )
+            .first()
+        )
+
+    @staticmethod
+    def get_court_calendar_version(court_id: UUID, date_from: date, date_to: date) -> tuple:
+        """
+        Cheap validator of a court calendar window. Canceled rows count too:
+        a cancellation bumps updated_at while the row leaves the calendar.
+        """
+        return tuple(
+            Reservation.objects.filter(
+                court_id=court_id,
+                start_at__lt=timezone.make_aware(datetime.combine(date_to, time.min)),
+                end_at__gte=timezone.make_aware(datetime.combine(date_from, time.min)),
+            )
+            .aggregate(rows=Count("id"), updated_at=Max("updated_at"))
+            .values()
         )
 
     @staticmethod
-    def get_reservations(user_id: UUID = None) -> list[Reservation]:
-        queryset = Reservation.objects.select_related("court", "user").all()
+    def get_reservations(
+        user_id: UUID = None, cursor: str = None, limit: int = None, rows: FlatSerializer = reservation_rows
+    ) -> tuple[list[tuple], Optional[str]]:
+        """One page of reservation rows, rendered by ``rows``"""
+        queryset = rows.values(ReservationService._reservations(user_id), "start_at", "id")
+        return paginate_keyset(queryset, ("start_at", "id"), cursor, limit)
+
+    @staticmethod
+    async def aget_reservations(
+        user_id: UUID = None, cursor: str = None, limit: int = None, rows: FlatSerializer = reservation_rows
+    ) -> tuple[list[tuple], Optional[str]]:
+        queryset = rows.values(ReservationService._reservations(user_id), "start_at", "id")
+        return await apaginate_keyset(queryset, ("start_at", "id"), cursor, limit)
+
+    @staticmethod
+    def get_counts() -> dict:
+        """Reservations in total and per active status, in one aggregate query"""
+        Status = Reservation.ReservationStatus
+        return Reservation.objects.aggregate(
+            total=Count("id"),
+            pending=Count("id", filter=Q(status=Status.PENDING)),
+            confirmed=Count("id", filter=Q(status=Status.CONFIRMED)),
+        )
+
+    @staticmethod
+    def _reservations(user_id: UUID = None):
+        queryset = Reservation.objects.all()
         if user_id:
             queryset = queryset.filter(user_id=user_id)
-        return list(queryset)
+        return queryset
 
     @staticmethod
     def get_court_reservations(
-        court_id: UUID, from_date: datetime = None
+        court_id: UUID, from_date: datetime = None, to_date: datetime = None
     ) -> list[Reservation]:
-        """Get all active reservations for a specific court"""
-        from django.utils import timezone
+        """Get active reservations for a specific court, optionally within a window"""
+        queryset = ReservationService._court_reservations(court_id, from_date, to_date)
+        return list(eager(queryset, ReservationReadSerializer))
 
+    @staticmethod
+    def _court_reservations(court_id: UUID, from_date: datetime = None, to_date: datetime = None):
         queryset = Reservation.objects.filter(
             court_id=court_id, status__in=["pending", "confirmed"]
         )
@@ -40,7 +153,203 @@ class ReservationService:
             if from_date.tzinfo is None:
                 from_date = timezone.make_aware(from_date)
             queryset = queryset.filter(end_at__gte=from_date)
-        return list(queryset.order_by("start_at"))
+        if to_date:
+            if to_date.tzinfo is None:
+                to_date = timezone.make_aware(to_date)
+            queryset = queryset.filter(start_at__lt=to_date)
+        return queryset.order_by("start_at")
+
+    @staticmethod
+    def get_court_calendar(
+        court_id: UUID, date_from: date, date_to: date
+    ) -> dict[date, list[Reservation]]:
+        """Active reservations of a court grouped per local day, date_to exclusive"""
+        queryset = ReservationService._court_reservations(
+            court_id,
+            from_date=datetime.combine(date_from, time.min),
+            to_date=datetime.combine(date_to, time.min),
+        )
+        reservations = list(eager(queryset, CourtCalendarEntrySerializer))
+        return ReservationService._group_per_day(reservations, date_from, date_to)
+
+    @staticmethod
+    async def aget_court_calendar(
+        court_id: UUID, date_from: date, date_to: date
+    ) -> dict[date, list[Reservation]]:
+        queryset = ReservationService._court_reservations(
+            court_id,
+            from_date=datetime.combine(date_from, time.min),
+            to_date=datetime.combine(date_to, time.min),
+        )
+        reservations = [reservation async for reservation in eager(queryset, CourtCalendarEntrySerializer)]
+        return ReservationService._group_per_day(reservations, date_from, date_to)
+
+    @staticmethod
+    def _group_per_day(
+        reservations: list[Reservation], date_from: date, date_to: date
+    ) -> dict[date, list[Reservation]]:
+        days = {
+            date_from + timedelta(days=offset): []
+            for offset in range((date_to - date_from).days)
+        }
+
+        last_day = date_to - timedelta(days=1)
+        for reservation in reservations:
+            # Bookings crossing midnight show up on every day they touch
+            day = max(timezone.localtime(reservation.start_at).date(), date_from)
+            until = min(
+                timezone.localtime(reservation.end_at - timedelta(microseconds=1)).date(),
+                last_day,
+            )
+            while day <= until:
+                days[day].append(reservation)
+                day += timedelta(days=1)
+
+        return days
+
+    @staticmethod
+    def find_free_slots(
+        date_from: datetime,
+        date_to: datetime,
+        duration: timedelta,
+        count: int,
+        city: str = None,
+        surface: str = None,
+        court_type: str = None,
+    ) -> list[dict]:
+        """Find the earliest free slots of the given length across matching courts"""
+        courts = ReservationService._matching_courts(city, surface, court_type)
+        court_names = dict(courts.values_list("id", "name"))
+        if not court_names:
+            return []
+
+        sweep, rows = ReservationService._free_slot_sweep(court_names, date_from, date_to, duration, count)
+        openings = sweep.run(rows.iterator(chunk_size=2000))
+        return ReservationService._free_slots(court_names, duration, openings)
+
+    @staticmethod
+    async def afind_free_slots(
+        date_from: datetime,
+        date_to: datetime,
+        duration: timedelta,
+        count: int,
+        city: str = None,
+        surface: str = None,
+        court_type: str = None,
+    ) -> list[dict]:
+        courts = ReservationService._matching_courts(city, surface, court_type)
+        court_names = {court_id: name async for court_id, name in courts.values_list("id", "name")}
+        if not court_names:
+            return []
+
+        sweep, rows = ReservationService._free_slot_sweep(court_names, date_from, date_to, duration, count)
+        # aiterator() runs values_list() queries on the event loop thread,
+        # async iteration fetches the rows in one hop to the worker thread
+        async for court_id, start_at, end_at in rows:
+            if sweep.feed(court_id, start_at, end_at):
+                break
+        return ReservationService._free_slots(court_names, duration, sweep.finish())
+
+    @staticmethod
+    def _free_slot_sweep(
+        court_names: dict, date_from: datetime, date_to: datetime, duration: timedelta, count: int
+    ) -> tuple[OpeningSweep, QuerySet]:
+        window_start = align_up(max(date_from, timezone.now()), SLOT_ALIGNMENT)
+        rows = (
+            Reservation.objects.filter(
+                court_id__in=court_names,
+                status__in=ACTIVE_STATUSES,
+                start_at__lt=date_to,
+                end_at__gt=window_start,
+            )
+            .order_by("start_at")
+            .values_list("court_id", "start_at", "end_at")
+        )
+        return OpeningSweep(court_names, window_start, date_to, duration, count), rows
+
+    @staticmethod
+    def _free_slots(court_names: dict, duration: timedelta, openings: list) -> list[dict]:
+        return [
+            {
+                "court_id": court_id,
+                "court_name": court_names[court_id],
+                "start_at": start_at,
+                "end_at": start_at + duration,
+            }
+            for start_at, court_id in openings
+        ]
+
+    @staticmethod
+    def get_occupancy(
+        date_from: date,
+        date_to: date,
+        slot_minutes: int,
+        court_id: UUID = None,
+        city: str = None,
+        surface: str = None,
+        court_type: str = None,
+    ) -> dict:
+        """Slot bitmaps of matching courts per local day, date_to exclusive"""
+        courts = ReservationService._matching_courts(city, surface, court_type)
+        if court_id:
+            courts = courts.filter(id=court_id)
+        court_ids = list(courts.values_list("id", flat=True))
+
+        rows = ReservationService._occupancy_rows(court_ids, date_from, date_to)
+        occupancy = build_occupancy(rows.iterator(chunk_size=2000), court_ids, date_from, date_to, slot_minutes)
+        return ReservationService._with_any_free(occupancy, date_from, date_to, slot_minutes)
+
+    @staticmethod
+    async def aget_occupancy(
+        date_from: date,
+        date_to: date,
+        slot_minutes: int,
+        court_id: UUID = None,
+        city: str = None,
+        surface: str = None,
+        court_type: str = None,
+    ) -> dict:
+        courts = ReservationService._matching_courts(city, surface, court_type)
+        if court_id:
+            courts = courts.filter(id=court_id)
+        court_ids = [court_id async for court_id in courts.values_list("id", flat=True)]
+
+        rows = ReservationService._occupancy_rows(court_ids, date_from, date_to)
+        rows = [row async for row in rows]
+        occupancy = build_occupancy(rows, court_ids, date_from, date_to, slot_minutes)
+        return ReservationService._with_any_free(occupancy, date_from, date_to, slot_minutes)
+
+    @staticmethod
+    def _occupancy_rows(court_ids: list[UUID], date_from: date, date_to: date):
+        return Reservation.objects.filter(
+            court_id__in=court_ids,
+            status__in=ACTIVE_STATUSES,
+            start_at__lt=timezone.make_aware(datetime.combine(date_to, time.min)),
+            end_at__gt=timezone.make_aware(datetime.combine(date_from, time.min)),
+        ).values_list("court_id", "start_at", "end_at")
+
+    @staticmethod
+    def _with_any_free(occupancy: dict, date_from: date, date_to: date, slot_minutes: int) -> dict:
+        # A slot has a free court unless it is taken on every matching court
+        slots = (24 * 60) // slot_minutes
+        any_free = {}
+        for offset in range((date_to - date_from).days):
+            day = date_from + timedelta(days=offset)
+            taken = all_of((days[day] for days in occupancy.values()), slots) if occupancy else ~SlotBitmap(slots)
+            any_free[day] = ~taken
+
+        return {"slots_per_day": slots, "courts": occupancy, "any_free": any_free}
+
+    @staticmethod
+    def _matching_courts(city: str = None, surface: str = None, court_type: str = None):
+        courts = Court.objects.filter(is_active=True)
+        if city:
+            courts = courts.filter(city__iexact=city)
+        if surface:
+            courts = courts.filter(surface=surface)
+        if court_type:
+            courts = courts.filter(court_type=court_type)
+        return courts
 
     @staticmethod
     def check_availability(
@@ -48,7 +357,13 @@ class ReservationService:
         start_at: datetime,
         end_at: datetime,
         exclude_reservation_id: UUID = None,
+        use_index: bool = False,
     ) -> bool:
+        if use_index and availability_index.enabled:
+            return availability_index.is_available(
+                court_id, start_at, end_at, exclude_reservation_id
+            )
+
         queryset = Reservation.objects.filter(
             court_id=court_id, status__in=["pending", "confirmed"]
         ).filter(start_at__lt=end_at, end_at__gt=start_at)
@@ -62,14 +377,13 @@ class ReservationService:
     def calculate_total_amount(
         court_id: UUID, start_at: datetime, end_at: datetime
     ) -> Decimal:
-        court = Court.objects.prefetch_related("prices").get(id=court_id)
-        price = court.prices.filter(is_active=True).first()
+        price_per_hour = CourtService.get_price_per_hour(court_id)
 
-        if not price:
+        if price_per_hour is None:
             return Decimal("0.00")
 
         duration_hours = (end_at - start_at).total_seconds() / 3600
-        return price.price_per_hour * Decimal(str(duration_hours))
+        return price_per_hour * Decimal(str(duration_hours))
 
     @staticmethod
     @transaction.atomic
@@ -84,7 +398,11 @@ class ReservationService:
         if not court.is_active:
             raise ValidationError("Court is not active")
 
-        if not ReservationService.check_availability(court_id, start_at, end_at):
+        # The in-memory index rejects taken slots without a query, the
+        # exclusion constraint on insert stays the final authority
+        if availability_index.enabled and not ReservationService.check_availability(
+            court_id, start_at, end_at, use_index=True
+        ):
             raise ValidationError("Court is not available for the selected time")
 
         players_count = reservation_data.get("players_count", 2)
@@ -97,76 +415,358 @@ class ReservationService:
             court_id, start_at, end_at
         )
 
-        reservation = Reservation.objects.create(
-            court=court, user=user, total_amount=total_amount, **reservation_data
-        )
+        with court_slot_guard():
+            reservation = Reservation.objects.create(
+                court=court, user=user, total_amount=total_amount, **reservation_data
+            )
+        ReservationService._on_commit(events.CREATED, [reservation])
 
         reservation_with_relations = ReservationService.get_reservation(reservation.id)
 
-        try:
-            EmailService.send_reservation_confirmation(reservation_with_relations)
-        except Exception:
-            pass
+        EmailService.send_reservation_confirmation(reservation_with_relations)
 
         return reservation_with_relations
 
+    @staticmethod
+    @transaction.atomic
+    def create_reservation_series(user_id: UUID, series_data: dict) -> dict:
+        court_id = series_data["court_id"]
+        occurrences = expand_occurrences(
+            series_data["start_at"],
+            series_data["end_at"],
+            series_data["frequency"],
+            series_data["until"],
+            series_data.get("skip_dates", []),
+        )
+
+        court = Court.objects.get(id=court_id)
+        user = User.objects.get(id=user_id)
+
+        if not court.is_active:
+            raise ValidationError("Court is not active")
+
+        players_count = series_data.get("players_count", 2)
+        if players_count > court.max_players:
+            raise ValidationError(
+                f"Too many players. Max players for this court: {court.max_players}"
+            )
+
+        # A single query returns every active booking hitting any occurrence
+        overlaps = reduce(
+            operator.or_,
+            (Q(start_at__lt=end_at, end_at__gt=start_at) for start_at, end_at in occurrences),
+        )
+        taken = list(
+            Reservation.objects.filter(court_id=court_id, status__in=ACTIVE_STATUSES)
+            .filter(overlaps)
+            .values_list("start_at", "end_at")
+        )
+
+        conflicts, free = [], []
+        for start_at, end_at in occurrences:
+            if any(start_at < taken_end and end_at > taken_start for taken_start, taken_end in taken):
+                conflicts.append({"start_at": start_at, "end_at": end_at})
+            else:
+                free.append((start_at, end_at))
+
+        if not free or (conflicts and series_data.get("mode", ALL_OR_NOTHING) == ALL_OR_NOTHING):
+            return {"reservations": [], "conflicts": conflicts}
+
+        # Every occurrence has the same length, so they share one quote
+        total_amount = ReservationService.calculate_total_amount(court_id, *free[0])
+
+        with court_slot_guard():
+            reservations = Reservation.objects.bulk_create(
+                [
+                    Reservation(
+                        court=court,
+                        user=user,
+                        players_count=players_count,
+                        additional_info=series_data.get("additional_info"),
+                        total_amount=total_amount,
+                        start_at=start_at,
+                        end_at=end_at,
+                    )
+                    for start_at, end_at in free
+                ]
+            )
+
+        ReservationService._on_commit(events.CREATED, reservations)
+        # The occurrences share one court instance, which would query its prices once per row
+        eager_plan(ReservationReadSerializer).prefetch_into(reservations)
+
+        EmailService.send_reservation_series_confirmation(user, court, reservations)
+
+        return {"reservations": reservations, "conflicts": conflicts}
+
     @staticmethod
     @transaction.atomic
     def update_reservation(reservation_id: UUID, reservation_data: dict) -> Reservation:
-        reservation = Reservation.objects.select_for_update().get(id=reservation_id)
-
-        start_at = reservation_data.get("start_at", reservation.start_at)
-        end_at = reservation_data.get("end_at", reservation.end_at)
-
-        if "start_at" in reservation_data or "end_at" in reservation_data:
-            if not ReservationService.check_availability(
-                reservation.court_id,
-                start_at,
-                end_at,
-                exclude_reservation_id=reservation_id,
-            ):
-                raise ValidationError("Court is not available for the selected time")
-
-            total_amount = ReservationService.calculate_total_amount(
-                reservation.court_id, start_at, end_at
+        """
+        Apply the changes with one conditional UPDATE ... RETURNING.
+
+        Guards that used to need the locked row (active status, player limit,
+        start before end) are part of the WHERE clause and the total is
+        recomputed in SQL from the court price, so a successful update is a
+        single statement. Only a rejected update costs a second query to
+        report why.
+        """
+        start_at = reservation_data.get("start_at")
+        end_at = reservation_data.get("end_at")
+        values = dict(reservation_data, updated_at=timezone.now())
+        queryset = Reservation.objects.filter(id=reservation_id, status__in=ACTIVE_STATUSES)
+
+        if start_at and end_at and start_at >= end_at:
+            raise ValidationError("end_at must be after start_at")
+
+        if start_at or end_at:
+            # Only one bound given: the stored one has to stay on its side
+            if not end_at:
+                queryset = queryset.filter(end_at__gt=start_at)
+            if not start_at:
+                queryset = queryset.filter(start_at__lt=end_at)
+
+            new_start = Value(start_at, output_field=DateTimeField()) if start_at else F("start_at")
+            new_end = Value(end_at, output_field=DateTimeField()) if end_at else F("end_at")
+            price = CourtPrice.objects.filter(
+                court_id=OuterRef("court_id"), is_active=True
+            ).values("price_per_hour")[:1]
+            values["total_amount"] = (
+                Coalesce(Subquery(price), Value(Decimal("0.00")))
+                * Epoch(new_end - new_start)
+                / Value(Decimal(3600))
             )
-            reservation.total_amount = total_amount
 
-        for field, value in reservation_data.items():
-            setattr(reservation, field, value)
+        if "players_count" in reservation_data:
+            queryset = queryset.filter(court__max_players__gte=reservation_data["players_count"])
 
-        reservation.save()
+        # The UPDATE is the only write, a failure aborts the whole transaction
+        # anyway, so no savepoint round trips around it
+        with court_slot_guard(savepoint=False):
+            updated = update_returning(queryset, values)
 
-        return ReservationService.get_reservation(reservation_id)
+        if not updated:
+            ReservationService._raise_rejected_update(reservation_id, reservation_data)
+
+        reservation = updated[0]
+        ReservationService._attach_cached_relations(reservation)
+        ReservationService._on_commit(events.UPDATED, [reservation])
+
+        return reservation
+
+    @staticmethod
+    def _raise_rejected_update(reservation_id: UUID, reservation_data: dict) -> None:
+        current = (
+            Reservation.objects.filter(id=reservation_id)
+            .values("status", "start_at", "end_at", "court__max_players")
+            .first()
+        )
+        if current is None:
+            raise Reservation.DoesNotExist("Reservation matching query does not exist.")
+        if current["status"] not in ACTIVE_STATUSES:
+            raise ValidationError(f"Cannot update a {current['status']} reservation")
+        if reservation_data.get("players_count", 0) > current["court__max_players"]:
+            raise ValidationError(
+                f"Too many players. Max players for this court: {current['court__max_players']}"
+            )
+        raise ValidationError("end_at must be after start_at")
+
+    @staticmethod
+    def _transition(reservation_id: UUID, status: str) -> Reservation:
+        """Move one reservation to ``status`` if its current status allows it, in one statement"""
+        updated = update_returning(
+            Reservation.objects.filter(id=reservation_id, status__in=STATUS_TRANSITIONS[status]),
+            {"status": status, "updated_at": timezone.now()},
+        )
+        if not updated:
+            current = (
+                Reservation.objects.filter(id=reservation_id)
+                .values_list("status", flat=True)
+                .first()
+            )
+            if current is None:
+                raise Reservation.DoesNotExist("Reservation matching query does not exist.")
+            raise ValidationError(f"Cannot change a {current} reservation to {status}")
+
+        reservation = updated[0]
+        ReservationService._attach_cached_relations(reservation)
+        ReservationService._on_commit(STATUS_EVENTS[status], [reservation])
+
+        return reservation
 
     @staticmethod
     @transaction.atomic
     def cancel_reservation(reservation_id: UUID) -> Reservation:
-        reservation = Reservation.objects.select_for_update().get(id=reservation_id)
-        reservation.status = Reservation.ReservationStatus.CANCELED
-        reservation.save()
+        reservation = ReservationService._transition(
+            reservation_id, Reservation.ReservationStatus.CANCELED
+        )
 
-        reservation_with_relations = ReservationService.get_reservation(reservation_id)
+        EmailService.send_reservation_cancellation(reservation)
 
-        try:
-            EmailService.send_reservation_cancellation(reservation_with_relations)
-        except Exception:
-            pass
+        return reservation
 
-        return reservation_with_relations
+    @staticmethod
+    @transaction.atomic
+    def expire_pending_holds(now: datetime = None, batch_size: int = None) -> list[Reservation]:
+        """
+        Cancel one batch of pending reservations older than the hold TTL and
+        queue their notices.
+
+        Rows locked by a concurrent edit are skipped rather than waited on,
+        the next sweep picks them up if they are still pending by then.
+        """
+        now = now or timezone.now()
+        batch_size = batch_size or settings.RESERVATION_EXPIRY_BATCH_SIZE
+        cutoff = now - timedelta(minutes=settings.RESERVATION_HOLD_TTL)
+
+        stale = (
+            Reservation.objects.filter(
+                status=Reservation.ReservationStatus.PENDING, created_at__lt=cutoff
+            )
+            .order_by("created_at")
+            .select_for_update(skip_locked=True)
+            .values("id")[:batch_size]
+        )
+        expired = update_returning(
+            Reservation.objects.filter(
+                id__in=Subquery(stale), status=Reservation.ReservationStatus.PENDING
+            ),
+            {"status": Reservation.ReservationStatus.CANCELED, "updated_at": now},
+            ("id", "court_id", "user_id", "status", "start_at", "end_at"),
+        )
+        if not expired:
+            return []
+
+        ReservationService._attach_relations(expired)
+        ReservationService._on_commit(events.CANCELED, expired)
+        EmailService.send_reservation_expiry_notices(expired)
+
+        return expired
 
     @staticmethod
     @transaction.atomic
-    def confirm_reservation(reservation_id: UUID) -> Reservation:
-        reservation = Reservation.objects.select_for_update().get(id=reservation_id)
-        reservation.status = Reservation.ReservationStatus.CONFIRMED
-        reservation.save()
+    def bulk_transition(
+        status: str, reservation_ids: list[UUID] = None, filters: dict = None
+    ) -> dict:
+        """
+        Move many reservations to ``status`` with one UPDATE ... RETURNING.
+
+        Only rows whose current status allows the transition are touched, so
+        a canceled booking is never confirmed. With ``reservation_ids`` every
+        id gets an outcome, ``not_matched`` for those ``filters`` left out;
+        with ``filters`` alone only the updated rows are listed.
+        """
+        allowed = STATUS_TRANSITIONS[status]
+        queryset = Reservation.objects.all()
+        if reservation_ids is not None:
+            queryset = queryset.filter(id__in=reservation_ids)
+        if filters:
+            queryset = ReservationService._filter_reservations(queryset, **filters)
+
+        # Locking in id order keeps concurrent bulk calls from deadlocking
+        targets = (
+            queryset.filter(status__in=allowed)
+            .order_by("id")
+            .select_for_update()
+            .values("id")[:MAX_BULK_TRANSITION]
+        )
+        updated = update_returning(
+            Reservation.objects.filter(id__in=Subquery(targets), status__in=allowed),
+            {"status": status, "updated_at": timezone.now()},
+            (
+                "id", "court_id", "user_id", "status", "players_count", "additional_info",
+                "total_amount", "start_at", "end_at",
+            ),
+        )
+
+        outcomes = {reservation.id: ("updated", status) for reservation in updated}
+        if reservation_ids is not None:
+            rest = set(reservation_ids) - outcomes.keys()
+            current = dict(
+                Reservation.objects.filter(id__in=rest).values_list("id", "status")
+            ) if rest else {}
+            matched = set(
+                ReservationService._filter_reservations(
+                    Reservation.objects.filter(id__in=current), **filters
+                ).values_list("id", flat=True)
+            ) if filters and current else current.keys()
+            for reservation_id in rest:
+                if reservation_id not in current:
+                    outcomes[reservation_id] = ("not_found", None)
+                elif reservation_id not in matched:
+                    # Left out by the filters, whatever its status allows
+                    outcomes[reservation_id] = ("not_matched", current[reservation_id])
+                elif current[reservation_id] == status:
+                    outcomes[reservation_id] = ("unchanged", status)
+                else:
+                    outcomes[reservation_id] = ("invalid_transition", current[reservation_id])
+
+        if updated:
+            ReservationService._attach_relations(updated)
+            ReservationService._on_commit(STATUS_EVENTS[status], updated)
+            EmailService.send_reservation_notices(updated, status)
+
+        return {
+            "updated": len(updated),
+            "results": [
+                {"id": reservation_id, "outcome": outcome, "status": current_status}
+                for reservation_id, (outcome, current_status) in outcomes.items()
+            ],
+        }
+
+    @staticmethod
+    def _filter_reservations(
+        queryset,
+        court_id: UUID = None,
+        user_id: UUID = None,
+        status: str = None,
+        start_from: datetime = None,
+        start_to: datetime = None,
+    ):
+        if court_id:
+            queryset = queryset.filter(court_id=court_id)
+        if user_id:
+            queryset = queryset.filter(user_id=user_id)
+        if status:
+            queryset = queryset.filter(status=status)
+        if start_from:
+            queryset = queryset.filter(start_at__gte=start_from)
+        if start_to:
+            queryset = queryset.filter(start_at__lt=start_to)
+        return queryset
 
-        reservation_with_relations = ReservationService.get_reservation(reservation_id)
+    @staticmethod
+    def _attach_relations(reservations: list[Reservation]) -> None:
+        """Set court and user on rows loaded without them, two queries in total"""
+        courts = Court.objects.in_bulk({reservation.court_id for reservation in reservations})
+        users = User.objects.in_bulk({reservation.user_id for reservation in reservations})
+        for reservation in reservations:
+            reservation.court = courts[reservation.court_id]
+            reservation.user = users[reservation.user_id]
 
-        try:
-            EmailService.send_reservation_confirmation(reservation_with_relations)
-        except Exception:
-            pass
+    @staticmethod
+    def _attach_cached_relations(reservation: Reservation) -> None:
+        """Court and user from the process-local caches instead of a join"""
+        reservation.court = CourtService.get_cached_court(reservation.court_id)
+        reservation.user = UserService.get_cached_user(reservation.user_id)
 
-        return reservation_with_relations
+    @staticmethod
+    def _on_commit(event: str, reservations: list[Reservation]) -> None:
+        """Once committed, apply the changes to the availability index and push them to calendar streams"""
+        def on_commit():
+            for reservation in reservations:
+                availability_index.record(reservation)
+                calendar_broker.publish(event, reservation)
+
+        transaction.on_commit(on_commit)
+
+    @staticmethod
+    @transaction.atomic
+    def confirm_reservation(reservation_id: UUID) -> Reservation:
+        reservation = ReservationService._transition(
+            reservation_id, Reservation.ReservationStatus.CONFIRMED
+        )
+
+        EmailService.send_reservation_confirmation(reservation)
+
+        return reservation
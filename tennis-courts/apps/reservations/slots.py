@@ -0,0 +1,91 @@
+import heapq
+from datetime import UTC, datetime, timedelta
+from typing import Iterable
+from uuid import UUID
+
+# How often (in rows) the sweep checks whether the remaining rows can still
+# produce an earlier opening than the ones already collected
+CHECKPOINT_ROWS = 512
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def align_up(moment: datetime, step: timedelta) -> datetime:
+    remainder = (moment - EPOCH) % step
+    return moment + (step - remainder) if remainder else moment
+
+
+class OpeningSweep:
+    """
+    Single sweep-line pass producing the earliest free openings across courts.
+
+    Rows must be ``(court_id, start_at, end_at)`` tuples of active reservations
+    ordered by ``start_at``. Every court keeps a cursor: the start of the next
+    candidate opening inside its current free gap. Openings are laid back to
+    back from the start of each gap, and only the ``count`` earliest ones are
+    kept in a bounded heap.
+    """
+
+    def __init__(self, court_ids: Iterable[UUID], window_start: datetime, window_end: datetime,
+                 duration: timedelta, count: int):
+        self.window_end = window_end
+        self.duration = duration
+        self.count = count
+        self.cursors = dict.fromkeys(court_ids, window_start)
+        self._best = []
+        self._seq = 0
+        self._rows = 0
+
+    @property
+    def full(self) -> bool:
+        return len(self._best) == self.count
+
+    @property
+    def latest(self) -> datetime:
+        return self._best[0][2]
+
+    def _advance(self, court_id: UUID, until: datetime) -> None:
+        """Offer the openings of ``court_id`` that end by ``until``"""
+        cursor = self.cursors[court_id]
+
+        while cursor + self.duration <= until:
+            if self.full and cursor >= self.latest:
+                break
+
+            # Max-heap on start time through the negated timestamp
+            entry = (-cursor.timestamp(), self._seq, cursor, court_id)
+            self._seq += 1
+            if self.full:
+                heapq.heapreplace(self._best, entry)
+            else:
+                heapq.heappush(self._best, entry)
+            cursor += self.duration
+
+        self.cursors[court_id] = cursor
+
+    def run(self, rows: Iterable[tuple[UUID, datetime, datetime]]) -> list[tuple[datetime, UUID]]:
+        for court_id, start_at, end_at in rows:
+            if self.feed(court_id, start_at, end_at):
+                break
+        return self.finish()
+
+    def feed(self, court_id: UUID, start_at: datetime, end_at: datetime) -> bool:
+        """Take the next row, True once the remaining rows cannot change the result"""
+        self._rows += 1
+        self._advance(court_id, min(start_at, self.window_end))
+        self.cursors[court_id] = max(self.cursors[court_id], end_at)
+
+        if self._rows % CHECKPOINT_ROWS == 0:
+            # Rows arrive by start time, so no court has anything booked
+            # between its cursor and start_at: those openings are final
+            for other_id in self.cursors:
+                self._advance(other_id, min(start_at, self.window_end))
+
+            return self.full and self.latest <= min(self.cursors.values())
+        return False
+
+    def finish(self) -> list[tuple[datetime, UUID]]:
+        for court_id in self.cursors:
+            self._advance(court_id, self.window_end)
+
+        return sorted((start_at, court_id) for _, _, start_at, court_id in self._best)
@@ -0,0 +1,53 @@
+import asyncio
+from uuid import UUID
+
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+
+from apps.auth_service.auth import async_login_required
+from apps.reservations.events import calendar_broker
+
+MAX_STREAM_COURTS = 50
+
+
+@require_GET
+@async_login_required
+async def court_events(request):
+    """
+    Server-Sent Events stream of committed reservation changes for the
+    ``court_id`` query parameters (repeatable).
+
+    Needs an ASGI server in front of ``tennis_courts.asgi``: under WSGI the
+    response would tie up a worker thread per client.
+    """
+    try:
+        court_ids = {UUID(value) for value in request.GET.getlist("court_id")}
+    except ValueError:
+        return JsonResponse({"court_id": ["Must be a valid UUID."]}, status=400)
+    if not court_ids or len(court_ids) > MAX_STREAM_COURTS:
+        return JsonResponse(
+            {"court_id": [f"Provide between 1 and {MAX_STREAM_COURTS} court ids."]}, status=400
+        )
+
+    response = StreamingHttpResponse(_stream(court_ids), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Stops nginx and similar proxies from buffering the stream
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+async def _stream(court_ids: set[UUID]):
+    subscription = calendar_broker.subscribe(court_ids)
+    try:
+        yield "retry: 5000\n\n"
+        while True:
+            try:
+                async with asyncio.timeout(settings.RESERVATION_EVENTS_HEARTBEAT):
+                    frame = await subscription.next_frame()
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+            else:
+                yield frame
+    finally:
+        calendar_broker.unsubscribe(subscription)
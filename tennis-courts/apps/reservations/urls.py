@@ -1,7 +1,20 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
+from apps.reservations import async_views
+from apps.reservations.streams import court_events
 from apps.reservations.views import ReservationView
 
 router = DefaultRouter()
 router.register("reservations", ReservationView, basename="reservations")
 
-urlpatterns = router.urls
+urlpatterns = [
+    path("reservations/events/", court_events, name="reservations-events"),
+    path("async/reservations/get/", async_views.get_reservations, name="async-reservations-list"),
+    path(
+        "async/reservations/court/<uuid:court_id>/",
+        async_views.get_court_reservations,
+        name="async-reservations-court",
+    ),
+    path("async/reservations/free-slots/", async_views.find_free_slots, name="async-reservations-free-slots"),
+    path("async/reservations/occupancy/", async_views.get_occupancy, name="async-reservations-occupancy"),
+] + router.urls
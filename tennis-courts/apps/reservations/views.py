@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from rest_framework.viewsets import ViewSet
 from rest_framework.decorators import action
 from rest_framework import status
@@ -5,15 +7,64 @@ from rest_framework.permissions import IsAuthenticated
 
 from drf_spectacular.utils import extend_schema
 
+from apps.core.conditional import conditional
 from apps.core.permissions import IsAdmin
 from apps.core.responses import api_response
-from apps.core.serializers import ApiResponseSerializer
+from apps.core.serializers import ApiResponseSerializer, PageQuerySerializer
+from apps.core.sparse import SPARSE_PARAMETERS, sparse_rows, sparse_serializer
 from apps.reservations.serializers import (
+    CourtCalendarEntrySerializer,
+    CourtCalendarQuerySerializer,
+    FreeSlotSearchSerializer,
+    FreeSlotSerializer,
+    ReservationBulkResultSerializer,
+    ReservationBulkStatusSerializer,
+    OccupancyQuerySerializer,
     ReservationCreateSerializer,
+    ReservationOccurrenceSerializer,
+    ReservationSeriesCreateSerializer,
     ReservationUpdateSerializer,
     ReservationReadSerializer,
+    reservation_rows,
 )
-from apps.reservations.services import ReservationService
+from apps.reservations.services import MAX_BULK_TRANSITION, ReservationService
+
+
+def calendar_data(court_id, date_from, date_to, days: dict) -> dict:
+    """get_court_reservations payload, date_to exclusive"""
+    return {
+        "court_id": court_id,
+        "date_from": date_from,
+        "date_to": date_to - timedelta(days=1),
+        "days": {
+            day.isoformat(): CourtCalendarEntrySerializer(reservations, many=True).data
+            for day, reservations in days.items()
+        },
+    }
+
+
+def occupancy_data(params: dict, occupancy: dict) -> dict:
+    """get_occupancy payload from the validated OccupancyQuerySerializer params"""
+    return {
+        "date_from": params["date_from"],
+        "date_to": params["date_to"] - timedelta(days=1),
+        "slot_minutes": params["slot"],
+        "slots_per_day": occupancy["slots_per_day"],
+        "courts": {
+            str(court_id): {day.isoformat(): bitmap.encode() for day, bitmap in days.items()}
+            for court_id, days in occupancy["courts"].items()
+        },
+        "any_free": {day.isoformat(): bitmap.encode() for day, bitmap in occupancy["any_free"].items()},
+    }
+
+
+def _court_calendar_version(request, court_id=None):
+    serializer = CourtCalendarQuerySerializer(data=request.query_params)
+    if not serializer.is_valid():
+        return None
+    return ReservationService.get_court_calendar_version(
+        court_id, serializer.validated_data["date_from"], serializer.validated_data["date_to"]
+    )
 
 
 class ReservationView(ViewSet):
@@ -24,7 +75,7 @@ class ReservationView(ViewSet):
         return ReservationService()
 
     def get_permissions(self):
-        admin_actions = {"confirm_reservation"}
+        admin_actions = {"confirm_reservation", "bulk_status"}
 
         if self.action in admin_actions:
             return [IsAdmin()]
@@ -33,42 +84,54 @@ class ReservationView(ViewSet):
 
     @extend_schema(
         request=None,
+        parameters=SPARSE_PARAMETERS,
         responses={200: ApiResponseSerializer},
         summary="Get reservation",
         tags=["reservations"],
     )
     @action(detail=True, methods=["get"], url_path="get")
+    @conditional(lambda request, pk=None: ReservationService.get_reservation_version(pk))
     def get_reservation(self, request, pk=None):
-        reservation = self.service.get_reservation(pk)
+        serializer_class = sparse_serializer(ReservationReadSerializer, request.query_params)
+        reservation = self.service.get_reservation(pk, serializer_class)
 
         return api_response(
-            data=ReservationReadSerializer(reservation).data,
+            data=serializer_class(reservation).data,
             message="Reservation retrieved successfully",
             status_code=status.HTTP_200_OK,
         )
 
     @extend_schema(
         request=None,
+        parameters=[PageQuerySerializer, *SPARSE_PARAMETERS],
         responses={200: ApiResponseSerializer},
         summary="Get reservations",
         tags=["reservations"],
     )
     @action(detail=False, methods=["get"], url_path="get")
     def get_reservations(self, request):
+        page = PageQuerySerializer(data=request.query_params)
+        page.is_valid(raise_exception=True)
+
+        rows = sparse_rows(reservation_rows, request.query_params)
         user_id = request.user.id if request.user.role == "user" else None
-        reservations = self.service.get_reservations(user_id=user_id)
-        serializer = ReservationReadSerializer(reservations, many=True)
+        reservations, next_cursor = self.service.get_reservations(
+            user_id=user_id, rows=rows, **page.validated_data
+        )
 
         return api_response(
-            data=serializer.data,
+            data=rows.serialize(reservations),
             message="Reservations retrieved successfully",
             status_code=status.HTTP_200_OK,
+            meta={"next_cursor": next_cursor},
         )
 
     @extend_schema(
         request=None,
+        parameters=[CourtCalendarQuerySerializer],
         responses={200: ApiResponseSerializer},
         summary="Get court reservations",
+        description="Active reservations of a court within a day, week or month window, grouped per day",
         tags=["reservations"],
     )
     @action(
@@ -77,18 +140,84 @@ class ReservationView(ViewSet):
         url_path="court/(?P<court_id>[^/.]+)",
         url_name="court-reservations",
     )
+    @conditional(_court_calendar_version)
     def get_court_reservations(self, request, court_id=None):
-        # Get all active reservations for the court (no date filter)
-        # Frontend will handle filtering by selected date
-        reservations = self.service.get_court_reservations(court_id, from_date=None)
-        serializer = ReservationReadSerializer(reservations, many=True)
+        serializer = CourtCalendarQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        date_from = serializer.validated_data["date_from"]
+        date_to = serializer.validated_data["date_to"]
+        days = self.service.get_court_calendar(court_id, date_from, date_to)
 
         return api_response(
-            data=serializer.data,
+            data=calendar_data(court_id, date_from, date_to, days),
             message="Court reservations retrieved successfully",
             status_code=status.HTTP_200_OK,
         )
 
+    @extend_schema(
+        request=None,
+        parameters=[FreeSlotSearchSerializer],
+        responses={200: ApiResponseSerializer},
+        summary="Find free slots",
+        description="Earliest free slots of the given duration across all matching courts",
+        tags=["reservations"],
+    )
+    @action(detail=False, methods=["get"], url_path="free-slots")
+    def find_free_slots(self, request):
+        serializer = FreeSlotSearchSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        params = serializer.validated_data
+        slots = self.service.find_free_slots(
+            date_from=params["date_from"],
+            date_to=params["date_to"],
+            duration=timedelta(minutes=params["duration"]),
+            count=params["count"],
+            city=params.get("city"),
+            surface=params.get("surface"),
+            court_type=params.get("court_type"),
+        )
+
+        return api_response(
+            data=FreeSlotSerializer(slots, many=True).data,
+            message="Free slots retrieved successfully",
+            status_code=status.HTTP_200_OK,
+        )
+
+    @extend_schema(
+        request=None,
+        parameters=[OccupancyQuerySerializer],
+        responses={200: ApiResponseSerializer},
+        summary="Get slot occupancy",
+        description=(
+            "Base64 packed bitmaps per court and day, one bit per slot (bit i % 8 of byte i // 8), "
+            "set bits are taken slots. any_free marks slots with at least one free matching court"
+        ),
+        tags=["reservations"],
+    )
+    @action(detail=False, methods=["get"], url_path="occupancy")
+    def get_occupancy(self, request):
+        serializer = OccupancyQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        params = serializer.validated_data
+        occupancy = self.service.get_occupancy(
+            date_from=params["date_from"],
+            date_to=params["date_to"],
+            slot_minutes=params["slot"],
+            court_id=params.get("court_id"),
+            city=params.get("city"),
+            surface=params.get("surface"),
+            court_type=params.get("court_type"),
+        )
+
+        return api_response(
+            data=occupancy_data(params, occupancy),
+            message="Occupancy retrieved successfully",
+            status_code=status.HTTP_200_OK,
+        )
+
     @extend_schema(
         request=ReservationCreateSerializer,
         responses={200: ApiResponseSerializer},
@@ -110,6 +239,38 @@ class ReservationView(ViewSet):
             status_code=status.HTTP_200_OK,
         )
 
+    @extend_schema(
+        request=ReservationSeriesCreateSerializer,
+        responses={200: ApiResponseSerializer, 409: ApiResponseSerializer},
+        summary="Create a recurring reservation series",
+        tags=["reservations"],
+    )
+    @action(detail=False, methods=["post"], url_path="series/create")
+    def create_reservation_series(self, request):
+        serializer = ReservationSeriesCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        result = self.service.create_reservation_series(
+            user_id=request.user.id, series_data=serializer.validated_data
+        )
+        data = {
+            "reservations": ReservationReadSerializer(result["reservations"], many=True).data,
+            "conflicts": ReservationOccurrenceSerializer(result["conflicts"], many=True).data,
+        }
+
+        if not result["reservations"]:
+            return api_response(
+                data=data,
+                message="Reservation series conflicts with existing reservations",
+                status_code=status.HTTP_409_CONFLICT,
+            )
+
+        return api_response(
+            data=data,
+            message="Reservation series created successfully",
+            status_code=status.HTTP_200_OK,
+        )
+
     @extend_schema(
         request=ReservationUpdateSerializer,
         responses={200: ApiResponseSerializer},
@@ -160,3 +321,33 @@ class ReservationView(ViewSet):
             message="Reservation confirmed successfully",
             status_code=status.HTTP_200_OK,
         )
+
+    @extend_schema(
+        request=ReservationBulkStatusSerializer,
+        responses={200: ApiResponseSerializer},
+        summary="Bulk confirm or cancel reservations",
+        description=(
+            "Applies the status to the given ids or to the reservations matching the filters "
+            f"(at most {MAX_BULK_TRANSITION} per call) and reports the outcome per id"
+        ),
+        tags=["reservations"],
+    )
+    @action(detail=False, methods=["post"], url_path="bulk/status")
+    def bulk_status(self, request):
+        serializer = ReservationBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        result = self.service.bulk_transition(
+            serializer.validated_data["status"],
+            reservation_ids=serializer.validated_data.get("reservation_ids"),
+            filters=serializer.validated_data.get("filters"),
+        )
+
+        return api_response(
+            data={
+                "updated": result["updated"],
+                "results": ReservationBulkResultSerializer(result["results"], many=True).data,
+            },
+            message=f"{result['updated']} reservations updated",
+            status_code=status.HTTP_200_OK,
+        )
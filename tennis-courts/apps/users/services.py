@@ -1,17 +1,78 @@
+from typing import Optional
 from uuid import UUID
 
-from django.db import transaction
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Count, Q
+from apps.core.cache import TTLCache
+from apps.core.eager import eager
+from apps.core.pagination import paginate_keyset
 from apps.users.models import User
+from apps.users.serializers import UserReadSerializer
 from apps.emails.services import EmailService
 
+user_cache = TTLCache("users", maxsize=settings.MODEL_CACHE_SIZE, ttl=settings.USER_CACHE_TTL)
+
+
+def _version_key(user_id) -> str:
+    return f"users:token_version:{user_id}"
+
+
+def _publish_version(user: User) -> None:
+    """
+    Announce the user's new token version to every worker once committed:
+    cached copies older than it are reloaded, tokens or not
+    """
+    user_cache.invalidate(user.id)
+    transaction.on_commit(
+        lambda: caches[settings.USER_VERSION_CACHE].set(
+            _version_key(user.id), user.token_version, timeout=settings.USER_CACHE_TTL
+        )
+    )
+
+
 class UserService:
     @staticmethod
-    def get_user(*, user_id: UUID) -> User:
-        return User.objects.get(id=user_id)
+    def get_user(*, user_id: UUID, serializer_class=None) -> User:
+        """The whole user, or only what ``serializer_class`` renders"""
+        queryset = eager(User.objects, serializer_class) if serializer_class else User.objects
+        return queryset.get(id=user_id)
+
+    @staticmethod
+    def get_cached_user(user_id: UUID, token_version: int = None) -> User:
+        """
+        User shared between requests through the process-local cache: do not
+        mutate. A token or a published version (see _publish_version) newer
+        than the cached copy forces a reload, from the primary since a
+        lagging replica would hand back the copy being replaced.
+        """
+        user = user_cache.get(user_id)
+        latest = max(token_version or 0, caches[settings.USER_VERSION_CACHE].get(_version_key(user_id), 0))
+        if user is None or user.token_version < latest:
+            user = User.objects.using(DEFAULT_DB_ALIAS).get(id=user_id)
+            user_cache.set(user_id, user)
+        return user
+
+    @staticmethod
+    async def aget_cached_user(user_id: UUID, token_version: int = None) -> User:
+        user = user_cache.get(user_id)
+        latest = max(token_version or 0, await caches[settings.USER_VERSION_CACHE].aget(_version_key(user_id), 0))
+        if user is None or user.token_version < latest:
+            user = await User.objects.using(DEFAULT_DB_ALIAS).aget(id=user_id)
+            user_cache.set(user_id, user)
+        return user
+
+    @staticmethod
+    def get_users(
+        *, cursor: str = None, limit: int = None, serializer_class=UserReadSerializer
+    ) -> tuple[list[User], Optional[str]]:
+        queryset = eager(User.objects.all(), serializer_class, "date_joined", "id")
+        return paginate_keyset(queryset, ("date_joined", "id"), cursor, limit)
 
     @staticmethod
-    def get_users() ->list[User]:
-        return list(User.objects.all())
+    def get_counts() -> dict:
+        return User.objects.aggregate(total=Count("id"), active=Count("id", filter=Q(is_active=True)))
 
     @staticmethod
     @transaction.atomic
@@ -33,10 +94,7 @@ class UserService:
             **user_data
         )
 
-        try:
-            EmailService.send_welcome_email(user)
-        except Exception:
-            pass
+        EmailService.send_welcome_email(user)
 
         return user
 
@@ -46,7 +104,9 @@ class UserService:
         user = User.objects.select_for_update().get(id=user_id)
 
         user.is_active = not user.is_active
-        user.save(update_fields=["is_active"])
+        user.token_version += 1
+        user.save(update_fields=["is_active", "token_version"])
+        _publish_version(user)
 
         return user
 
@@ -69,6 +129,8 @@ class UserService:
             update_fields.append("last_name")
 
         if update_fields:
-            user.save(update_fields=update_fields)
+            user.token_version += 1
+            user.save(update_fields=[*update_fields, "token_version"])
+            _publish_version(user)
 
         return user
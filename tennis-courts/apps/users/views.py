@@ -11,7 +11,8 @@ from apps.users.serializers import (
 )
 from apps.core.permissions import IsAdmin
 from apps.core.responses import api_response
-from apps.core.serializers import ApiResponseSerializer
+from apps.core.serializers import ApiResponseSerializer, PageQuerySerializer
+from apps.core.sparse import SPARSE_PARAMETERS, sparse_serializer
 
 
 class UserView(ViewSet):
@@ -51,35 +52,43 @@ class UserView(ViewSet):
 
     @extend_schema(
         request=None,
+        parameters=SPARSE_PARAMETERS,
         responses={200: ApiResponseSerializer},
         summary="Get user information",
         tags=["users"],
     )
     @action(detail=True, methods=['get'], url_path='get')
     def get_user(self, request, pk=None):
-        user = self.service.get_user(user_id=pk)
+        serializer_class = sparse_serializer(UserReadSerializer, request.query_params)
+        user = self.service.get_user(user_id=pk, serializer_class=serializer_class)
 
         return api_response(
-            data=UserReadSerializer(user).data,
+            data=serializer_class(user).data,
             message="User retrieved successfully",
             status_code=status.HTTP_200_OK
         )
 
     @extend_schema(
         request=None,
+        parameters=[PageQuerySerializer, *SPARSE_PARAMETERS],
         responses={200: ApiResponseSerializer},
         summary="Get users information",
         tags=["users"],
     )
     @action(detail=False, methods=['get'], url_path='get')
     def get_users(self, request):
-        user = self.service.get_users()
-        serializer = UserReadSerializer(user, many=True)
+        page = PageQuerySerializer(data=request.query_params)
+        page.is_valid(raise_exception=True)
+
+        serializer_class = sparse_serializer(UserReadSerializer, request.query_params)
+        users, next_cursor = self.service.get_users(serializer_class=serializer_class, **page.validated_data)
+        serializer = serializer_class(users, many=True)
 
         return api_response(
             data=serializer.data,
             message="Users retrieved successfully",
-            status_code=status.HTTP_200_OK
+            status_code=status.HTTP_200_OK,
+            meta={"next_cursor": next_cursor}
         )
 
     @extend_schema(
@@ -37,6 +37,7 @@ ALLOWED_HOSTS = ["*"]
 INSTALLED_APPS = [
     "django.contrib.auth",
     "django.contrib.contenttypes",
+    "django.contrib.postgres",
     "rest_framework",
     "rest_framework_simplejwt",
     "drf_spectacular",
@@ -55,6 +56,7 @@ MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.core.middleware.ReplicaRoutingMiddleware",
 ]
 
 ROOT_URLCONF = "tennis_courts.urls"
@@ -78,14 +80,42 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_AUTHENTICATION_CLASSES": ("apps.auth_service.auth.CookieJWTAuth",),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    "DEFAULT_RENDERER_CLASSES": (
+        "apps.core.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    # Reverse proxies in front of the app that append to X-Forwarded-For. 0
+    # takes the client address from the connection, so the header cannot
+    # pick the throttle bucket
+    "NUM_PROXIES": int(os.getenv("NUM_PROXIES", "0")),
 }
 
+# Encoder behind FastJSONRenderer: "orjson" (a dependency, a missing package
+# falls back to the stdlib encoder with a warning) or "stdlib" to force DRF's
+# own encoding. Both write the same bytes.
+API_JSON_ENCODER = os.getenv("API_JSON_ENCODER", "orjson")
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=5),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
 
+# Build request.user from the access token claims instead of the user cache:
+# no query at all, but role and deactivation changes only apply once the
+# access token is refreshed
+AUTH_STATELESS_USERS = os.getenv("AUTH_STATELESS_USERS", "false").lower() == "true"
+
+# Token buckets in front of login, register and refresh: sustained attempts
+# per minute and burst, per client IP and per submitted email. Buckets live
+# in process memory unless AUTH_THROTTLE_CACHE names a shared cache alias.
+AUTH_THROTTLE_IP_RATE = int(os.getenv("AUTH_THROTTLE_IP_RATE", "30"))
+AUTH_THROTTLE_IP_BURST = int(os.getenv("AUTH_THROTTLE_IP_BURST", "10"))
+AUTH_THROTTLE_EMAIL_RATE = int(os.getenv("AUTH_THROTTLE_EMAIL_RATE", "5"))
+AUTH_THROTTLE_EMAIL_BURST = int(os.getenv("AUTH_THROTTLE_EMAIL_BURST", "5"))
+AUTH_THROTTLE_CACHE = os.getenv("AUTH_THROTTLE_CACHE", "")
+AUTH_THROTTLE_MAX_KEYS = int(os.getenv("AUTH_THROTTLE_MAX_KEYS", "100000"))
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "Tennis Courts API",
     "DESCRIPTION": "REST API for tennis court reservations",
@@ -94,6 +124,7 @@ SPECTACULAR_SETTINGS = {
 }
 
 WSGI_APPLICATION = "tennis_courts.wsgi.application"
+ASGI_APPLICATION = "tennis_courts.asgi.application"
 
 
 # Database
@@ -110,6 +141,36 @@ DATABASES = {
     }
 }
 
+# Pooled connections: every request still opens and closes its connection,
+# but closing returns it to a per-process pool instead of the server
+if os.getenv("DATABASE_POOL", "false").lower() == "true":
+    DATABASES["default"]["ENGINE"] = "apps.core.backends.postgresql_pool"
+    DATABASES["default"]["POOL"] = {
+        "MIN_SIZE": int(os.getenv("DATABASE_POOL_MIN_SIZE", "2")),
+        "MAX_SIZE": int(os.getenv("DATABASE_POOL_MAX_SIZE", "10")),
+        # Seconds a request waits for a free connection before failing
+        "TIMEOUT": float(os.getenv("DATABASE_POOL_TIMEOUT", "5")),
+        # Seconds idle after which a connection is probed before reuse
+        "CHECK_INTERVAL": float(os.getenv("DATABASE_POOL_CHECK_INTERVAL", "30")),
+        "MAX_IDLE": float(os.getenv("DATABASE_POOL_MAX_IDLE", "300")),
+        "MAX_LIFETIME": float(os.getenv("DATABASE_POOL_MAX_LIFETIME", "1800")),
+    }
+
+# Read replicas: comma separated host[:port] list sharing the primary's
+# database, user and password. Read-only ViewSet actions (get_*, me) are
+# served from them unless the client wrote within the pin window.
+for index, replica in enumerate(filter(None, os.getenv("POSTGRES_REPLICA_HOSTS", "").split(",")), start=1):
+    host, _, port = replica.strip().partition(":")
+    DATABASES[f"replica_{index}"] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "PORT": port or DATABASES["default"]["PORT"],
+        "TEST": {"MIRROR": "default"},
+    }
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+DATABASE_ROUTERS = ["apps.core.routers.ReplicaRouter"]
+DATABASE_PRIMARY_PIN_SECONDS = int(os.getenv("DATABASE_PRIMARY_PIN_SECONDS", "5"))
+
 
 AUTH_USER_MODEL = "users.User"
 
@@ -144,13 +205,64 @@ USE_I18N = True
 USE_TZ = True
 
 # Email configuration
-EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+EMAIL_BACKEND = os.getenv("EMAIL_BACKEND", "django.core.mail.backends.smtp.EmailBackend")
 EMAIL_HOST = os.getenv("EMAIL_HOST", "mailpit")
 EMAIL_PORT = 1025
 EMAIL_USE_TLS = False
 EMAIL_USE_SSL = False
 DEFAULT_FROM_EMAIL = "noreply@tenniscourts.com"
 
+# Emails are queued in the outbox table and delivered by send_outbox_emails
+EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "100"))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "5"))
+EMAIL_OUTBOX_POLL_INTERVAL = float(os.getenv("EMAIL_OUTBOX_POLL_INTERVAL", "2"))
+
+# Keyset pagination of list endpoints
+API_PAGE_SIZE = int(os.getenv("API_PAGE_SIZE", "50"))
+API_MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", "200"))
+
+# Reservations
+# In-memory per-court interval index used as a fast path in front of the
+# database (the overlap exclusion constraint stays authoritative)
+RESERVATION_AVAILABILITY_INDEX = os.getenv("RESERVATION_AVAILABILITY_INDEX", "false").lower() == "true"
+RESERVATION_AVAILABILITY_INDEX_TTL = int(os.getenv("RESERVATION_AVAILABILITY_INDEX_TTL", "30"))
+# Minutes a pending reservation holds its slot before expire_reservations
+# cancels it
+RESERVATION_HOLD_TTL = int(os.getenv("RESERVATION_HOLD_TTL", "60"))
+RESERVATION_EXPIRY_BATCH_SIZE = int(os.getenv("RESERVATION_EXPIRY_BATCH_SIZE", "500"))
+# Server-Sent Events stream of calendar changes: seconds between keep-alive
+# comments and frames buffered per client before it is told to resync
+RESERVATION_EVENTS_HEARTBEAT = int(os.getenv("RESERVATION_EVENTS_HEARTBEAT", "15"))
+RESERVATION_EVENTS_QUEUE_SIZE = int(os.getenv("RESERVATION_EVENTS_QUEUE_SIZE", "100"))
+
+# Cache backends: process memory unless CACHE_BACKEND/CACHE_LOCATION point at
+# a shared one (e.g. django.core.cache.backends.memcached.PyMemcacheCache)
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "tennis-courts"),
+    }
+}
+
+# Courts
+# Serialized court list pages and courts, replaced as a whole by a new
+# catalog version on every court write and at the latest after the TTL
+COURT_CATALOG_CACHE = os.getenv("COURT_CATALOG_CACHE", "default")
+COURT_CATALOG_CACHE_TTL = int(os.getenv("COURT_CATALOG_CACHE_TTL", "600"))
+# Process-local cache of the active hourly price per court, invalidated on
+# court writes in this process and expired after the TTL in the others
+COURT_PRICE_CACHE_TTL = int(os.getenv("COURT_PRICE_CACHE_TTL", "300"))
+COURT_PRICE_CACHE_SIZE = int(os.getenv("COURT_PRICE_CACHE_SIZE", "1024"))
+# Courts (with their prices) and users attached to reservation responses
+# built from UPDATE ... RETURNING rows, same invalidation as the price cache
+COURT_CACHE_TTL = int(os.getenv("COURT_CACHE_TTL", "300"))
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", "60"))
+# Cache alias the token versions of changed users are published to and
+# checked against on every lookup, so a shared backend makes deactivations
+# apply in every worker at once
+USER_VERSION_CACHE = os.getenv("USER_VERSION_CACHE", "default")
+MODEL_CACHE_SIZE = int(os.getenv("MODEL_CACHE_SIZE", "4096"))
+
 # CORS Configuration
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",
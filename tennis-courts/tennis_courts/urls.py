@@ -10,4 +10,5 @@ urlpatterns = [
     path("api/", include("apps.users.urls")),
     path("api/", include("apps.courts.urls")),
     path("api/", include("apps.reservations.urls")),
+    path("api/", include("apps.core.urls")),
 ]